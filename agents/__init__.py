@@ -15,10 +15,15 @@
 #        - agents/report_writer_agent.py   (ReportWriterAgent)
 #
 #      각 에이전트는 __call__(state: PipelineState) -> PipelineState 형태를 권장합니다.
+#
+#      ※ 지연 로딩: `import agents.scoring_agent` 처럼 하위 모듈만 쓰는 경우 다른 에이전트
+#        (openai/chromadb/playwright …)를 임포트·생성하지 않습니다. 아래 이름은 처음 접근할 때
+#        (모듈 __getattr__) 해석되고 이후 캐시됩니다.
 
 from __future__ import annotations
 
-from typing import Callable, Dict, Any
+from collections.abc import Mapping
+from typing import Callable, Dict, Any, Iterator
 import logging
 
 # [KO] 공통 상태 타입 (docstring 및 타입힌트 목적)
@@ -66,31 +71,57 @@ def _try_import(module_path: str, attr: str, fallback_name: str):
         return _NoOpAgent(fallback_name)
 
 
-# [KO] 권장 네이밍: 실제 구현이 있으면 해당 객체, 없으면 No-Op 반환
-SeraphAgent = _try_import("agents.seraph_agent", "SeraphAgent", "SeraphAgent")
-FilterAgent = _try_import("agents.seraph_agent", "FilterAgent", "FilterAgent")
-AugmentAgent = _try_import("agents.augment_agent", "AugmentAgent", "AugmentAgent")
-RAGRetrieverAgent = _try_import(
-    "agents.rag_retriever_agent", "RAGRetrieverAgent", "RAGRetrieverAgent"
-)
-ScoringAgent = _try_import("agents.scoring_agent", "ScoringAgent", "ScoringAgent")
-ReportWriterAgent = _try_import(
-    "agents.report_writer_agent", "ReportWriterAgent", "ReportWriterAgent"
-)
+# [KO] 권장 네이밍: 실제 구현이 있으면 해당 객체, 없으면 No-Op 반환 (첫 접근 시 해석)
+_AGENT_SPECS: Dict[str, tuple[str, str]] = {
+    "SeraphAgent": ("agents.seraph_agent", "SeraphAgent"),
+    "FilterAgent": ("agents.seraph_agent", "FilterAgent"),
+    "AugmentAgent": ("agents.augment_agent", "AugmentAgent"),
+    "RAGRetrieverAgent": ("agents.rag_retriever_agent", "RAGRetrieverAgent"),
+    "ScoringAgent": ("agents.scoring_agent", "ScoringAgent"),
+    "ReportWriterAgent": ("agents.report_writer_agent", "ReportWriterAgent"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _AGENT_SPECS:
+        agent = _try_import(*_AGENT_SPECS[name], name)
+        globals()[name] = agent  # 이후 접근은 일반 모듈 속성
+        return agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ─────────────────────────────────────────────────────────────
 # [KO] 개발 편의용 레지스트리 (선택)
 # ─────────────────────────────────────────────────────────────
 
-REGISTRY: Dict[str, Callable[[PipelineState], PipelineState]] = {
-    "seraph": SeraphAgent,
-    "filter": FilterAgent,
-    "augment": AugmentAgent,
-    "rag": RAGRetrieverAgent,
-    "scoring": ScoringAgent,
-    "report": ReportWriterAgent,
-}
+
+class _LazyRegistry(Mapping):
+    """Stage key → agent mapping that resolves each agent on first lookup."""
+
+    def __init__(self, names: Dict[str, str]):
+        self._names = names
+
+    def __getitem__(self, key: str) -> Callable[[PipelineState], PipelineState]:
+        name = self._names[key]
+        return globals()[name] if name in globals() else __getattr__(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+REGISTRY: Mapping[str, Callable[[PipelineState], PipelineState]] = _LazyRegistry(
+    {
+        "seraph": "SeraphAgent",
+        "filter": "FilterAgent",
+        "augment": "AugmentAgent",
+        "rag": "RAGRetrieverAgent",
+        "scoring": "ScoringAgent",
+        "report": "ReportWriterAgent",
+    }
+)
 
 __all__ = [
     "SeraphAgent",
@@ -1,20 +1,24 @@
 # agents/augment_agent.py
 import os
 import json
-import requests
 import logging
 from bs4 import BeautifulSoup
 import pdfplumber
 from openai import OpenAI
 import chromadb
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin
 import io
 import time
 import re
 import json as pyjson
 from dotenv import load_dotenv
 
-from graph.state import Evidence, PipelineState
+from graph import diagnostics, metrics
+from graph.evidence_store import chunk_count, open_store, store_from_env
+from graph.export import export_chunks
+from graph.state import PipelineState, trusted_evidence
+from agents.http_client import get_http_client
+from agents.normalize import DomainClassifier, is_same_site, netloc, root_origin
 
 
 ALLOWED_EXTERNAL_DOMAINS = {
@@ -76,16 +80,30 @@ STRENGTH_BY_DOMAIN = {
     "partner": "medium",  # 파트너/생태
 }
 
+# 출처 도메인 분류 (규제기관 우선, agents/normalize.py)
+_SOURCE_CLASSES = DomainClassifier(
+    {
+        "regulator": ("sec.gov", "fca.org.uk", "mas.gov.sg"),
+        "trusted_media": ALLOWED_EXTERNAL_DOMAINS,
+    }
+)
+
 
 class AugmentAgent:
     """
     회사 웹/사이트맵/화이트리스트 외부 링크까지 확장 수집 → 임베딩 → Chroma 저장.
-    Evidence는 state.chunks에도 누적.
+    Evidence는 근거 저장소(SQLite, graph/evidence_store.py)에 적재하고 state.chunk_ids에 ID만 누적.
+    (EVIDENCE_STORE=off 이면 기존처럼 state.chunks에 Evidence 객체로 누적)
     - 게시일 추출(HTML meta, <time>)
     - 회사 메타(founded_year/stage/headcount/region) 추정 후 state.companies 갱신
     """
 
-    def __init__(self, openai_api_key: str | None = None, db_path: str | None = None):
+    def __init__(
+        self,
+        openai_api_key: str | None = None,
+        db_path: str | None = None,
+        evidence_store: str | None = None,
+    ):
         load_dotenv()
         openai_api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
         if not openai_api_key:
@@ -107,23 +125,24 @@ class AugmentAgent:
             "Referer": "https://www.google.com/",
         }
         self._state_ref: PipelineState | None = None
+        self.evidence_store = evidence_store or store_from_env()
 
     def __call__(self, state: PipelineState) -> PipelineState:
         self._state_ref = state
         companies = [c.model_dump() for c in state.companies]
         self.run(companies=companies, crawl_limit_per_company=10)
-        logging.info(f"[Augment] state.chunks appended = {len(state.chunks)}")
+        logging.info(f"[Augment] state.chunks appended = {chunk_count(state)}")
         return state
 
     # -------------------- Crawl --------------------
     def run(self, companies, crawl_limit_per_company=10):
-        print("데이터 증강 프로세스를 시작합니다.")
+        logging.info("[Augment] 데이터 증강 프로세스를 시작합니다.")
         for company in companies:
             company_name = company["name"]
             initial_url = company.get("website")
             company_id = company.get("id")
 
-            print(f"\n===== '{company_name}' 회사 처리 시작 =====")
+            logging.info("[Augment] ===== '%s' 회사 처리 시작 =====", company_name)
             seed_links = []
             if initial_url:
                 seed_links.append(initial_url)
@@ -140,7 +159,19 @@ class AugmentAgent:
                     continue
                 visited_urls.add(url)
                 crawled_count += 1
-                print(f"[{crawled_count}/{crawl_limit_per_company}] 크롤링 중: {url}")
+                if diagnostics.enabled(logging.DEBUG):  # 페이지 단위 진단 (기본 비활성)
+                    diagnostics.emit(
+                        "augment.page",
+                        logging.DEBUG,
+                        "[Augment] [%d/%d] 크롤링 중: %s",
+                        crawled_count,
+                        crawl_limit_per_company,
+                        url,
+                        company_id=company_id,
+                        n=crawled_count,
+                        limit=crawl_limit_per_company,
+                        url=url,
+                    )
                 try:
                     raw_text, new_links = self._fetch_and_extract(url, company_id=company_id)
                     if raw_text:
@@ -161,17 +192,17 @@ class AugmentAgent:
 
                     time.sleep(0.6)
                 except Exception as e:
-                    print(f"  [오류] 처리 중 문제 발생 ({url}): {e}")
+                    logging.warning(f"[Augment] 처리 중 문제 발생 ({url}): {e}")
                     continue
-        print("\n===== 모든 회사에 대한 데이터 증강 프로세스 완료 =====")
+        logging.info("[Augment] ===== 모든 회사에 대한 데이터 증강 프로세스 완료 =====")
 
     def _discover_from_sitemap(self, site_url: str) -> list[str]:
         out = []
-        root = f"{urlparse(site_url).scheme}://{urlparse(site_url).netloc}"
+        root = root_origin(site_url)
         for path in ("/sitemap.xml", "/sitemap_index.xml", "/sitemap-index.xml"):
             sm = root + path
             try:
-                r = requests.get(sm, headers=self.headers, timeout=10)
+                r = get_http_client().get(sm, headers=self.headers, timeout=10, retries=0)
                 if r.status_code != 200 or "xml" not in r.headers.get("content-type", ""):
                     continue
                 soup = BeautifulSoup(r.content, "xml")
@@ -186,17 +217,14 @@ class AugmentAgent:
     def _allow_link(self, base: str | None, link: str) -> bool:
         if not base:
             return False
-        b = urlparse(base).netloc
-        u = urlparse(link).netloc
         # 내부 도메인 허용
-        if u == b or u.endswith("." + b):
+        if is_same_site(netloc(link), netloc(base)):
             return True
         # 외부 화이트리스트 도메인 허용
         return self._is_external_allowed(base, link)
 
     def _is_external_allowed(self, base: str | None, link: str) -> bool:
-        u = urlparse(link).netloc
-        return any(u == d or u.endswith("." + d) for d in ALLOWED_EXTERNAL_DOMAINS)
+        return _SOURCE_CLASSES.classify(netloc(link)) is not None
 
     # -------------------- 게시일/회사 메타 추출 --------------------
     def _extract_published(self, soup: BeautifulSoup) -> str | None:
@@ -311,19 +339,24 @@ class AugmentAgent:
         if self._state_ref:
             for i, c in enumerate(self._state_ref.companies):
                 if c.id == company_id:
-                    upd = c.model_dump()
-                    for k in ("founded_year", "stage", "headcount", "region"):
-                        if upd.get(k) in (None, "", 0) and meta.get(k) not in (None, "", 0):
-                            upd[k] = meta.get(k)
-                    self._state_ref.companies[i] = type(c)(**upd)
+                    # 실제로 채워지는 필드가 있을 때만 검증(재생성); 대부분의 페이지는 변화 없음
+                    upd = {
+                        k: meta[k]
+                        for k in ("founded_year", "stage", "headcount", "region")
+                        if getattr(c, k) in (None, "", 0) and meta.get(k) not in (None, "", 0)
+                    }
+                    if upd:
+                        self._state_ref.companies[i] = type(c).model_validate(
+                            {**c.__dict__, **upd}
+                        )
                     break
 
     # -------------------- Fetch/Extract --------------------
     def _fetch_and_extract(self, url, company_id: str | None = None):
-        r = requests.get(url, headers=self.headers, timeout=20)
+        r = get_http_client().get(url, headers=self.headers, timeout=20)
         r.raise_for_status()
         ctype = r.headers.get("content-type", "").lower()
-        base_url = f"{urlparse(url).scheme}://{urlparse(url).netloc}"
+        base_url = root_origin(url)
 
         text, links = "", []
         if "html" in ctype:
@@ -367,16 +400,11 @@ class AugmentAgent:
         return best_axis
 
     def _guess_strength(self, source: str, base_site: str | None) -> str:
-        dom = urlparse(source).netloc
-        if base_site:
-            base = urlparse(base_site).netloc
-            if dom == base or dom.endswith("." + base):
-                return STRENGTH_BY_DOMAIN["first_party"]
-        if any(dom == d or dom.endswith("." + d) for d in ("sec.gov", "fca.org.uk", "mas.gov.sg")):
-            return STRENGTH_BY_DOMAIN["regulator"]
-        if any(dom == d or dom.endswith("." + d) for d in ALLOWED_EXTERNAL_DOMAINS):
-            return STRENGTH_BY_DOMAIN["trusted_media"]
-        return "weak"
+        dom = netloc(source)
+        if base_site and is_same_site(dom, netloc(base_site)):
+            return STRENGTH_BY_DOMAIN["first_party"]
+        cls = _SOURCE_CLASSES.classify(dom)
+        return STRENGTH_BY_DOMAIN[cls] if cls else "weak"
 
     def _process_and_enrich(
         self, raw_text, source_url, company_name, company_id=None, base_site=None
@@ -420,23 +448,39 @@ class AugmentAgent:
             return
         docs = [c["text"] for c in chunks]
         resp = self.openai_client.embeddings.create(input=docs, model="text-embedding-3-small")
+        metrics.incr("embed.calls")
+        metrics.incr("embed.tokens", metrics.usage_tokens(getattr(resp, "usage", None)))
         embeds = [d.embedding for d in resp.data]
         metas = [c["metadata"] for c in chunks]
         # 회사별/URL별 고유화: company_id:source#idx
         ids = [f"{m.get('company_id','unknown')}:{m['source']}#{i}" for i, m in enumerate(metas)]
 
         self.collection.upsert(embeddings=embeds, documents=docs, metadatas=metas, ids=ids)
-        print(f"  [성공] {len(chunks)}개의 청크를 ChromaDB에 저장/업데이트했습니다.")
+        if diagnostics.enabled(logging.DEBUG):
+            diagnostics.emit(
+                "augment.store",
+                logging.DEBUG,
+                "[Augment] %d개의 청크를 ChromaDB에 저장/업데이트했습니다.",
+                len(chunks),
+                source=metas[0].get("source"),
+                chunks=len(chunks),
+            )
 
         if self._state_ref is not None:
-            for c in chunks:
-                m = c["metadata"]
-                self._state_ref.chunks.append(
-                    Evidence(
-                        source=m.get("source"),
-                        text=c["text"],
-                        category=m.get("category", "market"),
-                        strength=m.get("strength", "weak"),
-                        published=m.get("published"),
-                    )
+            evs = [
+                trusted_evidence(
+                    m.get("source"),
+                    c["text"],
+                    m.get("category", "market"),
+                    m.get("strength", "weak"),
+                    m.get("published"),
                 )
+                for c, m in zip(chunks, metas)
+            ]
+            export_chunks(metas[0].get("company_id", "unknown"), evs)  # 활성 export 가 있을 때만
+            if self.evidence_store:
+                store = open_store(self.evidence_store)
+                self._state_ref.chunk_ids.extend(store.add(evs))
+                self._state_ref.evidence_store = store.path
+            else:
+                self._state_ref.chunks.extend(evs)
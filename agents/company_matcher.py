@@ -0,0 +1,156 @@
+# agents/company_matcher.py
+# One-pass chunk → company matching for ScoringAgent's chunk fallback
+#
+# [KO] retrieved_evidence가 비어 있을 때 ScoringAgent는 `_matches_company`를
+#      (청크 × 회사) 전체 조합에 대해 호출했습니다(URL 파싱·슬러그·소문자 변환 반복).
+#      이 모듈은 모든 회사의 패턴을 먼저 모은 뒤 청크를 **한 번만** 훑어 역색인을 만듭니다.
+#        - 텍스트 패턴 : 회사명·태그 소문자 → "본문 + 출처" 소문자 문자열에서 검색
+#        - 경로 패턴   : 회사명 슬러그 → 출처 URL 경로 슬러그에서 검색 (출처 문자열당 1회)
+#        - 도메인 패턴 : 공식 웹사이트 도메인 → 청크 도메인에서 부분 문자열 검색 (도메인당 1회)
+#      다중 패턴 검색은 트라이(trie) 정규식 + lookahead 로 위치마다 가장 긴 패턴을 찾고,
+#      그 접두사인 패턴까지 확장하므로 `in` 연산 결과와 동일합니다.
+#      결과(축별 근거 목록과 순서)는 `_gather_company_axis_evidence`와 같습니다.
+#      근거 저장소의 청크(StoredChunks)는 배치로 한 번 훑고, 매칭된 청크만 take() 로 복원합니다.
+
+from __future__ import annotations
+
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, List, Sequence, Set
+
+from graph.state import CompanyMeta, Evidence, EvidenceCategory
+
+from agents.normalize import domain_of, url_path
+from agents.scoring_agent import _slug
+
+
+class PatternSet:
+    """Finds which of a fixed set of literal words occur in a text (substring semantics)."""
+
+    def __init__(self, words: Iterable[str]):
+        self.words: Set[str] = {w for w in words if w}
+        # 각 단어의 접두사 중 단어 집합에 속하는 것들 (가장 긴 매치 → 짧은 매치 확장)
+        self._prefixes = {
+            w: [w[:k] for k in range(1, len(w) + 1) if w[:k] in self.words] for w in self.words
+        }
+        self._regex = None
+        if self.words:
+            trie: dict = {}
+            for w in self.words:
+                node = trie
+                for ch in w:
+                    node = node.setdefault(ch, {})
+                node[""] = True
+            self._regex = re.compile(f"(?=({_trie_pattern(trie)}))")
+
+    def find(self, text: str) -> Set[str]:
+        if self._regex is None or not text:
+            return set()
+        found: Set[str] = set()
+        for longest in {m.group(1) for m in self._regex.finditer(text)}:
+            found.update(self._prefixes[longest])
+        return found
+
+
+def _trie_pattern(node: dict) -> str:
+    alts = [re.escape(ch) + _trie_pattern(child) for ch, child in node.items() if ch]
+    if not alts:
+        return ""
+    body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+    # 단어 끝 노드: 더 긴 단어를 먼저 시도 (greedy optional)
+    if node.get(""):
+        return f"(?:{body})?" if len(alts) == 1 else body + "?"
+    return body
+
+
+class CompanyChunkMatcher:
+    """
+    Matches every company against `chunks` in one scan.
+    `match(chunks)` returns {company_id: {axis: [Evidence, ...]}} equal to calling
+    `_gather_company_axis_evidence(chunks, name, website, tags)` per company.
+    """
+
+    def __init__(self, companies: Sequence[CompanyMeta]):
+        self.companies = list(companies)
+        self._names = {c.id: (c.name or "").lower() for c in self.companies}
+        self._slugs = {c.id: _slug(c.name) for c in self.companies}
+        self._sites = {
+            c.id: domain_of(c.website) if getattr(c, "website", None) else ""
+            for c in self.companies
+        }
+        self._tags = {
+            c.id: [kw.lower() for kw in (getattr(c, "tags", None) or []) if kw]
+            for c in self.companies
+        }
+        self.text_patterns = PatternSet(
+            [n for n in self._names.values()] + [t for ts in self._tags.values() for t in ts]
+        )
+        self.slug_patterns = PatternSet(self._slugs.values())
+        self.site_patterns = PatternSet(self._sites.values())
+
+    def match(
+        self, chunks: Sequence[Evidence]
+    ) -> Dict[str, Dict[EvidenceCategory, List[Evidence]]]:
+        text_hits: Dict[str, List[int]] = defaultdict(list)
+        by_source: Dict[str, List[int]] = defaultdict(list)
+        categories: List[str] = []
+        for i, e in enumerate(chunks):
+            by_source[e.source].append(i)
+            categories.append(e.category)
+            text = f"{e.text or ''} {e.source or ''}".lower()
+            for p in self.text_patterns.find(text):
+                text_hits[p].append(i)
+
+        # 출처 문자열당 1회: 도메인 / URL 경로 슬러그
+        site_hits: Dict[str, List[str]] = defaultdict(list)
+        slug_hits: Dict[str, List[str]] = defaultdict(list)
+        domain_sites: Dict[str, Set[str]] = {}
+        for source in by_source:
+            domain = domain_of(source)
+            if domain not in domain_sites:
+                domain_sites[domain] = self.site_patterns.find(domain)
+            for site in domain_sites[domain]:
+                site_hits[site].append(source)
+            path = url_path(source)
+            for s in self.slug_patterns.find(_slug(path.replace("-", "").replace("_", ""))):
+                slug_hits[s].append(source)
+
+        selected: Dict[str, List[int]] = {}
+        for c in self.companies:
+            idx: Set[int] = set()
+            site = self._sites[c.id]
+            if site:
+                for source in site_hits.get(site, ()):
+                    idx.update(by_source[source])
+            if c.name:
+                idx.update(text_hits.get(self._names[c.id], ()))
+                if self._slugs[c.id]:
+                    for source in slug_hits.get(self._slugs[c.id], ()):
+                        idx.update(by_source[source])
+            for tag in self._tags[c.id]:
+                idx.update(i for i in text_hits.get(tag, ()) if categories[i] == "market")
+            selected[c.id] = sorted(idx)
+
+        # 매칭된 청크만 복원 (저장소 기반 청크는 take() 로 한 번에 읽음)
+        needed = sorted(set().union(*selected.values())) if selected else []
+        take = getattr(chunks, "take", None)
+        found = take(needed) if take else [chunks[i] for i in needed]
+        evidence = dict(zip(needed, found))
+
+        out: Dict[str, Dict[EvidenceCategory, List[Evidence]]] = {}
+        for cid, idx in selected.items():
+            by_axis: Dict[EvidenceCategory, List[Evidence]] = defaultdict(list)
+            for i in idx:
+                by_axis[categories[i]].append(evidence[i])
+            out[cid] = by_axis
+        return out
+
+
+def match_companies(
+    chunks: Sequence[Evidence], companies: Sequence[CompanyMeta]
+) -> Dict[str, Dict[EvidenceCategory, List[Evidence]]]:
+    """Convenience wrapper: CompanyChunkMatcher(companies).match(chunks)."""
+    return CompanyChunkMatcher(companies).match(chunks)
+
+
+__all__ = ["CompanyChunkMatcher", "PatternSet", "match_companies"]
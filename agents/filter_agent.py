@@ -1,8 +1,8 @@
 # agents/filter_agent.py
 import logging
-from urllib.parse import urlparse
 from typing import List
 from graph.state import PipelineState, CompanyMeta
+from agents.normalize import DomainClassifier, domain_of
 
 ALLOWED_TLDS = {".com", ".ai", ".io", ".co", ".net", ".app", ".dev", ".org"}
 EXCLUDE_DOMAINS = {
@@ -25,20 +25,14 @@ EXCLUDE_DOMAINS = {
     "pinterest.com",
     "tistory.com",
 }
-
-
-def _domain(url: str) -> str:
-    try:
-        return urlparse(url).netloc.lower()
-    except Exception:
-        return ""
+_EXCLUDED = DomainClassifier({"excluded": EXCLUDE_DOMAINS})
 
 
 def _is_company_like(url: str) -> bool:
-    d = _domain(url)
+    d = domain_of(url)
     if not d:
         return False
-    if d in EXCLUDE_DOMAINS or any(d.endswith("." + x) for x in EXCLUDE_DOMAINS):
+    if _EXCLUDED.classify(d):
         return False
     # TLD 체크(느슨)
     if not any(d.endswith(tld) for tld in ALLOWED_TLDS):
@@ -59,7 +53,7 @@ class FilterAgent:
         dedup: dict[str, CompanyMeta] = {}
         for c in state.companies:
             if c.website and _is_company_like(c.website):
-                key = _domain(c.website)
+                key = domain_of(c.website)
                 if key and key not in dedup:
                     dedup[key] = c
         state.companies = list(dedup.values())
@@ -0,0 +1,180 @@
+# agents/http_client.py
+# Agentic RAG v2 - Shared connection-pooled HTTP client
+#
+# [KO] 모든 에이전트(Seraph/Augment/RAG)가 공유하는 HTTP 세션입니다.
+#      - requests.Session + HTTPAdapter 커넥션 풀(keep-alive)로 TCP/TLS 핸드셰이크 재사용
+#      - Accept-Encoding: urllib3가 지원하는 압축(gzip/deflate, brotli/zstd 설치 시 자동 포함)
+#      - 통합 재시도: 연결 오류/429/5xx → 지수 백오프 + full jitter (Retry-After 우선)
+#      - 호스트별 동시 요청 제한(BoundedSemaphore)
+#      - 커넥션 재사용/요청/바이트 카운터 (stats())
+#      ※ requests는 HTTP/2를 지원하지 않으므로 HTTP/1.1 keep-alive 풀만 사용합니다.
+#        OpenAI SDK는 자체 httpx 풀을 사용하므로 이 모듈의 대상이 아닙니다.
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+
+from graph import metrics
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+RETRY_EXCEPTIONS = (requests.ConnectionError, requests.Timeout)
+
+
+class HttpClient:
+    """Thread-safe pooled HTTP client with unified retries and per-host limits."""
+
+    def __init__(
+        self,
+        pool_connections: int = 64,  # ← 풀을 유지할 호스트 수
+        pool_maxsize: int = 16,  # ← 호스트당 keep-alive 커넥션 수
+        per_host_limit: int = 4,  # ← 호스트당 동시 요청 수
+        max_retries: int = 2,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+    ):
+        self.session = requests.Session()
+        self._adapter = HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0
+        )
+        self.session.mount("http://", self._adapter)
+        self.session.mount("https://", self._adapter)
+        self.session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+
+        self.per_host_limit = max(1, int(per_host_limit))
+        self.max_retries = max(0, int(max_retries))
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self._host_sems: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        self._counters: Counter = Counter()
+
+    # -------------------- public --------------------
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def request(
+        self, method: str, url: str, retries: Optional[int] = None, **kwargs: Any
+    ) -> requests.Response:
+        """
+        Send a request through the shared pool.
+        Retries connection errors and 429/5xx; other statuses are returned as-is
+        (callers keep their own `raise_for_status()` / status checks).
+        """
+        retries = self.max_retries if retries is None else max(0, int(retries))
+        sem = self._host_semaphore(urlparse(url).netloc.lower())
+        attempt = 0
+        while True:
+            delay: Optional[float] = None
+            with sem:
+                try:
+                    r = self.session.request(method, url, **kwargs)
+                except RETRY_EXCEPTIONS:
+                    self._incr("errors")
+                    if attempt >= retries:
+                        raise
+                    delay = self._backoff(attempt)
+                else:
+                    if r.status_code in RETRY_STATUS and attempt < retries:
+                        delay = self._retry_after(r) or self._backoff(attempt)
+                        r.close()
+                    else:
+                        nbytes = len(r.content or b"")
+                        self._incr("requests")
+                        self._incr("bytes", nbytes)
+                        metrics.incr("http.requests")
+                        metrics.incr("http.bytes", nbytes)
+                        return r
+            # 대기는 세마포어 밖에서 (다른 요청을 막지 않도록)
+            self._incr("retries")
+            metrics.incr("http.retries")
+            time.sleep(delay)
+            attempt += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Request/byte counters plus connection reuse from urllib3 pools."""
+        opened = served = 0
+        pools = self._adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            opened += pool.num_connections
+            served += pool.num_requests
+        with self._lock:
+            out = dict(self._counters)
+        out.update(
+            {
+                "connections_opened": opened,
+                "connections_reused": max(0, served - opened),
+            }
+        )
+        return out
+
+    def close(self) -> None:
+        self.session.close()
+
+    # -------------------- internals --------------------
+    def _host_semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            sem = self._host_sems.get(host)
+            if sem is None:
+                sem = threading.BoundedSemaphore(self.per_host_limit)
+                self._host_sems[host] = sem
+            return sem
+
+    def _incr(self, key: str, n: int = 1) -> None:
+        with self._lock:
+            self._counters[key] += n
+
+    def _backoff(self, attempt: int) -> float:
+        # full jitter: U(0, min(cap, base * 2^attempt))
+        return random.uniform(0.0, min(self.backoff_max, self.backoff_base * (2**attempt)))
+
+    def _retry_after(self, r: requests.Response) -> Optional[float]:
+        try:
+            v = float(r.headers.get("Retry-After", ""))
+        except ValueError:
+            return None
+        return min(self.backoff_max, max(0.0, v))
+
+
+# ─────────────────────────────────────────────────────────────
+# [KO] 프로세스 단위 공유 인스턴스
+# ─────────────────────────────────────────────────────────────
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Return the process-wide shared HttpClient (created lazily)."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = HttpClient()
+    return _client
+
+
+def http_stats() -> Dict[str, int]:
+    """Counters of the shared client ({} if no request was made yet)."""
+    return _client.stats() if _client is not None else {}
+
+
+__all__ = ["HttpClient", "get_http_client", "http_stats"]
@@ -0,0 +1,180 @@
+# agents/llm_cache.py
+# Persistent on-disk cache for LLM chat responses
+#
+# [KO] 동일한 (모델, temperature, 프롬프트) 요청에 대해 LLM 응답을 디스크에서 재사용합니다.
+#      - 키: sha256(model, temperature, 메시지 role/content) → outputs/cache/llm/<ab>/<key>.json
+#      - TTL: 만료된 항목은 miss로 처리 후 삭제
+#      - 용량 상한: 초과 시 가장 오래 사용하지 않은(mtime) 항목부터 삭제 (hit 시 mtime 갱신)
+#      - 비활성화: LLM_CACHE=0 환경변수 또는 graph.run --no-llm-cache
+#      - hit/miss/write/eviction 카운터 (stats())
+#      ※ 템플릿만 수정한 재실행은 LLM 호출 없이 리포트를 다시 만들 수 있습니다.
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from graph import metrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = "outputs/cache/llm"
+DEFAULT_TTL_S = 14 * 24 * 3600
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def cache_enabled_from_env() -> bool:
+    """LLM_CACHE=0/false/off disables the cache (default: enabled)."""
+    return os.getenv("LLM_CACHE", "1").strip().lower() not in {"0", "false", "off", "no"}
+
+
+def cache_key(model: str, temperature: float, messages: Iterable[Any]) -> str:
+    """Stable key over model, temperature and the (role, content) of every message."""
+    payload = {
+        "model": model,
+        "temperature": round(float(temperature or 0.0), 4),
+        "messages": [
+            [getattr(m, "type", "") or "", str(getattr(m, "content", m))] for m in messages
+        ],
+    }
+    raw = json.dumps(payload, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(raw).hexdigest()
+
+
+class LLMResponseCache:
+    """Thread-safe file-per-entry response cache with TTL and size-bounded eviction."""
+
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        ttl_s: float = DEFAULT_TTL_S,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        enabled: Optional[bool] = None,
+    ):
+        self.dir = Path(cache_dir)
+        self.ttl_s = float(ttl_s)
+        self.max_bytes = max(0, int(max_bytes))
+        self.enabled = cache_enabled_from_env() if enabled is None else bool(enabled)
+        self._lock = threading.Lock()
+        self._counters: Counter = Counter()
+        self._size: Optional[int] = None  # 첫 write 시 디렉터리 스캔으로 초기화
+
+    # -------------------- public --------------------
+    def get(self, key: str) -> Optional[str]:
+        """Cached response content, or None on miss/expiry/bypass."""
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self._incr("misses")
+            return None
+        if self.ttl_s > 0 and time.time() - float(entry.get("created", 0)) > self.ttl_s:
+            removed = self._file_size(path)
+            self._remove(path)
+            with self._lock:
+                if self._size is not None:
+                    self._size = max(0, self._size - removed)
+            self._incr("expired")
+            self._incr("misses")
+            return None
+        try:
+            os.utime(path)  # LRU 기준 갱신
+        except OSError:
+            pass
+        self._incr("hits")
+        return entry.get("content")
+
+    def put(self, key: str, content: str, **meta: Any) -> None:
+        if not self.enabled:
+            return
+        path = self._path(key)
+        data = json.dumps(
+            {"created": time.time(), "content": content, **meta}, ensure_ascii=False
+        ).encode("utf-8")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(data)
+        old_size = self._file_size(path)  # 같은 키 덮어쓰기 → 이전 크기 차감
+        os.replace(tmp, path)
+        self._incr("writes")
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += len(data) - old_size
+            over = self.max_bytes and self._size > self.max_bytes
+        if over:
+            self._evict()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counters)
+
+    # -------------------- internals --------------------
+    def _path(self, key: str) -> Path:
+        return self.dir / key[:2] / f"{key}.json"
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        out = []
+        for p in self.dir.glob("*/*.json"):
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            out.append((st.st_mtime, st.st_size, p))
+        return out
+
+    def _scan_size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self) -> None:
+        """Drop least-recently-used entries until the cache is under 90% of max_bytes."""
+        with self._lock:
+            entries = sorted(self._entries())
+            size = sum(s for _, s, _ in entries)
+            target = int(self.max_bytes * 0.9)
+            removed = 0
+            for _, s, p in entries:
+                if size <= target:
+                    break
+                self._remove(p)
+                size -= s
+                removed += 1
+            self._size = size
+            self._counters["evictions"] += removed
+        if removed:
+            logger.info(f"[LLMCache] evicted {removed} entries (size={size // 1024} KB)")
+
+    @staticmethod
+    def _file_size(path: Path) -> int:
+        try:
+            return path.stat().st_size
+        except OSError:
+            return 0
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+    def _incr(self, key: str) -> None:
+        with self._lock:
+            self._counters[key] += 1
+        if key in ("hits", "misses"):
+            metrics.incr(f"llm.cache_{key}")
+
+
+__all__ = ["LLMResponseCache", "cache_enabled_from_env", "cache_key"]
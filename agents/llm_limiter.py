@@ -0,0 +1,68 @@
+# agents/llm_limiter.py
+# Async request/token rate limiter for concurrent LLM calls
+#
+# [KO] 리포트 단계에서 여러 회사의 LLM 호출을 동시에 보낼 때 API 한도를 넘지 않도록 제한합니다.
+#      - 동시 요청 수(Semaphore) + 분당 요청 수(RPM) + 분당 토큰 수(TPM) 토큰 버킷
+#      - 토큰은 프롬프트 길이로 추정해 선차감하고, 응답 usage로 보정(settle)
+#      - asyncio 기본 객체는 이벤트 루프에 묶이므로 루프(asyncio.run)마다 새로 생성해 사용
+
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+
+def estimate_tokens(text: str, completion_budget: int = 600) -> int:
+    """Rough prompt+completion token estimate (≈3 chars/token for mixed KO/EN)."""
+    return len(text or "") // 3 + completion_budget
+
+
+class AsyncRateLimiter:
+    """Concurrency cap plus RPM/TPM token buckets."""
+
+    def __init__(self, max_concurrent: int = 8, rpm: int = 300, tpm: int = 150_000):
+        self.rpm = max(1, int(rpm))
+        self.tpm = max(1, int(tpm))
+        self._sem = asyncio.Semaphore(max(1, int(max_concurrent)))
+        self._lock = asyncio.Lock()
+        self._req = float(self.rpm)
+        self._tok = float(self.tpm)
+        self._last = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed, self._last = now - self._last, now
+        self._req = min(float(self.rpm), self._req + elapsed * self.rpm / 60.0)
+        self._tok = min(float(self.tpm), self._tok + elapsed * self.tpm / 60.0)
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until one request and `tokens` tokens are available, then take them."""
+        tokens = min(max(0, int(tokens)), self.tpm)  # 버킷 용량을 넘는 요청은 용량만큼만 대기
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._req >= 1.0 and self._tok >= tokens:
+                    self._req -= 1.0
+                    self._tok -= tokens
+                    return
+                wait = max(
+                    (1.0 - self._req) * 60.0 / self.rpm,
+                    (tokens - self._tok) * 60.0 / self.tpm,
+                )
+                await asyncio.sleep(max(wait, 0.01))
+
+    def settle(self, estimated: int, actual: int) -> None:
+        """Correct the token bucket once the real usage is known."""
+        if actual > 0:
+            self._tok = min(float(self.tpm), self._tok + estimated - actual)
+
+    @asynccontextmanager
+    async def slot(self, tokens: int) -> AsyncIterator[None]:
+        async with self._sem:
+            await self.acquire(tokens)
+            yield
+
+
+__all__ = ["AsyncRateLimiter", "estimate_tokens"]
@@ -0,0 +1,187 @@
+# agents/normalize.py
+# Shared, memoized URL/domain and date normalization
+#
+# [KO] 여러 에이전트(scoring/rag_retriever/filter/augment/seraph)가 각자 구현하던
+#      도메인 추출·출처 분류·게시일 파싱을 한 곳으로 모은 공용 모듈입니다.
+#      - urlparse 결과는 URL 문자열 단위로 LRU 캐시 (크기 제한)
+#      - registrable_domain: eTLD+1 (co.uk, co.kr 같은 2단계 공개 접미사 포함)
+#      - DomainClassifier: 접미사 → 분류 맵을 미리 만들어 두고 라벨 단위로 조회
+#        (`d == x or d.endswith("." + x)` 를 목록 전체에 대해 반복하던 방식과 결과 동일)
+#      - iso_epoch_us: ISO 날짜 문자열 → UTC epoch(마이크로초, 정수) 캐시
+#        within_recency 는 기존 timedelta 비교와 같은 경계값을 사용합니다.
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Dict, Iterable, Mapping, Optional, Tuple
+from urllib.parse import ParseResult, urlparse
+
+URL_CACHE_SIZE = 65536
+DATE_CACHE_SIZE = 16384
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_US_PER_DAY = 86_400_000_000
+
+# 2단계 공개 접미사 (eTLD) – 수집 대상 지역 위주의 소규모 목록
+# fmt: off
+MULTI_LABEL_SUFFIXES = frozenset(
+    {
+        "co.uk", "org.uk", "ac.uk", "gov.uk", "ltd.uk", "plc.uk",
+        "co.kr", "or.kr", "ne.kr", "go.kr", "ac.kr", "re.kr",
+        "co.jp", "ne.jp", "or.jp", "go.jp", "ac.jp",
+        "com.au", "net.au", "org.au", "gov.au",
+        "com.sg", "gov.sg", "edu.sg", "com.hk", "gov.hk",
+        "com.cn", "gov.cn", "co.in", "gov.in", "com.br", "co.nz", "com.tw",
+    }
+)
+# fmt: on
+
+
+# ─────────────────────────────────────────────────────────────
+# URL / 도메인
+# ─────────────────────────────────────────────────────────────
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def parse_url(url: str) -> Optional[ParseResult]:
+    """Cached urlparse; None when the string cannot be parsed."""
+    try:
+        return urlparse(url)
+    except Exception:
+        return None
+
+
+def netloc(url: str) -> str:
+    """Raw netloc (case preserved), '' on parse errors."""
+    p = parse_url(url)
+    return p.netloc if p else ""
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def domain_of(url: str) -> str:
+    """Lower-cased netloc of `url`, '' on parse errors."""
+    p = parse_url(url)
+    return p.netloc.lower() if p else ""
+
+
+def url_path(url: str) -> str:
+    """Lower-cased URL path, '' on parse errors."""
+    p = parse_url(url)
+    return (p.path or "").lower() if p else ""
+
+
+def root_origin(url: str) -> str:
+    """'scheme://netloc' of `url`; the input itself when it has no scheme/host."""
+    p = parse_url(url)
+    if not p or not p.scheme or not p.netloc:
+        return url
+    return f"{p.scheme}://{p.netloc}"
+
+
+def is_same_site(domain: str, base: str) -> bool:
+    """`domain` is `base` or one of its subdomains."""
+    return domain == base or domain.endswith("." + base)
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def registrable_domain(url_or_host: str) -> str:
+    """eTLD+1 of a URL or host ('news.bbc.co.uk' → 'bbc.co.uk'); IPs/single labels as-is."""
+    s = (url_or_host or "").strip()
+    host = domain_of(s) if "//" in s else s.lower().split("/", 1)[0]
+    host = host.rsplit("@", 1)[-1].split(":", 1)[0].rstrip(".")
+    labels = host.split(".")
+    if len(labels) <= 2 or labels[-1].isdigit():
+        return host
+    n = 3 if ".".join(labels[-2:]) in MULTI_LABEL_SUFFIXES else 2
+    return ".".join(labels[-n:])
+
+
+class DomainClassifier:
+    """
+    Maps a domain to the first class (in `classes` order) having a suffix `x`
+    with `domain == x or domain.endswith("." + x)`; `default` otherwise.
+    """
+
+    def __init__(
+        self,
+        classes: Mapping[str, Iterable[str]],
+        default: Optional[str] = None,
+        cache_size: int = URL_CACHE_SIZE,
+    ):
+        self.default = default
+        # suffix → (우선순위, 분류)  : 같은 접미사가 여러 분류에 있으면 앞선 분류 우선
+        self._suffixes: Dict[str, Tuple[int, str]] = {}
+        for rank, (name, suffixes) in enumerate(classes.items()):
+            for x in suffixes:
+                self._suffixes.setdefault(x, (rank, name))
+        self.classify = lru_cache(maxsize=cache_size)(self._classify)
+
+    def _classify(self, domain: str) -> Optional[str]:
+        best = self._suffixes.get(domain)
+        i = domain.find(".")
+        while i != -1:
+            hit = self._suffixes.get(domain[i + 1 :])
+            if hit and (best is None or hit[0] < best[0]):
+                best = hit
+            i = domain.find(".", i + 1)
+        return best[1] if best else self.default
+
+
+# ─────────────────────────────────────────────────────────────
+# 날짜
+# ─────────────────────────────────────────────────────────────
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def iso_epoch_us(iso_date: str) -> Optional[int]:
+    """ISO date/datetime string → UTC epoch microseconds (naive = UTC); None if invalid."""
+    if not iso_date or not isinstance(iso_date, str):
+        return None
+    try:
+        s = iso_date.strip()
+        # '...Z' → '+00:00' 로 치환 (fromisoformat 호환)
+        if s.endswith("Z"):
+            s = s[:-1] + "+00:00"
+        dt = datetime.fromisoformat(s)
+        dt = dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt.astimezone(timezone.utc)
+        return (dt - _EPOCH) // timedelta(microseconds=1)
+    except Exception:
+        return None
+
+
+def now_epoch_us() -> int:
+    return (datetime.now(timezone.utc) - _EPOCH) // timedelta(microseconds=1)
+
+
+def recency_window_us(months: int) -> int:
+    """Recency window of `months` months (30 days each) in microseconds."""
+    return 30 * months * _US_PER_DAY
+
+
+def within_recency(iso_date: Optional[str], months: int, now_us: Optional[int] = None) -> bool:
+    """True if `iso_date` is at most 30*months days before now (UTC)."""
+    try:
+        epoch = iso_epoch_us(iso_date) if iso_date else None
+    except TypeError:  # 해시 불가 입력
+        return False
+    if epoch is None:
+        return False
+    now = now_epoch_us() if now_us is None else now_us
+    return now - epoch <= recency_window_us(months)
+
+
+__all__ = [
+    "DomainClassifier",
+    "domain_of",
+    "is_same_site",
+    "iso_epoch_us",
+    "netloc",
+    "now_epoch_us",
+    "parse_url",
+    "recency_window_us",
+    "registrable_domain",
+    "root_origin",
+    "url_path",
+    "within_recency",
+]
@@ -0,0 +1,205 @@
+# agents/pdf_renderer.py
+# Shared headless-Chromium PDF render service (Playwright)
+#
+# [KO] 리포트마다 Chromium을 새로 띄우던 비용(~1초/건)을 없애기 위한 렌더 서비스입니다.
+#      - 브라우저는 서비스당 1회만 기동 (첫 렌더 시 지연 기동 → 렌더할 게 없으면 기동 안 함)
+#      - 페이지 풀(asyncio.Queue)에서 페이지를 빌려 N건을 동시에 PDF로 출력
+#      - 하나의 이벤트 루프 안에서 `async with PdfRenderService(...)` 로 사용
+#        (Playwright 객체는 루프에 묶이므로 루프가 살아 있는 동안 재사용 가능)
+#      - deferred 리포트 모드: enqueue_pdf()로 변환 작업을 큐 파일(JSONL)에 적재하고
+#        render_pending()/scripts/render_pending_pdfs.py 로 나중에 일괄 변환
+#        (변환 시작 시 큐 파일을 rename 으로 가져가므로 변환 중 적재된 작업은 새 큐에 남음)
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import uuid
+from typing import Any, Dict, List, Optional
+
+from playwright.async_api import async_playwright
+
+# [KO] ReportWriterAgent의 기존 PDF 출력 옵션
+PDF_OPTIONS: Dict[str, Any] = {
+    "format": "A4",
+    "print_background": True,
+    "scale": 0.9,
+    "margin": {"top": "16mm", "bottom": "18mm", "left": "14mm", "right": "14mm"},
+}
+
+PDF_QUEUE_PATH = "outputs/reports/pdf_queue.jsonl"
+_queue_lock = threading.Lock()
+
+
+class PdfRenderService:
+    """One Chromium per service, a bounded pool of reusable pages."""
+
+    def __init__(self, pages: int = 4, pdf_options: Optional[Dict[str, Any]] = None):
+        self.max_pages = max(1, int(pages))
+        self.pdf_options = dict(pdf_options or PDF_OPTIONS)
+        self._pw = None
+        self._browser = None
+        self._pool: Optional[asyncio.Queue] = None
+        self._created = 0
+        self._start_lock: Optional[asyncio.Lock] = None
+        self._launch_error: Optional[Exception] = None
+        self.rendered = 0
+
+    async def __aenter__(self) -> "PdfRenderService":
+        self._start_lock = asyncio.Lock()
+        self._pool = asyncio.Queue()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def _ensure_browser(self) -> None:
+        async with self._start_lock:
+            if self._launch_error is not None:
+                raise self._launch_error
+            if self._browser is None:
+                try:
+                    self._pw = await async_playwright().start()
+                    self._browser = await self._pw.chromium.launch(
+                        headless=True, args=["--no-sandbox"]
+                    )
+                except Exception as e:
+                    # 기동 실패는 한 번만 시도하고, 이후 렌더 요청은 즉시 같은 오류로 실패
+                    self._launch_error = e
+                    await self.close()
+                    raise
+                logging.info(f"[PDF] chromium started (page pool={self.max_pages})")
+
+    async def _acquire_page(self):
+        await self._ensure_browser()
+        if self._pool.empty() and self._created < self.max_pages:
+            self._created += 1
+            return await self._browser.new_page()
+        return await self._pool.get()
+
+    async def render(self, html_path: str, pdf_path: str) -> str:
+        """Print a local HTML file to `pdf_path` using a pooled page."""
+        page = await self._acquire_page()
+        try:
+            await page.goto(f"file://{os.path.abspath(html_path)}")
+            await page.pdf(path=pdf_path, **self.pdf_options)
+            self.rendered += 1
+            return pdf_path
+        finally:
+            self._pool.put_nowait(page)
+
+    async def close(self) -> None:
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._pw is not None:
+            await self._pw.stop()
+            self._pw = None
+
+
+# ─────────────────────────────────────────────────────────────
+# [KO] 지연(deferred) PDF 변환 큐
+# ─────────────────────────────────────────────────────────────
+
+
+def enqueue_pdf(
+    html_path: str, pdf_path: str, company: str = "", queue_path: str = PDF_QUEUE_PATH
+) -> None:
+    """Append one pending HTML → PDF job to the JSONL queue file."""
+    job = {"company": company, "html_path": html_path, "pdf_path": pdf_path}
+    os.makedirs(os.path.dirname(queue_path) or ".", exist_ok=True)
+    with _queue_lock, open(queue_path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(job, ensure_ascii=False) + "\n")
+
+
+def load_pending(queue_path: str = PDF_QUEUE_PATH) -> List[Dict[str, str]]:
+    """Queued jobs, de-duplicated by pdf_path (latest entry wins)."""
+    if not os.path.exists(queue_path):
+        return []
+    jobs: Dict[str, Dict[str, str]] = {}
+    with open(queue_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                job = json.loads(line)
+            except ValueError:
+                continue
+            if job.get("html_path") and job.get("pdf_path"):
+                jobs.pop(job["pdf_path"], None)
+                jobs[job["pdf_path"]] = job
+    return list(jobs.values())
+
+
+def _append_jobs(jobs: List[Dict[str, str]], queue_path: str) -> None:
+    if not jobs:
+        return
+    os.makedirs(os.path.dirname(queue_path) or ".", exist_ok=True)
+    with _queue_lock, open(queue_path, "a", encoding="utf-8") as f:
+        f.writelines(json.dumps(job, ensure_ascii=False) + "\n" for job in jobs)
+
+
+def _claim_queue(queue_path: str) -> Optional[str]:
+    """Atomically move the live queue to a private file (None if there is no queue)."""
+    claimed = f"{queue_path}.{os.getpid()}.{uuid.uuid4().hex[:8]}.claimed"
+    try:
+        os.replace(queue_path, claimed)  # 같은 디렉터리 내 rename → 다른 프로세스와도 원자적
+    except FileNotFoundError:
+        return None
+    return claimed
+
+
+async def render_pending(
+    queue_path: str = PDF_QUEUE_PATH, pages: int = 4
+) -> Dict[str, List[Dict[str, str]]]:
+    """
+    Render every queued job with one browser; failed jobs go back to the queue.
+    The batch is claimed by renaming the queue file first, so jobs enqueued while
+    rendering (by this or another process) land in a fresh queue file and are kept.
+    Returns {"done": [...], "failed": [...]}.
+    """
+    done: List[Dict[str, str]] = []
+    failed: List[Dict[str, str]] = []
+    claimed = _claim_queue(queue_path)
+    if claimed is None:
+        return {"done": done, "failed": failed}
+    jobs = load_pending(claimed)
+    try:
+        if jobs:
+            async with PdfRenderService(pages=pages) as renderer:
+
+                async def _one(job: Dict[str, str]) -> None:
+                    if not os.path.exists(job["html_path"]):
+                        logging.warning(f"[PDF] missing HTML, dropped: {job['html_path']}")
+                        return
+                    try:
+                        await renderer.render(job["html_path"], job["pdf_path"])
+                        done.append(job)
+                    except Exception as e:
+                        logging.warning(f"[PDF] render failed ({job['pdf_path']}): {e}")
+                        failed.append(job)
+
+                await asyncio.gather(*(_one(j) for j in jobs))
+    except BaseException:
+        # 브라우저 기동 실패/중단: 아직 끝나지 않은 작업을 모두 큐로 되돌림
+        finished = {j["pdf_path"] for j in done}
+        _append_jobs([j for j in jobs if j["pdf_path"] not in finished], queue_path)
+        os.remove(claimed)
+        raise
+    _append_jobs(failed, queue_path)
+    os.remove(claimed)
+    return {"done": done, "failed": failed}
+
+
+__all__ = [
+    "PDF_OPTIONS",
+    "PDF_QUEUE_PATH",
+    "PdfRenderService",
+    "enqueue_pdf",
+    "load_pending",
+    "render_pending",
+]
@@ -1,16 +1,25 @@
 # agents/rag_retriever_agent.py
-import os, logging, requests
-from typing import List, Dict, Tuple
-from urllib.parse import urlparse
+import os, json, hashlib, logging, threading
+from collections import OrderedDict
+from typing import Any, List, Dict, Tuple
+import numpy as np
 from openai import OpenAI
 import chromadb
 from bs4 import BeautifulSoup  # HTML 본문 추출용
 
-from graph.state import PipelineState, Evidence, EvidenceCategory
+from graph import diagnostics, metrics
+from graph.state import PipelineState, Evidence, EvidenceCategory, trusted_evidence
+from agents.http_client import get_http_client
+from agents.normalize import DomainClassifier, domain_of, is_same_site
 
 TAVILY_ENDPOINT = "https://api.tavily.com/search"
 TAVILY_TIMEOUT = 18
 
+# 공유 글로벌 풀 크기 = chroma_topk_each × GLOBAL_POOL_FACTOR (회사별 view는 이 풀에서 재정렬)
+GLOBAL_POOL_FACTOR = 4
+# 플래너 질의 캐시 최대 항목 수 (LRU; 장기 실행 서버에서 메모리 상한)
+PLANNER_CACHE_SIZE = 1024
+
 # 한/영 혼용 축 키워드
 AXIS_KEYWORDS = {
     "ai_tech": [
@@ -123,27 +132,20 @@ DENY_DOMAINS = {
     "investopedia.com",
 }
 
-
-def _domain(url: str) -> str:
-    try:
-        return urlparse(url).netloc.lower()
-    except Exception:
-        return ""
+# 접미사 기반 출처 분류 (규제기관 우선, agents/normalize.py)
+_SOURCE_CLASSES = DomainClassifier(
+    {"regulator": ALLOWED_REGULATORS, "media": ALLOWED_MEDIA}, default="other"
+)
+_DENIED = DomainClassifier({"deny": DENY_DOMAINS})
 
 
 def _domain_type(url: str, base_site: str | None) -> str:
-    d = _domain(url)
+    d = domain_of(url)
     if not d:
         return "other"
-    if base_site:
-        base = _domain(base_site)
-        if d == base or d.endswith("." + base):
-            return "first_party"
-    if any(d == x or d.endswith("." + x) for x in ALLOWED_REGULATORS):
-        return "regulator"
-    if any(d == x or d.endswith("." + x) for x in ALLOWED_MEDIA):
-        return "media"
-    return "other"
+    if base_site and is_same_site(d, domain_of(base_site)):
+        return "first_party"
+    return _SOURCE_CLASSES.classify(d)
 
 
 def _axis_keyword_score(text: str, axis: str) -> float:
@@ -158,12 +160,121 @@ def _cosine_to_sim(dists: List[float]) -> List[float]:
     return [max(0.0, 1.0 - float(x)) for x in dists]
 
 
+def _vector_key(vec: List[float]) -> str:
+    """Stable hash of an embedding vector (float32 bytes)."""
+    return hashlib.sha1(np.asarray(vec, dtype=np.float32).tobytes()).hexdigest()
+
+
+class _RetrievalPlanner:
+    """
+    Per-run planner for company-independent Chroma sub-queries.
+    - (B) 글로벌 질의는 회사명만 다르므로, 축별 공유 질의("{axis_desc} evidence")를 run당 1회만 실행
+    - 결과는 (벡터 해시, where, topk) 키로 메모리 캐시 (최대 max_cached 개, LRU)
+    - 회사별로는 공유 풀을 자기 질의 임베딩으로 재정렬한 filtered view를 제공
+    - ※ 근사: 공유 풀은 축 질의 기준 상위 pool_topk(= topk×GLOBAL_POOL_FACTOR)개뿐이므로,
+      회사 질의의 실제 최근접 문서가 풀 밖에 있으면 회사별 개별 질의(share_global_pool=False,
+      기존 동작)와 (B) 결과가 달라질 수 있음. 정확한 결과가 필요하면 share_global_pool=False
+    - begin(run_key): 회사별로 invoke 가 반복 호출되는 stream/fan-out 모드에서도 풀을 유지하고,
+      run_key(질의, 컬렉션 크기)가 바뀔 때만 비움 → 새 청크가 적재되면 다음 회사에서 다시 구성
+    """
+
+    def __init__(self, col, pool_topk: int, max_cached: int = PLANNER_CACHE_SIZE):
+        self.col = col
+        self.pool_topk = pool_topk
+        self.max_cached = max(1, int(max_cached))
+        self._cache: OrderedDict[Tuple[str, str, int, Tuple[str, ...]], dict] = OrderedDict()
+        self._axis_pools: Dict[str, dict] = {}
+        self._run_key: Any = None
+        self._lock = threading.Lock()
+        self.issued = 0  # 실제 Chroma 호출 수
+        self.served = 0  # 캐시/공유 풀로 대체된 호출 수
+
+    def query(
+        self,
+        q_embed: List[float],
+        where: dict | None,
+        topk: int,
+        include: Tuple[str, ...] = ("documents", "metadatas", "distances"),
+    ) -> dict:
+        key = (_vector_key(q_embed), json.dumps(where, sort_keys=True), int(topk), include)
+        hit = self._cache.get(key)
+        if hit is not None:
+            self._cache.move_to_end(key)
+            self.served += 1
+            return hit
+        kwargs = {"query_embeddings": [q_embed], "n_results": int(topk), "include": list(include)}
+        if where is not None:
+            kwargs["where"] = where
+        res = self.col.query(**kwargs)
+        self.issued += 1
+        self._cache[key] = res
+        if len(self._cache) > self.max_cached:
+            self._cache.popitem(last=False)
+        return res
+
+    def global_pool(self, axis_key: str, axis_embed: List[float]) -> dict:
+        """Shared (filter OFF) candidate pool for an axis, fetched once per run."""
+        pool = self._axis_pools.get(axis_key)
+        if pool is None:
+            res = self.query(
+                axis_embed,
+                None,
+                self.pool_topk,
+                include=("documents", "metadatas", "distances", "embeddings"),
+            )
+            embeds = (res.get("embeddings") or [[]])[0]
+            pool = {
+                "documents": (res.get("documents") or [[]])[0],
+                "metadatas": (res.get("metadatas") or [[]])[0],
+                "embeddings": np.asarray(embeds, dtype=np.float32).reshape(len(embeds), -1),
+            }
+            self._axis_pools[axis_key] = pool
+        return pool
+
+    def global_view(
+        self, axis_key: str, axis_embed: List[float], q_embed: List[float], topk: int
+    ) -> Tuple[List[str], List[dict], List[float]]:
+        """Company view of the shared pool: top-k by cosine similarity to `q_embed`."""
+        pool = self.global_pool(axis_key, axis_embed)
+        self.served += 1
+        mat = pool["embeddings"]
+        if not len(pool["documents"]) or mat.size == 0:
+            return [], [], []
+        q = np.asarray(q_embed, dtype=np.float32)
+        denom = np.linalg.norm(mat, axis=1) * max(float(np.linalg.norm(q)), 1e-12)
+        sims = (mat @ q) / np.maximum(denom, 1e-12)
+        order = np.argsort(-sims, kind="stable")[: int(topk)]
+        docs = [pool["documents"][i] for i in order]
+        metas = [pool["metadatas"][i] for i in order]
+        return docs, metas, [max(0.0, float(sims[i])) for i in order]
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self._axis_pools.clear()
+        self._run_key = None
+        self.issued = 0
+        self.served = 0
+
+    def begin(self, run_key: Any) -> bool:
+        """Start an invocation; keep cached pools if `run_key` is unchanged (True if kept)."""
+        with self._lock:
+            kept = run_key is not None and run_key == self._run_key
+            if not kept:
+                self.clear()
+                self._run_key = run_key
+            self.issued = 0
+            self.served = 0
+            return kept
+
+
 class RAGRetrieverAgent:
     """
     - Chroma 하이브리드: (A) company_id=ON 결과 + (B) 글로벌 결과 (필터 OFF)
     - Tavily로 외부 기사/문서 보강 → 간이 Evidence 생성
     - 재랭크: sim(임베딩) + axis keyword + domain weight + recency(없으면 0)
     - 도메인 다양성 보장(최종 TopN에서 서로 다른 도메인 최소 min_domain_diversity개)
+    - share_global_pool=True: (B) 글로벌 질의를 축별 공유 풀로 1회만 실행 (_RetrievalPlanner)
+      → 풀 밖의 최근접 문서는 놓칠 수 있는 근사; False 면 회사별 개별 질의로 기존과 동일한 결과
     """
 
     def __init__(
@@ -174,20 +285,26 @@ class RAGRetrieverAgent:
         min_domain_diversity: int = 2,  # ← 서로 다른 도메인 최소 개수
         chroma_topk_each: int = 16,  # ← Chroma에서 가져오는 후보 폭 (company/global 각각)
         tavily_max_results: int = 12,  # ← Tavily에서 가져오는 후보 폭
+        share_global_pool: bool = True,  # ← (B) 글로벌 질의 공유 (False면 회사별 개별 질의)
     ):
-        print("🤖 RAGRetrieverAgent 초기화 중...")
+        logging.info("[RAG] RAGRetrieverAgent 초기화 중...")
         self.openai = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
         self.tavily_key = os.getenv("TAVILY_API_KEY")
         db_path = db_path or os.path.join(os.getcwd(), "db", "chroma_db")
         self.db = chromadb.PersistentClient(path=db_path)
         self.col = self.db.get_collection(name=collection_name)
-        print(f"✅ ChromaDB 컬렉션 '{collection_name}'에 성공적으로 연결했습니다.")
+        logging.info(f"[RAG] ChromaDB 컬렉션 '{collection_name}'에 연결했습니다.")
 
         # 검색/선정 노브
         self.topn_per_axis = max(1, int(topn_per_axis))
         self.min_domain_diversity = max(1, int(min_domain_diversity))
         self.chroma_topk_each = max(4, int(chroma_topk_each))
         self.tavily_max_results = max(4, int(tavily_max_results))
+        self.share_global_pool = bool(share_global_pool)
+        self.planner = _RetrievalPlanner(
+            self.col, pool_topk=self.chroma_topk_each * GLOBAL_POOL_FACTOR
+        )
+        self._axis_embeds: Dict[str, List[float]] = {}  # 축 질의 임베딩 (질의/회사와 무관)
 
     def __call__(self, state: PipelineState) -> PipelineState:
         return self.invoke(state)
@@ -209,7 +326,7 @@ class RAGRetrieverAgent:
                 "include_domains": list(ALLOWED_MEDIA | ALLOWED_REGULATORS),
                 "exclude_domains": list(DENY_DOMAINS),
             }
-            r = requests.post(TAVILY_ENDPOINT, json=payload, timeout=TAVILY_TIMEOUT)
+            r = get_http_client().post(TAVILY_ENDPOINT, json=payload, timeout=TAVILY_TIMEOUT)
             r.raise_for_status()
             data = r.json()
             results = data.get("results", [])
@@ -218,8 +335,8 @@ class RAGRetrieverAgent:
                 u = h.get("url", "")
                 if not u:
                     continue
-                d = _domain(u)
-                if any(d == x or d.endswith("." + x) for x in DENY_DOMAINS):
+                d = domain_of(u)
+                if _DENIED.classify(d):
                     continue
                 title = (h.get("title") or "").strip()
                 snippet = (h.get("content") or "").strip()
@@ -238,7 +355,7 @@ class RAGRetrieverAgent:
 
     def _fetch_text(self, url: str) -> str:
         try:
-            r = requests.get(url, timeout=12, headers={"User-Agent": "Mozilla/5.0"})
+            r = get_http_client().get(url, timeout=12, headers={"User-Agent": "Mozilla/5.0"})
             if r.status_code != 200:
                 return ""
             if "pdf" in r.headers.get("content-type", "").lower():
@@ -256,15 +373,30 @@ class RAGRetrieverAgent:
     # -------------------- Main --------------------
     def _embedding(self, texts: List[str]) -> List[List[float]]:
         res = self.openai.embeddings.create(input=texts, model="text-embedding-3-small")
+        metrics.incr("embed.calls")
+        metrics.incr("embed.tokens", metrics.usage_tokens(getattr(res, "usage", None)))
         return [d.embedding for d in res.data]
 
     def _query_chroma(self, q_embed: List[float], where: dict | None, topk: int | None = None):
         if topk is None:
             topk = self.chroma_topk_each
-        kwargs = {"query_embeddings": [q_embed], "n_results": int(topk)}
-        if where is not None:
-            kwargs["where"] = where
-        return self.col.query(**kwargs)
+        return self.planner.query(q_embed, where, int(topk))
+
+    def _collection_size(self) -> int | None:
+        try:
+            return self.col.count()
+        except Exception:
+            return None  # 크기를 모르면 공유 풀을 유지하지 않음
+
+    def _axis_embeddings(self, evaluation_axes: Dict[str, str]) -> Dict[str, List[float]]:
+        """Company-independent axis query embeddings (one batched call per run)."""
+        keys = list(evaluation_axes.keys())
+        try:
+            vecs = self._embedding([f"{evaluation_axes[k]} evidence" for k in keys])
+        except Exception as e:
+            logging.warning(f"[RAG] axis embedding error (fallback to per-company global): {e}")
+            return {}
+        return dict(zip(keys, vecs))
 
     def _rerank(
         self,
@@ -311,7 +443,7 @@ class RAGRetrieverAgent:
         picked: List[Tuple[str, str, dict, float]] = []
         used_domains = set()
         for s, t, u, m in ranked:
-            d = _domain(u)
+            d = domain_of(u)
             if d not in used_domains or len(used_domains) < self.min_domain_diversity:
                 picked.append((t, u, m, s))
                 used_domains.add(d)
@@ -330,21 +462,21 @@ class RAGRetrieverAgent:
     def _to_evidence(
         self, axis_key: str, items: List[Tuple[str, str, dict, float]], _company_name: str
     ) -> List[Evidence]:
-        evs: List[Evidence] = []
-        for text, src, meta, _score in items:
-            evs.append(
-                Evidence(
-                    source=src,
-                    text=text,
-                    category=meta.get("category", axis_key),
-                    strength=meta.get("strength", "weak"),
-                    published=meta.get("published"),
-                )
+        return [
+            trusted_evidence(
+                src,
+                text,
+                meta.get("category", axis_key),
+                meta.get("strength", "weak"),
+                meta.get("published"),
             )
-        return evs
+            for text, src, meta, _score in items
+        ]
 
     def invoke(self, state: PipelineState) -> PipelineState:
-        print(f"\n🔍 총 {len(state.companies)}개 회사에 대한 근거 자료 검색을 시작합니다...")
+        logging.info(
+            f"[RAG] 총 {len(state.companies)}개 회사에 대한 근거 자료 검색을 시작합니다..."
+        )
         all_companies: Dict[str, Dict[str, List[Evidence]]] = {}
 
         evaluation_axes: Dict[EvidenceCategory, str] = {
@@ -357,8 +489,24 @@ class RAGRetrieverAgent:
             "deployability": "도입 용이성·보안·운영",
         }
 
+        # 질의·컬렉션이 그대로면 이전 invoke(앞선 회사)의 공유 풀/축 임베딩을 재사용
+        self.planner.begin((state.query, self._collection_size()))
+        axis_embeds: Dict[str, List[float]] = {}
+        if self.share_global_pool:
+            if not self._axis_embeds:
+                self._axis_embeds = self._axis_embeddings(evaluation_axes)
+            axis_embeds = self._axis_embeds
+
         for company in state.companies:
-            print(f"\n  🏢 '{company.name}' (ID: {company.id}) 처리 중...")
+            if diagnostics.enabled(logging.DEBUG):
+                diagnostics.emit(
+                    "rag.company",
+                    logging.DEBUG,
+                    "[RAG] '%s' (ID: %s) 처리 중...",
+                    company.name,
+                    company.id,
+                    company_id=company.id,
+                )
             base_site = getattr(company, "website", None)
             per_axis: Dict[str, List[Evidence]] = {}
 
@@ -399,13 +547,18 @@ class RAGRetrieverAgent:
                 except Exception as e:
                     logging.warning(f"[RAG] chroma(company) error: {e}")
 
-                # 3) (B) 필터 OFF 글로벌 근거
+                # 3) (B) 필터 OFF 글로벌 근거 (공유 풀이 있으면 회사별 view, 없으면 개별 질의)
                 try:
-                    res_b = self._query_chroma(q_embed, None, topk=self.chroma_topk_each)
-                    docs_b = res_b.get("documents", [[]])[0]
-                    metas_b = res_b.get("metadatas", [[]])[0]
-                    dists_b = res_b.get("distances", [[]])[0]
-                    sims_b = _cosine_to_sim(dists_b) if dists_b else [0.0] * len(docs_b)
+                    if axis_key in axis_embeds:
+                        docs_b, metas_b, sims_b = self.planner.global_view(
+                            axis_key, axis_embeds[axis_key], q_embed, self.chroma_topk_each
+                        )
+                    else:
+                        res_b = self._query_chroma(q_embed, None, topk=self.chroma_topk_each)
+                        docs_b = res_b.get("documents", [[]])[0]
+                        metas_b = res_b.get("metadatas", [[]])[0]
+                        dists_b = res_b.get("distances", [[]])[0]
+                        sims_b = _cosine_to_sim(dists_b) if dists_b else [0.0] * len(docs_b)
                     for t, m, sim in zip(docs_b, metas_b, sims_b):
                         pool.append(
                             (
@@ -448,7 +601,7 @@ class RAGRetrieverAgent:
                         try:
                             txt_embed = self._embedding([txt[:1200]])[0]
                             sim = _cosine_to_sim(
-                                self.col.query(query_embeddings=[txt_embed], n_results=1).get(
+                                self._query_chroma(txt_embed, None, topk=1).get(
                                     "distances", [[1.0]]
                                 )[0]
                             )[0]
@@ -460,13 +613,42 @@ class RAGRetrieverAgent:
                 ranked = self._rerank(axis_key, base_site, q_embed, pool, top_n=self.topn_per_axis)
                 evs = self._to_evidence(axis_key, ranked, company.name)
                 per_axis[axis_key] = evs
+                if diagnostics.enabled(logging.DEBUG):  # 축 단위 진단 (기본 비활성)
+                    diagnostics.emit(
+                        "rag.axis",
+                        logging.DEBUG,
+                        "[RAG] %s/%s pool=%d selected=%d",
+                        company.id,
+                        axis_key,
+                        len(pool),
+                        len(evs),
+                        company_id=company.id,
+                        axis=axis_key,
+                        pool=len(pool),
+                        selected=len(evs),
+                        sources=[e.source for e in evs],
+                    )
 
-            axis_counts = {k: len(v) for k, v in per_axis.items()}
-            logging.info(
-                f"[RAG] retrieved[{company.id}] axis_counts={axis_counts} total={sum(axis_counts.values())}"
-            )
+            if diagnostics.enabled(logging.INFO):
+                axis_counts = {k: len(v) for k, v in per_axis.items()}
+                total = sum(axis_counts.values())
+                diagnostics.emit(
+                    "rag.retrieved",
+                    logging.INFO,
+                    "[RAG] retrieved[%s] axis_counts=%s total=%d",
+                    company.id,
+                    axis_counts,
+                    total,
+                    company_id=company.id,
+                    axis_counts=axis_counts,
+                    total=total,
+                )
             all_companies[company.id] = per_axis
 
         state.retrieved_evidence = all_companies
-        print("\n✅ 모든 회사에 대한 근거 자료 검색을 완료했습니다.")
+        logging.info(
+            f"[RAG] planner: chroma queries issued={self.planner.issued} "
+            f"served_from_shared={self.planner.served}"
+        )
+        logging.info("[RAG] 모든 회사에 대한 근거 자료 검색을 완료했습니다.")
         return state
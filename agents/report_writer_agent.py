@@ -4,29 +4,35 @@
 # - Evidence/Notes 길이 제한, PDF scale, OpenAI 호출 안전화(실패시 대체문구)
 # - 축별 카드에 ScoringAgent의 실제 Evidence(강도/텍스트/출처/날짜) 반영
 # - NEW: Strengths / Weaknesses bullets 생성(장·단점 섹션)
-
-import os, re, json, asyncio, logging
+# - 리포트 단계 전체를 이벤트 루프 1개 + Chromium 1개(페이지 풀)로 처리 (agents/pdf_renderer.py)
+# - 회사 간/섹션 간 LLM 호출 동시 실행, 요청·토큰 한도는 AsyncRateLimiter로 제어
+# - LLM 응답 디스크 캐시 (agents/llm_cache.py, LLM_CACHE=0 으로 비활성화)
+# - report_mode: pdf(HTML+PDF) / html(HTML만) / deferred(HTML + PDF 변환 큐 적재)
+# - 증분 재생성: 입력 fingerprint({company}.fingerprint.json)가 같고 산출물이 있으면 생략
+# - portfolio 모드: 전체 기업을 문서 1개(순위 요약표 + 기업별 페이지)로 한 번만 출력
+#   (output_dir/portfolio/portfolio.{html,pdf} — 기업별 리포트 파일명과 충돌하지 않음)
+
+import os, re, json, asyncio, hashlib, logging
 from datetime import datetime
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Tuple
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-from playwright.async_api import async_playwright
 from langchain_openai import ChatOpenAI
-from langchain_core.messages import SystemMessage, HumanMessage
+from langchain_core.messages import AIMessage, SystemMessage, HumanMessage
 
+from graph import metrics
 from graph.state import PipelineState
+from agents.scoring_agent import INVEST_CONF, INVEST_TOTAL
+from agents.pdf_renderer import PDF_QUEUE_PATH, PdfRenderService, enqueue_pdf
+from agents.llm_limiter import AsyncRateLimiter, estimate_tokens
+from agents.llm_cache import LLMResponseCache, cache_key
+from agents.template_render import DEFAULT_BYTECODE_DIR, TemplateRenderer
+from agents.text_dedupe import dedupe_texts
 
 
 # ---------------- (NEW) utils for bullets ----------------
 def _dedupe_list(items: List[str], thresh: float = 0.88) -> List[str]:
-    from difflib import SequenceMatcher
-
-    out = []
-    for s in items or []:
-        s = (s or "").strip()
-        if s and all(SequenceMatcher(None, s, t).ratio() < thresh for t in out):
-            out.append(s)
-    return out
+    # SequenceMatcher.ratio 기준 근사 중복 제거 (상한값 필터로 비교 횟수 축소, 결과 동일)
+    return dedupe_texts(items, thresh)
 
 
 def _norm_bullet(s: str) -> str:
@@ -72,6 +78,24 @@ def strength_from_score(v: float) -> str:
     return "weak"
 
 
+def _parse_json_obj(text: str) -> Dict[str, Any]:
+    """Parse the first {...} block of an LLM reply."""
+    txt = (text or "").strip()
+    m = re.search(r"\{.*\}", txt, flags=re.DOTALL)
+    if m:
+        txt = m.group(0)
+    return json.loads(txt)
+
+
+def _count_llm(res: Any) -> None:
+    metrics.incr("llm.calls")
+    metrics.incr("llm.tokens", metrics.usage_tokens(getattr(res, "usage_metadata", None)))
+
+
+REPORT_MODES = ("pdf", "html", "deferred")
+PORTFOLIO_SUBDIR = "portfolio"  # 통합 문서 전용 하위 폴더 (output_dir 기준)
+
+
 # ---------------- (NEW) prompts ----------------
 NARRATIVE_BULLET_PROMPT = """
 아래 정보를 참고해 **음슴체 불릿**을 생성.
@@ -114,6 +138,22 @@ SYSTEM_PROMPT = """
 """
 
 
+def _settle(
+    payloads: List[Dict[str, Any]], results: List[Any], what: str
+) -> List[Dict[str, Any]]:
+    """gather(return_exceptions=True) results → dicts; a failed company is logged, not raised."""
+    out: List[Dict[str, Any]] = []
+    for payload, res in zip(payloads, results):
+        if isinstance(res, BaseException):
+            if not isinstance(res, Exception):  # 취소/인터럽트는 그대로 전파
+                raise res
+            company = payload.get("company_name") or payload.get("company_id")
+            logging.error(f"[REPORT] {what} failed for {company}: {res!r}")
+            res = {"error": repr(res), "skipped": True}
+        out.append(res)
+    return out
+
+
 class ReportWriterAgent:
     def __init__(
         self,
@@ -121,16 +161,35 @@ class ReportWriterAgent:
         template_name="report.html.j2",
         output_dir="outputs/reports",
         model="gpt-4o-mini",
+        render_pages=4,
+        llm_concurrency=8,
+        llm_rpm=300,
+        llm_tpm=150_000,
+        llm_cache: bool | None = None,
+        llm_cache_dir="outputs/cache/llm",
+        report_mode: str | None = None,
+        pdf_queue_path=PDF_QUEUE_PATH,
+        incremental: bool | None = None,
+        template_cache_dir=DEFAULT_BYTECODE_DIR,
+        portfolio: bool | None = None,
+        portfolio_template="portfolio.html.j2",
     ):
         self.template_dir = template_dir
         self.template_name = template_name
         self.output_dir = output_dir
         os.makedirs(self.output_dir, exist_ok=True)
 
-        self.env = Environment(
-            loader=FileSystemLoader(self.template_dir),
-            autoescape=select_autoescape(["html", "xml"]),
-        )
+        # 공유 Environment + 바이트코드 캐시, 템플릿은 여기서 미리 컴파일
+        self.renderer = TemplateRenderer(self.template_dir, self.template_name, template_cache_dir)
+        self.env = self.renderer.env
+
+        # 포트폴리오(통합 문서) 모드 (None → REPORT_PORTFOLIO 환경변수)
+        if portfolio is None:
+            portfolio = os.getenv("REPORT_PORTFOLIO", "0").strip().lower() in {"1", "true", "on"}
+        self.portfolio = portfolio
+        self.portfolio_template = portfolio_template
+        self._portfolio_renderer: TemplateRenderer | None = None
+        self._template_cache_dir = template_cache_dir
 
         self.llm = ChatOpenAI(model=model, temperature=0.4)
         # (NEW) 내러티브/불릿은 살짝 창의도 높임
@@ -141,13 +200,39 @@ class ReportWriterAgent:
         self.ev_len = 90
         self.ev_limit = 3
 
+        # PDF 렌더 페이지 풀 크기 (동시 렌더 수)
+        self.render_pages = max(1, int(render_pages))
+        self._renderer: PdfRenderService | None = None
+
+        # LLM 동시 호출/분당 한도 (루프마다 limiter 생성)
+        self.llm_limits = {"max_concurrent": llm_concurrency, "rpm": llm_rpm, "tpm": llm_tpm}
+        self._limiter: AsyncRateLimiter | None = None
+
+        # 리포트 산출물 모드 (None → REPORT_MODE 환경변수, 기본 pdf)
+        mode = (report_mode or os.getenv("REPORT_MODE") or "pdf").strip().lower()
+        if mode not in REPORT_MODES:
+            raise ValueError(f"report_mode must be one of {REPORT_MODES}, got {mode!r}")
+        self.report_mode = mode
+        self.pdf_queue_path = pdf_queue_path
+
+        # 증분 재생성 (None → REPORT_FORCE=1 이면 비활성화)
+        if incremental is None:
+            incremental = os.getenv("REPORT_FORCE", "0").strip().lower() not in {"1", "true", "on"}
+        self.incremental = incremental
+
+        # LLM 응답 캐시 (None → LLM_CACHE 환경변수)
+        self.llm_cache = LLMResponseCache(cache_dir=llm_cache_dir, enabled=llm_cache)
+
         # 파이프라인 state 참조 (evidence 접근용)
         self._pipeline_state_ref: PipelineState | None = None
+        # 템플릿 폴더 해시 (단계 실행마다 1회 계산, 회사별 fingerprint 에서 재사용)
+        self._template_digest: str | None = None
 
     def __call__(self, state: PipelineState) -> PipelineState:
         # 전체 state 보관
         self._pipeline_state_ref = state
 
+        payloads: List[Dict[str, Any]] = []
         for company in state.companies:
             sc = state.scorecard.get(company.id)
             if not sc or sc.decision != "invest":
@@ -172,28 +257,270 @@ class ReportWriterAgent:
                 "decision_rationale": "",
                 "query": state.query,
             }
-            res = asyncio.run(self.run(payload))
+            payloads.append(payload)
+
+        if not payloads:
+            return state
+
+        # 이벤트 루프 1회 + 브라우저 1회 기동으로 전체 리포트 처리
+        results = asyncio.run(self._run_all(payloads))
+        for payload, res in zip(payloads, results):
             if res and res.get("report_path"):
-                state.reports[company.id] = res["report_path"]
+                state.reports[payload["company_id"]] = res["report_path"]
+        if self.llm_cache.enabled:
+            logging.info(f"[LLMCache] {self.llm_cache.stats()}")
         return state
 
+    async def _run_all(self, payloads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run the whole report stage in one event loop with one shared browser.
+        Companies run concurrently: LLM calls go through one rate limiter and
+        PDF renders through the browser page pool.
+        """
+        async with PdfRenderService(pages=self.render_pages) as renderer:
+            self._renderer = renderer
+            self._limiter = AsyncRateLimiter(**self.llm_limits)
+            self._template_digest = self._template_hash()
+            try:
+                if self.portfolio:
+                    return await self._run_portfolio(payloads)
+                results = await asyncio.gather(
+                    *(self.run(p) for p in payloads), return_exceptions=True
+                )
+                return _settle(payloads, results, "report")
+            finally:
+                self._renderer = None
+                self._limiter = None
+                self._template_digest = None
+
     async def run(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        prepared = await self._prepare(state)
+        if "context" not in prepared:
+            return prepared
+        return await self._finish(
+            prepared["company"], prepared["context"], prepared.get("fingerprint")
+        )
+
+    async def _run_portfolio(self, payloads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Build every company context concurrently, then render ONE document
+        (ranked summary + one page-broken section per company) and print it once.
+        Every included company's result points at the shared document.
+        """
+        prepared = _settle(
+            payloads,
+            await asyncio.gather(
+                *(self._prepare(p, reuse=False) for p in payloads), return_exceptions=True
+            ),
+            "portfolio section",
+        )
+        sections = [
+            (payload, p["context"]) for payload, p in zip(payloads, prepared) if "context" in p
+        ]
+        if not sections:
+            return list(prepared)
+
+        if self._portfolio_renderer is None:
+            self._portfolio_renderer = TemplateRenderer(
+                self.template_dir, self.portfolio_template, self._template_cache_dir
+            )
+        context = self._portfolio_context(sections)
+        # 기업별 리포트({회사명}.html)와 겹치지 않도록 전용 하위 폴더에 저장
+        portfolio_dir = os.path.join(self.output_dir, PORTFOLIO_SUBDIR)
+        os.makedirs(portfolio_dir, exist_ok=True)
+        html_path, pdf_path = await self._render_pdf(
+            "portfolio", context, renderer=self._portfolio_renderer, output_dir=portfolio_dir
+        )
+        report_path = pdf_path or html_path
+        logging.info(f"[REPORT] portfolio ({len(sections)} companies): {report_path}")
+
+        shared = {
+            "report_path": report_path,
+            "html_path": html_path,
+            "pdf_path": pdf_path,
+            "pdf_pending": self.report_mode == "deferred",
+            "skipped": False,
+            "portfolio": True,
+        }
+        return [
+            {**shared, "decision": p["context"]["scorecard"]["decision"]} if "context" in p else p
+            for p in prepared
+        ]
+
+    def _portfolio_context(
+        self, sections: List[Tuple[Dict[str, Any], Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """Portfolio template context: ranked summary rows + per-company report contexts."""
+        def _cid(payload: Dict[str, Any]) -> str:
+            return payload.get("company_id") or payload.get("company_name")
+
+        reports = []
+        anchors: Dict[str, str] = {}
+        ordered = sorted(
+            sections, key=lambda pc: as_float(pc[1]["scorecard"].get("total"), 0.0), reverse=True
+        )
+        for i, (payload, ctx) in enumerate(ordered, start=1):
+            anchors[_cid(payload)] = f"company-{i}"
+            reports.append({**ctx, "anchor": anchors[_cid(payload)]})
+
+        # 순위표: 파이프라인 전체 scorecard 기준 (graph.run _print_summary와 동일 정렬)
+        rows = []
+        ref = self._pipeline_state_ref
+        if ref is not None and ref.scorecard:
+            for comp in ref.companies:
+                sc = ref.scorecard.get(comp.id)
+                conf = None
+                if sc and sc.items:
+                    conf = sum(it.confidence for it in sc.items) / len(sc.items)
+                rows.append(
+                    {
+                        "name": comp.name or comp.id,
+                        "total": sc.total if sc else None,
+                        "confidence": conf,
+                        "decision": sc.decision if sc else None,
+                        "anchor": anchors.get(comp.id),
+                    }
+                )
+        else:
+            for payload, ctx in ordered:
+                rows.append(
+                    {
+                        "name": ctx["company"]["name"],
+                        "total": ctx["scorecard"]["total"],
+                        "confidence": as_float((payload.get("confidence") or {}).get("mean"), 0.0),
+                        "decision": ctx["scorecard"]["decision"],
+                        "anchor": anchors.get(_cid(payload)),
+                    }
+                )
+        rows.sort(key=lambda r: r["total"] if r["total"] is not None else -1.0, reverse=True)
+        for rank, row in enumerate(rows, start=1):
+            row["rank"] = rank
+
+        first = ordered[0][1]
+        return {
+            "query": first.get("query", ""),
+            "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M"),
+            "ranking": rows,
+            "reports": reports,
+        }
+
+    async def _prepare(self, state: Dict[str, Any], reuse: bool = True) -> Dict[str, Any]:
+        """
+        Gate check + context (LLM sections). Returns a final result instead of a
+        context if gated out or if the existing report is still up to date (reuse=True).
+        """
         company = state.get("company_name", "Unknown")
         total = as_float((state.get("fae_score") or {}).get("total"), 0.0)
         mean_conf = as_float((state.get("confidence") or {}).get("mean"), 0.5)
-        if total < 7.5 or mean_conf < 0.55:
+        # 스코어링의 invest 게이트와 동일한 기준 (agents/scoring_agent.py)
+        if total < INVEST_TOTAL or mean_conf < INVEST_CONF:
             logging.info(f"[SKIP] Gate fail total={total}, conf={mean_conf}")
             return {"report_path": None, "skipped": True, "decision": "hold"}
 
+        fingerprint = self._fingerprint(state)
+        unchanged = self._unchanged_result(company, fingerprint) if reuse else None
+        if unchanged is not None:
+            logging.info(f"[REPORT] unchanged, reused: {unchanged['report_path']}")
+            return unchanged
+
         context = await self._build_context(company, state, total, mean_conf)
-        _, pdf_path = await self._render_pdf(company, context)
-        logging.info(f"[REPORT] created: {pdf_path}")
+        return {"company": company, "context": context, "fingerprint": fingerprint}
+
+    async def _finish(
+        self, company: str, context: Dict[str, Any], fingerprint: str | None = None
+    ) -> Dict[str, Any]:
+        html_path, pdf_path = await self._render_pdf(company, context)
+        # report_path: 지금 준비된 산출물 (PDF가 없으면 HTML)
+        report_path = pdf_path or html_path
+        logging.info(f"[REPORT] created ({self.report_mode}): {report_path}")
+        if fingerprint:
+            self._write_fingerprint(company, fingerprint)
         return {
-            "report_path": pdf_path,
+            "report_path": report_path,
+            "html_path": html_path,
+            "pdf_path": pdf_path,
+            "pdf_pending": self.report_mode == "deferred",
             "skipped": False,
             "decision": context["scorecard"]["decision"],
         }
 
+    # ---------------- 증분 재생성 (fingerprint) ----------------
+    def _fingerprint(self, state: Dict[str, Any]) -> str:
+        """
+        Hash of everything that shapes the report: payload (meta/scores/summaries/query),
+        the full ScoreCard incl. evidence, template files, LLM model/temperatures/prompts,
+        layout limits and report_mode. `generated_at` is deliberately excluded.
+        LLM outputs are not hashed: the model/temperature/prompt inputs stand in for them.
+        """
+        sc_obj = None
+        if self._pipeline_state_ref and state.get("company_id"):
+            sc_obj = self._pipeline_state_ref.scorecard.get(state["company_id"])
+        material = {
+            "payload": {k: v for k, v in state.items() if k != "generated_at"},
+            "scorecard": sc_obj.model_dump(mode="json") if sc_obj is not None else None,
+            "template": self._template_digest or self._template_hash(),
+            "llm": [
+                [self.llm.model_name, self.llm.temperature],
+                [self.llm_free.model_name, self.llm_free.temperature],
+            ],
+            "prompts": [SYSTEM_PROMPT, NARRATIVE_BULLET_PROMPT],
+            "layout": [self.notes_len, self.ev_len, self.ev_limit, self.report_mode],
+        }
+        raw = json.dumps(material, ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _template_hash(self) -> str:
+        """Hash of every file under template_dir (covers includes/partials)."""
+        h = hashlib.sha256()
+        for root, _, files in sorted(os.walk(self.template_dir)):
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                h.update(os.path.relpath(path, self.template_dir).encode("utf-8"))
+                with open(path, "rb") as f:
+                    h.update(f.read())
+        return h.hexdigest()
+
+    def _fingerprint_path(self, company: str) -> str:
+        return os.path.join(self.output_dir, f"{company}.fingerprint.json")
+
+    def _unchanged_result(self, company: str, fingerprint: str) -> Dict[str, Any] | None:
+        """Result for the existing report if its fingerprint matches and the files exist."""
+        if not self.incremental:
+            return None
+        try:
+            with open(self._fingerprint_path(company), "r", encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if saved.get("fingerprint") != fingerprint:
+            return None
+
+        html_path = os.path.join(self.output_dir, f"{company}.html")
+        pdf_path = os.path.join(self.output_dir, f"{company}.pdf")
+        if not os.path.exists(html_path):
+            return None
+        has_pdf = os.path.exists(pdf_path)
+        if self.report_mode == "pdf" and not has_pdf:
+            return None
+        return {
+            "report_path": pdf_path if has_pdf else html_path,
+            "html_path": html_path,
+            "pdf_path": pdf_path if has_pdf else None,
+            "pdf_pending": self.report_mode == "deferred" and not has_pdf,
+            "skipped": False,
+            "unchanged": True,
+            "decision": "invest",
+        }
+
+    def _write_fingerprint(self, company: str, fingerprint: str) -> None:
+        data = {
+            "fingerprint": fingerprint,
+            "report_mode": self.report_mode,
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        with open(self._fingerprint_path(company), "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
     async def _build_context(
         self, company: str, state: Dict[str, Any], total: float, mean_conf: float
     ) -> Dict[str, Any]:
@@ -229,11 +556,10 @@ class ReportWriterAgent:
             ]
         )
 
-        consulting = await self._gen_consulting_sections(company_obj, axes, total, mean_conf, blob)
-
-        # (NEW) 장점/단점 불릿 생성
-        strengths_bullets, weaknesses_bullets = await self._gen_narrative_bullets(
-            company_obj, axes, blob
+        # 컨설팅 섹션 + (NEW) 장점/단점 불릿 생성을 동시에 요청
+        consulting, (strengths_bullets, weaknesses_bullets) = await asyncio.gather(
+            self._gen_consulting_sections(company_obj, axes, total, mean_conf, blob),
+            self._gen_narrative_bullets(company_obj, axes, blob),
         )
         strengths_bullets = self._normalize_bullets(strengths_bullets) or ["강점 정리 필요"]
         weaknesses_bullets = self._normalize_bullets(weaknesses_bullets) or ["취약점 정리 필요"]
@@ -311,6 +637,37 @@ class ReportWriterAgent:
         }
         return context
 
+    async def _ainvoke_llm(
+        self, llm: ChatOpenAI, messages: List[Any], validate: Callable[[str], Any] | None = None
+    ) -> Any:
+        """
+        LLM call through the response cache and the per-run rate limiter.
+        A fresh response is cached only if `validate(content)` does not raise.
+        """
+        key = cache_key(llm.model_name, llm.temperature, messages)
+        cached = self.llm_cache.get(key)
+        if cached is not None:
+            return AIMessage(content=cached)
+
+        limiter = self._limiter
+        if limiter is None:
+            res = await llm.ainvoke(messages)
+        else:
+            est = estimate_tokens("".join(str(m.content) for m in messages))
+            async with limiter.slot(est):
+                res = await llm.ainvoke(messages)
+            limiter.settle(est, metrics.usage_tokens(getattr(res, "usage_metadata", None)))
+        _count_llm(res)
+
+        if isinstance(res.content, str):
+            try:
+                if validate is not None:
+                    validate(res.content)
+                self.llm_cache.put(key, res.content, model=llm.model_name)
+            except Exception:
+                pass  # 파싱 불가 응답/캐시 쓰기 실패는 캐시하지 않음
+        return res
+
     async def _gen_consulting_sections(
         self, company: Dict[str, Any], axes: Dict[str, float], total: float, conf: float, blob: str
     ) -> Dict[str, Any]:
@@ -331,7 +688,7 @@ total={total:.2f}, confidence={conf:.2f}
 """
         )
         try:
-            res = await self.llm.ainvoke([sys, user])
+            res = await self._ainvoke_llm(self.llm, [sys, user], validate=json.loads)
             j = json.loads(res.content)
         except Exception:
             j = {
@@ -372,12 +729,8 @@ total={total:.2f}, confidence={conf:.2f}
         w_bullets: List[str] = []
         for _ in range(2):  # 2회 재시도
             try:
-                res = await self.llm_free.ainvoke([sys, user])
-                txt = (res.content or "").strip()
-                m = re.search(r"\{.*\}", txt, flags=re.DOTALL)
-                if m:
-                    txt = m.group(0)
-                j = json.loads(txt)
+                res = await self._ainvoke_llm(self.llm_free, [sys, user], validate=_parse_json_obj)
+                j = _parse_json_obj(res.content)
                 s_bullets = [safe_str(x, "") for x in (j.get("strengths_bullets") or [])]
                 w_bullets = [safe_str(x, "") for x in (j.get("weaknesses_bullets") or [])]
                 break
@@ -399,25 +752,34 @@ total={total:.2f}, confidence={conf:.2f}
         # 최소 5개 미만이면 사용 보류(콜랩스 방지)
         return norm[:8] if len(norm) >= 5 else []
 
-    async def _render_pdf(self, company: str, context: Dict[str, Any]):
-        html = self.env.get_template(self.template_name).render(**context)
-        html_path = os.path.join(self.output_dir, f"{company}.html")
-        pdf_path = os.path.join(self.output_dir, f"{company}.pdf")
+    async def _render_pdf(
+        self,
+        company: str,
+        context: Dict[str, Any],
+        renderer: TemplateRenderer | None = None,
+        output_dir: str | None = None,
+    ):
+        """Write the HTML report, then print / queue / skip the PDF per report_mode.
+        Returns (html_path, pdf_path or None when no PDF exists yet)."""
+        html = (renderer or self.renderer).render(**context)
+        output_dir = output_dir or self.output_dir
+        html_path = os.path.join(output_dir, f"{company}.html")
+        pdf_path = os.path.join(output_dir, f"{company}.pdf")
         with open(html_path, "w", encoding="utf-8") as f:
             f.write(html)
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True, args=["--no-sandbox"])
-            page = await browser.new_page()
-            await page.goto(f"file://{os.path.abspath(html_path)}")
-            await page.pdf(
-                path=pdf_path,
-                format="A4",
-                print_background=True,
-                scale=0.9,
-                margin={"top": "16mm", "bottom": "18mm", "left": "14mm", "right": "14mm"},
-            )
-            await browser.close()
+        if self.report_mode == "html":
+            return html_path, None
+        if self.report_mode == "deferred":
+            enqueue_pdf(html_path, pdf_path, company=company, queue_path=self.pdf_queue_path)
+            return html_path, None
+
+        if self._renderer is not None:
+            await self._renderer.render(html_path, pdf_path)
+        else:
+            # 단독 호출(run 직접 호출 등): 일회성 서비스
+            async with PdfRenderService(pages=1) as renderer:
+                await renderer.render(html_path, pdf_path)
         return html_path, pdf_path
 
 
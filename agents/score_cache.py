@@ -0,0 +1,148 @@
+# agents/score_cache.py
+# Per-(company, axis) ScoreItem cache keyed by evidence fingerprints + score change log
+#
+# [KO] 증분 크롤링 후 재실행 시, 근거가 바뀐 (회사, 축)만 다시 채점하기 위한 캐시입니다.
+#      - 축 fingerprint: 근거(source/text/strength/published) + 현재 recency 여부 + 채점 설정
+#        (시간이 지나 recency 창 밖으로 나간 근거도 fingerprint 가 바뀌어 재채점됨)
+#      - 저장: outputs/cache/scoring/<company_id>.json  {axes: {axis: {fp, item}}, total, decision}
+#        (ScoreItem.evidence 는 저장하지 않고 현재 근거 목록을 다시 붙임)
+#      - 변경 로그: outputs/logs/score_changes.jsonl 에 축 점수/총점/결정 변화를 한 줄씩 기록
+#      - ScoringAgent(incremental=True) 일 때만 사용 (파이프라인 노드 기본값; 끄기: SCORING_FORCE=1
+#        환경변수 또는 graph.run --force-rescore)
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from graph import metrics
+from graph.state import Evidence, ScoreCard, ScoreItem, trusted_score_item
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = "outputs/cache/scoring"
+DEFAULT_CHANGE_LOG = "outputs/logs/score_changes.jsonl"
+
+_SAFE_ID = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+def axis_fingerprint(evs: Sequence[Evidence], recent: Iterable[bool], config: Any) -> str:
+    """Hash of one axis' evidence (in order), their recency flags and the scoring config."""
+    payload = {
+        "config": config,
+        "evidence": [
+            [e.source, e.text, getattr(e, "strength", "weak"), getattr(e, "published", None), r]
+            for e, r in zip(evs, recent)
+        ],
+    }
+    raw = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(raw).hexdigest()
+
+
+class ScoreCache:
+    """File-per-company cache of ScoreItems plus a JSONL change log."""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, change_log: str = DEFAULT_CHANGE_LOG):
+        self.cache_dir = cache_dir
+        self.change_log = change_log
+        self._log_lock = threading.Lock()
+
+    def _path(self, company_id: str) -> str:
+        safe = _SAFE_ID.sub("_", company_id) or "_"
+        if safe != company_id:  # 치환으로 인한 충돌 방지
+            safe += "-" + hashlib.sha1(company_id.encode("utf-8")).hexdigest()[:8]
+        return os.path.join(self.cache_dir, f"{safe}.json")
+
+    def load(self, company_id: str) -> Dict[str, Any]:
+        try:
+            with open(self._path(company_id), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def cached_item(
+        self, record: Dict[str, Any], axis: str, fingerprint: str, evs: Sequence[Evidence]
+    ) -> Optional[ScoreItem]:
+        """Cached ScoreItem for `axis` if its fingerprint matches (evidence re-attached)."""
+        entry = (record.get("axes") or {}).get(axis)
+        if not entry or entry.get("fp") != fingerprint:
+            metrics.incr("scoring.axes_scored")
+            return None
+        metrics.incr("scoring.axes_cached")
+        return trusted_score_item(**entry["item"], evidence=list(evs))
+
+    def update(
+        self,
+        company_id: str,
+        record: Dict[str, Any],
+        card: ScoreCard,
+        fingerprints: Dict[str, str],
+        dirty: List[str],
+    ) -> Optional[Dict[str, Any]]:
+        """Store the new card; append and return a change-log entry if anything moved."""
+        old_axes = record.get("axes") or {}
+        new_record = {
+            "axes": {
+                it.key: {"fp": fingerprints[it.key], "item": it.model_dump(exclude={"evidence"})}
+                for it in card.items
+            },
+            "total": card.total,
+            "decision": card.decision,
+        }
+        if new_record == record:
+            return None
+
+        axes = {}
+        for it in card.items:
+            old = (old_axes.get(it.key) or {}).get("item") or {}
+            if old.get("value") != it.value or old.get("confidence") != it.confidence:
+                axes[it.key] = {
+                    "value": [old.get("value"), it.value],
+                    "confidence": [old.get("confidence"), it.confidence],
+                }
+        entry = None
+        if axes or record.get("total") != card.total or record.get("decision") != card.decision:
+            entry = {
+                "ts": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "company_id": company_id,
+                "dirty_axes": dirty,
+                "axes": axes,
+                "total": [record.get("total"), card.total],
+                "decision": [record.get("decision"), card.decision],
+            }
+            self._append_log(entry)
+
+        path = self._path(company_id)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(new_record, f, ensure_ascii=False)
+        os.replace(tmp, path)
+        return entry
+
+    def _append_log(self, entry: Dict[str, Any]) -> None:
+        if not self.change_log:
+            return
+        os.makedirs(os.path.dirname(self.change_log) or ".", exist_ok=True)
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self._log_lock, open(self.change_log, "a", encoding="utf-8") as f:
+            f.write(line)
+        if entry["decision"][0] is not None and entry["decision"][0] != entry["decision"][1]:
+            logger.info(
+                f"[Scoring] decision changed[{entry['company_id']}] "
+                f"{entry['decision'][0]} → {entry['decision'][1]} (total {entry['total']})"
+            )
+
+
+__all__ = [
+    "DEFAULT_CACHE_DIR",
+    "DEFAULT_CHANGE_LOG",
+    "ScoreCache",
+    "axis_fingerprint",
+]
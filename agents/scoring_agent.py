@@ -2,23 +2,37 @@
 # Agentic RAG v2 – ScoringAgent (patched)
 # - 7축 점수 산출, confidence 계산, total/decision 결정
 # - 엄밀 매칭: 회사 공식 도메인 / 텍스트·URL 경로 회사명 / market 축 태그 특례
+# - 회사 수가 많으면 열(column) 기반 NumPy 엔진으로 일괄 계산 (agents/scoring_engine.py, 결과 동일)
+# - 도메인/게시일 파싱은 공용 캐시 모듈 사용 (agents/normalize.py)
+# - 축별 상세 로그는 graph/diagnostics.py 로 레벨 게이트 (비활성 시 샘플/도메인 집계 생략)
+# - 증분 재채점: 근거가 바뀐 (회사, 축)만 다시 계산, 점수/결정 변화는 변경 로그로 기록 (agents/score_cache.py)
 
 from __future__ import annotations
 
+import hashlib
 import logging
 from dataclasses import dataclass
-from typing import Dict, List, Tuple, Optional
+from types import CodeType
+from typing import Callable, Dict, List, Tuple, Optional
 from collections import defaultdict, Counter
-from urllib.parse import urlparse
-from datetime import datetime, timedelta, timezone
-import logging
 
+from graph import diagnostics
+from graph.evidence_store import state_chunks
 from graph.state import (
     PipelineState,
     Evidence,
     EvidenceCategory,
     ScoreItem,
     ScoreCard,
+    trusted_score_card,
+    trusted_score_item,
+)
+from agents.normalize import domain_of, now_epoch_us, url_path, within_recency
+from agents.score_cache import (
+    DEFAULT_CACHE_DIR,
+    DEFAULT_CHANGE_LOG,
+    ScoreCache,
+    axis_fingerprint,
 )
 
 logger = logging.getLogger(__name__)
@@ -53,18 +67,23 @@ MIN_ITEMS_FOR_AXIS: Dict[EvidenceCategory, int] = {
 
 LOG_EVIDENCE_SAMPLES = 3  # 상단 어딘가에 정의
 
+# 투자 게이트: total >= INVEST_TOTAL AND 축 평균 confidence >= INVEST_CONF → invest
+# (columnar 엔진/what-if 시나리오 기준값도 이 상수를 사용)
+INVEST_TOTAL = 7.5
+INVEST_CONF = 0.55
+
+# engine="auto"일 때 columnar 엔진으로 전환하는 회사 수
+COLUMNAR_MIN_COMPANIES = 50
+
+# 축 점수/신뢰도 산식 버전: 산식 의미를 바꾸면 올릴 것 (증분 캐시의 ScoreItem 무효화)
+# (_score_axis/_calc_confidence/_blend_confidence 바이트코드 해시도 함께 fingerprint 에 포함)
+SCORING_VERSION = 1
+
 # ─────────────────────────────────────────────────────────────
 # 유틸
 # ─────────────────────────────────────────────────────────────
 
 
-def _domain_of(url: str) -> str:
-    try:
-        return urlparse(url).netloc.lower()
-    except Exception:
-        return ""
-
-
 def _slug(s: str) -> str:
     # "FinChat AI" -> "finchatai"
     return "".join(ch for ch in (s or "").lower() if ch.isalnum())
@@ -75,32 +94,6 @@ def _contains_any(text: str, keywords: List[str]) -> bool:
     return any((kw or "").lower() in t for kw in keywords if kw)
 
 
-# 기존 _within_recency 함수 전체를 아래로 교체
-def _within_recency(iso_date: Optional[str], months: int) -> bool:
-    """
-    True if `iso_date` is within `months` months from now.
-    - 모든 비교는 UTC-aware datetime으로 정규화해서 수행.
-    - ISO 문자열에 'Z'가 있으면 '+00:00'으로 치환하여 fromisoformat 호환.
-    """
-    if not iso_date:
-        return False
-    try:
-        s = iso_date.strip()
-        # '...Z' → '+00:00' 로 치환 (fromisoformat 호환)
-        if s.endswith("Z"):
-            s = s[:-1] + "+00:00"
-        dt = datetime.fromisoformat(s)
-        # aware/naive 모두 UTC aware 로 정규화
-        if dt.tzinfo is None:
-            dt_utc = dt.replace(tzinfo=timezone.utc)
-        else:
-            dt_utc = dt.astimezone(timezone.utc)
-        now_utc = datetime.now(timezone.utc)
-        return (now_utc - dt_utc) <= timedelta(days=30 * months)
-    except Exception:
-        return False
-
-
 # ─────────────────────────────────────────────────────────────
 # 매칭 로직 (엄밀)
 #   1) 회사 공식 도메인
@@ -115,16 +108,15 @@ def _matches_company(
     website: Optional[str],
     tags: Optional[List[str]] = None,
 ) -> bool:
-    domain = _domain_of(e.source)
-    parsed = urlparse(e.source)
-    path = (parsed.path or "").lower()
+    domain = domain_of(e.source)
+    path = url_path(e.source)
     text = f"{e.text or ''} {e.source or ''}"
     name_slug = _slug(company_name)
     path_slug = _slug(path.replace("-", "").replace("_", ""))
 
     # 1) 회사 공식 도메인 매칭 (가장 강함)
     if website:
-        site = _domain_of(website)
+        site = domain_of(website)
         if site and (domain == site or domain.endswith("." + site) or site in domain):
             return True
 
@@ -164,12 +156,12 @@ def _calc_confidence(axis_evs: List[Evidence], axis: EvidenceCategory) -> Confid
     coverage = min(1.0, len(axis_evs) / float(min_need))
 
     # diversity: 출처 도메인 다양성
-    domains = {_domain_of(e.source) for e in axis_evs if e.source}
+    domains = {domain_of(e.source) for e in axis_evs if e.source}
     diversity = min(1.0, len(domains) / max(1.0, float(len(axis_evs))))
 
     # recency: 최근 자료 비율 (최근 18개월 내)
     recent_cnt = sum(
-        1 for e in axis_evs if _within_recency(getattr(e, "published", None), CONF_RECENCY_MONTHS)
+        1 for e in axis_evs if within_recency(getattr(e, "published", None), CONF_RECENCY_MONTHS)
     )
     recency = recent_cnt / float(len(axis_evs))
 
@@ -197,7 +189,7 @@ def _score_axis(axis_evs: List[Evidence]) -> Tuple[float, str]:
     total = 0.0
     memory: Dict[Tuple[str, str], int] = defaultdict(int)  # (domain, strength) -> count
     for e in axis_evs:
-        dom = _domain_of(e.source)
+        dom = domain_of(e.source)
         s = getattr(e, "strength", "weak") or "weak"
         base = STRENGTH_BONUS.get(s, 1)
 
@@ -207,10 +199,31 @@ def _score_axis(axis_evs: List[Evidence]) -> Tuple[float, str]:
         total += base * penalty
 
     value = max(0.0, min(10.0, total))
-    notes = f"{len(axis_evs)} evidences, domains={len({ _domain_of(e.source) for e in axis_evs })}"
+    notes = f"{len(axis_evs)} evidences, domains={len({ domain_of(e.source) for e in axis_evs })}"
     return round(value, 2), notes
 
 
+def _code_digest(*funcs: Callable) -> str:
+    """Stable hash of functions' bytecode/constants (nested code such as genexprs included)."""
+    h = hashlib.sha1()
+
+    def _feed(code: CodeType) -> None:
+        h.update(code.co_code)
+        h.update(repr(code.co_names).encode("utf-8"))
+        for const in code.co_consts:
+            if isinstance(const, CodeType):
+                _feed(const)
+            else:
+                h.update(repr(const).encode("utf-8"))
+
+    for f in funcs:
+        _feed(f.__code__)
+    return h.hexdigest()[:16]
+
+
+_FORMULA_DIGEST = _code_digest(_score_axis, _calc_confidence, _blend_confidence)
+
+
 # ─────────────────────────────────────────────────────────────
 # 회사별 축 그룹핑 (tags 전달)
 # ─────────────────────────────────────────────────────────────
@@ -254,8 +267,7 @@ def _decide(total: float, items: List[ScoreItem]) -> str:
     if not items:
         return "hold"
     mean_conf = sum(it.confidence for it in items) / len(items)
-    # 룰: total >= 7.5 AND mean_conf >= 0.55 → invest
-    return "invest" if (total >= 7.5 and mean_conf >= 0.55) else "hold"
+    return "invest" if (total >= INVEST_TOTAL and mean_conf >= INVEST_CONF) else "hold"
 
 
 # ─────────────────────────────────────────────────────────────
@@ -263,89 +275,235 @@ def _decide(total: float, items: List[ScoreItem]) -> str:
 # ─────────────────────────────────────────────────────────────
 
 
+def _trace_axis(
+    company_id: str,
+    axis: str,
+    evs: List[Evidence],
+    value: float,
+    conf: float,
+    conf_parts: ConfidenceParts,
+) -> None:
+    domains = {domain_of(e.source) for e in evs if e.source}
+    strengths = dict(Counter(getattr(e, "strength", "weak") for e in evs))
+    samples = [
+        (getattr(e, "strength", "weak"), e.source, (e.text or "")[:120].replace("\n", " "))
+        for e in evs[:LOG_EVIDENCE_SAMPLES]
+    ]
+    samples_block = "\n".join(f"- [{st}] {src} :: {snip}" for st, src, snip in samples)
+    diagnostics.emit(
+        "scoring.axis",
+        logging.INFO,
+        "[Scoring] %s | axis=%s | score=%.2f | conf=%.3f (cov=%.2f div=%.2f rec=%.2f) | "
+        "evidences=%d(domains=%d, strengths=%s)\n%s",
+        company_id,
+        axis,
+        value,
+        conf,
+        conf_parts.coverage,
+        conf_parts.diversity,
+        conf_parts.recency,
+        len(evs),
+        len(domains),
+        strengths,
+        samples_block or "- no samples -",
+        company_id=company_id,
+        axis=axis,
+        score=value,
+        confidence=round(conf, 3),
+        coverage=conf_parts.coverage,
+        diversity=conf_parts.diversity,
+        recency=conf_parts.recency,
+        evidences=len(evs),
+        domains=len(domains),
+        strengths=strengths,
+        samples=[{"strength": st, "source": src, "text": snip} for st, src, snip in samples],
+    )
+
+
+@dataclass
+class _CachedAxes:
+    """Previous cache record, current axis fingerprints and the axes still valid."""
+
+    record: dict
+    fingerprints: Dict[str, str]
+    hits: Dict[str, ScoreItem]
+
+
 class ScoringAgent:
     """Compute 7-axis scores, confidence, total, and decision per company (patched)."""
 
+    def __init__(
+        self,
+        engine: str = "auto",
+        incremental: bool = False,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        change_log: str = DEFAULT_CHANGE_LOG,
+    ):
+        # "python": 회사·축 단위 루프(축별 상세 로그) / "columnar": NumPy 일괄 계산 / "auto"
+        if engine not in ("auto", "python", "columnar"):
+            raise ValueError(f"engine must be auto|python|columnar, got {engine!r}")
+        self.engine = engine
+        # 증분 재채점: 파이프라인 노드(graph/nodes.py)에서만 켬 → 단독 사용 시 캐시 파일을 쓰지 않음
+        self.cache = ScoreCache(cache_dir, change_log) if incremental else None
+
     def __call__(self, state: PipelineState) -> PipelineState:
         if not state.companies:
             return state
 
-        scorecards: Dict[str, ScoreCard] = {}
+        axis_maps = self._axis_maps(state)
+        now_us = now_epoch_us()
+        cached = [self._cached_axes(c.id, m, now_us) for c, m in zip(state.companies, axis_maps)]
 
-        for company in state.companies:
-            # RAG 결과 우선 사용, 없으면 chunks로 폴백
-            axis_map = state.retrieved_evidence.get(company.id, {})
-            if not axis_map:
-                axis_map = _gather_company_axis_evidence(
-                    state.chunks,
-                    company.name,
-                    getattr(company, "website", None),
-                    getattr(company, "tags", []),
+        use_columnar = self.engine == "columnar" or (
+            self.engine == "auto" and len(state.companies) >= COLUMNAR_MIN_COMPANIES
+        )
+        if use_columnar:
+            cards = self._score_columnar(axis_maps, cached)
+        else:
+            cards = [
+                self._score_company(c.id, m, prev)
+                for c, m, prev in zip(state.companies, axis_maps, cached)
+            ]
+
+        for company, sc, prev in zip(state.companies, cards, cached):
+            if prev is not None:
+                dirty = [a for a in AXIS_WEIGHTS if a not in prev.hits]
+                self.cache.update(company.id, prev.record, sc, prev.fingerprints, dirty)
+            if state.scorecard.get(company.id) != sc:  # 변화 없는 항목은 그대로 둠
+                state.scorecard[company.id] = sc
+            if diagnostics.enabled(logging.INFO):
+                diagnostics.emit(
+                    "scoring.result",
+                    logging.INFO,
+                    "[Scoring] result[%s] total=%.2f decision=%s",
+                    company.id,
+                    sc.total,
+                    sc.decision,
+                    company_id=company.id,
+                    total=sc.total,
+                    decision=sc.decision,
                 )
+        return state
 
-            # 전체 입력 개수 요약
-            axis_counts = {k: len(v) for k, v in axis_map.items()}
-            logging.info(
-                f"[Scoring] input[{company.id}] axis_counts={axis_counts} total={sum(axis_counts.values())}"
-            )
+    # -------------------- per-company (python) --------------------
+    def _score_company(
+        self, company_id: str, axis_map: Dict[str, List[Evidence]], cached: _CachedAxes | None
+    ) -> ScoreCard:
+        items: List[ScoreItem] = []
+        for axis in AXIS_WEIGHTS.keys():
+            item = cached.hits.get(axis) if cached else None
+            if item is None:
+                item = self._score_item(company_id, axis, axis_map.get(axis, []))
+            items.append(item)
+
+        total = _weighted_total(items)
+        decision = _decide(total, items)
+        return trusted_score_card(items=items, total=total, decision=decision)
+
+    def _score_item(self, company_id: str, axis: str, evs: List[Evidence]) -> ScoreItem:
+        # 점수/신뢰도 계산
+        value, notes = _score_axis(evs)
+        conf_parts = _calc_confidence(evs, axis)
+        conf = _blend_confidence(conf_parts)
+
+        # ─ 축별 디테일 (INFO 로그/trace 가 꺼져 있으면 집계·문자열 작업 생략)
+        if diagnostics.enabled(logging.INFO):
+            _trace_axis(company_id, axis, evs, value, conf, conf_parts)
+
+        return trusted_score_item(
+            key=axis,
+            value=value,
+            confidence=round(conf, 3),
+            notes=notes,
+            evidence=evs,
+        )
+
+    # -------------------- incremental cache --------------------
+    def _cached_axes(
+        self, company_id: str, axis_map: Dict[str, List[Evidence]], now_us: int
+    ) -> _CachedAxes | None:
+        if self.cache is None:
+            return None
+        record = self.cache.load(company_id)
+        fps: Dict[str, str] = {}
+        hits: Dict[str, ScoreItem] = {}
+        for axis in AXIS_WEIGHTS.keys():
+            evs = axis_map.get(axis, [])
+            recent = [
+                within_recency(getattr(e, "published", None), CONF_RECENCY_MONTHS, now_us)
+                for e in evs
+            ]
+            fps[axis] = axis_fingerprint(evs, recent, self._axis_config(axis))
+            item = self.cache.cached_item(record, axis, fps[axis], evs)
+            if item is not None:
+                hits[axis] = item
+        return _CachedAxes(record, fps, hits)
+
+    @staticmethod
+    def _axis_config(axis: str) -> dict:
+        # 축 점수/신뢰도에 영향을 주는 설정 (바뀌면 캐시 무효)
+        return {
+            "version": SCORING_VERSION,
+            "formula": _FORMULA_DIGEST,
+            "bonus": STRENGTH_BONUS,
+            "min_items": MIN_ITEMS_FOR_AXIS.get(axis, 2),
+            "months": CONF_RECENCY_MONTHS,
+        }
+
+    def _axis_maps(self, state: PipelineState) -> List[Dict[str, List[Evidence]]]:
+        """Per-company axis → evidence maps, in state.companies order."""
+        # RAG 결과 우선 사용, 없으면 chunks로 폴백
+        # (폴백 회사들은 청크 역색인 1회 스캔으로 한꺼번에 매칭, agents/company_matcher.py)
+        missing = [c for c in state.companies if not state.retrieved_evidence.get(c.id)]
+        fallback: Dict[str, Dict[str, List[Evidence]]] = {}
+        if missing:
+            from agents.company_matcher import match_companies
+
+            fallback = match_companies(state_chunks(state), missing)
+
+        axis_maps = []
+        for company in state.companies:
+            axis_map = state.retrieved_evidence.get(company.id) or fallback[company.id]
 
-            items: List[ScoreItem] = []
-            for axis in AXIS_WEIGHTS.keys():
-                evs = axis_map.get(axis, [])
-
-                # 점수/신뢰도 계산
-                value, notes = _score_axis(evs)
-                conf_parts = _calc_confidence(evs, axis)
-                conf = _blend_confidence(conf_parts)
-
-                # ─ 추가 로깅: 축별 디테일
-                domains = [_domain_of(e.source) for e in evs if e.source]
-                dom_cnt = len(set(domains))
-                strengths = Counter([getattr(e, "strength", "weak") for e in evs])
-
-                # ★ 백슬래시가 들어가는 처리는 f-string 바깥에서 미리
-                sample_lines = []
-                for e in evs[:LOG_EVIDENCE_SAMPLES]:
-                    strength = getattr(e, "strength", "weak")
-                    src = e.source
-                    snippet = (e.text or "")[:120].replace("\n", " ")
-                    sample_lines.append(f"- [{strength}] {src} :: {snippet}")
-                samples_block = "\n".join(sample_lines) if sample_lines else "- no samples -"
-
-                # ★ f-string 대신 로거의 포맷 인자를 사용 (백슬래시 문제 회피)
-                logging.info(
-                    "[Scoring] %s | axis=%s | score=%.2f | conf=%.3f (cov=%.2f div=%.2f rec=%.2f) | evidences=%d(domains=%d, strengths=%s)\n%s",
+            # 전체 입력 개수 요약
+            if diagnostics.enabled(logging.INFO):
+                axis_counts = {k: len(v) for k, v in axis_map.items()}
+                total = sum(axis_counts.values())
+                diagnostics.emit(
+                    "scoring.input",
+                    logging.INFO,
+                    "[Scoring] input[%s] axis_counts=%s total=%d",
                     company.id,
-                    axis,
-                    value,
-                    conf,
-                    conf_parts.coverage,
-                    conf_parts.diversity,
-                    conf_parts.recency,
-                    len(evs),
-                    dom_cnt,
-                    dict(strengths),
-                    samples_block,
-                )
-
-                items.append(
-                    ScoreItem(
-                        key=axis,
-                        value=value,
-                        confidence=round(conf, 3),
-                        notes=notes,
-                        evidence=evs,
-                    )
+                    axis_counts,
+                    total,
+                    company_id=company.id,
+                    axis_counts=axis_counts,
+                    total=total,
                 )
-
+            axis_maps.append(axis_map)
+        return axis_maps
+
+    def _score_columnar(
+        self, axis_maps: List[Dict[str, List[Evidence]]], cached: List[_CachedAxes | None]
+    ) -> List[ScoreCard]:
+        """Companies with any dirty axis in one NumPy pass (same ScoreCards, no per-axis logs)."""
+        from agents.scoring_engine import score_companies
+
+        n_axes = len(AXIS_WEIGHTS)
+        todo = [i for i, c in enumerate(cached) if c is None or len(c.hits) < n_axes]
+        fresh = dict(zip(todo, score_companies([axis_maps[i] for i in todo])))
+
+        cards = []
+        for i, c in enumerate(cached):
+            if i in fresh:
+                cards.append(fresh[i])
+                continue
+            items = [c.hits[a] for a in AXIS_WEIGHTS]
             total = _weighted_total(items)
-            decision = _decide(total, items)
-            scorecards[company.id] = ScoreCard(items=items, total=total, decision=decision)
-
-            logging.info("[Scoring] result[%s] total=%.2f decision=%s", company.id, total, decision)
-
-        state.scorecard.update(scorecards)
-        return state
+            cards.append(
+                trusted_score_card(items=items, total=total, decision=_decide(total, items))
+            )
+        return cards
 
 
 """
@@ -0,0 +1,230 @@
+# agents/scoring_engine.py
+# Columnar (NumPy) batch scoring – same results as ScoringAgent's per-company loop
+#
+# [KO] 전체 회사 × 축의 근거를 한 번에 열(column) 배열로 펼쳐 group-by 연산으로 점수를 계산합니다.
+#      - 열: company 인덱스, axis 인덱스, domain id(인터닝), strength id, 게시일 epoch, source 유무
+#      - _score_axis      : (그룹, 도메인, 강도) 고유키별 개수 → 보너스 × (1 + 0.5·(n-1)) 합산
+#      - _calc_confidence : 그룹별 개수/고유 도메인 수/최근 자료 수 → coverage/diversity/recency
+#      - _weighted_total / _decide : 축 순서대로 누적 (부동소수 연산 순서를 기존 구현과 동일하게 유지)
+#      - 도메인 파싱/날짜 파싱은 고유 문자열당 1회
+#      ※ 결과 반올림은 파이썬 round()로 수행 (np.round와 결과가 다를 수 있어 동일성 보장용)
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from graph.state import (
+    Evidence,
+    EvidenceCategory,
+    ScoreCard,
+    trusted_score_card,
+    trusted_score_item,
+)
+
+from agents.normalize import domain_of, iso_epoch_us, now_epoch_us, recency_window_us
+from agents.scoring_agent import (
+    AXIS_WEIGHTS,
+    CONF_RECENCY_MONTHS,
+    INVEST_CONF,
+    INVEST_TOTAL,
+    MIN_ITEMS_FOR_AXIS,
+    STRENGTH_BONUS,
+)
+
+AXES: tuple[EvidenceCategory, ...] = tuple(AXIS_WEIGHTS)
+_AXIS_INDEX = {a: i for i, a in enumerate(AXES)}
+NO_DATE = np.iinfo(np.int64).min  # published 없음/파싱 실패
+
+
+class EvidenceColumns:
+    """All evidence of all companies flattened into parallel NumPy arrays."""
+
+    def __init__(self, axis_maps: Sequence[Dict[str, List[Evidence]]]):
+        n_axes = len(AXES)
+        self.n_companies = len(axis_maps)
+        self.n_groups = self.n_companies * n_axes
+        # (company, axis) 그룹별 근거 리스트 (ScoreItem.evidence 용, 입력 순서 유지)
+        self.groups: List[List[Evidence]] = [[] for _ in range(self.n_companies * n_axes)]
+
+        domains: Dict[str, int] = {}
+        strengths: Dict[str, int] = {}
+        domain_cache: Dict[str, int] = {}  # source → domain id
+        epoch_cache: Dict[Optional[str], int] = {}
+        group, domain, strength, has_source, published = [], [], [], [], []
+
+        for ci, axis_map in enumerate(axis_maps):
+            for axis, evs in axis_map.items():
+                ai = _AXIS_INDEX.get(axis)
+                if ai is None or not evs:
+                    continue
+                g = ci * n_axes + ai
+                self.groups[g].extend(evs)
+                for e in evs:
+                    group.append(g)
+                    d = domain_cache.get(e.source)
+                    if d is None:
+                        dom = domain_of(e.source)
+                        d = domain_cache[e.source] = domains.setdefault(dom, len(domains))
+                    domain.append(d)
+                    s = getattr(e, "strength", "weak") or "weak"
+                    strength.append(strengths.setdefault(s, len(strengths)))
+                    has_source.append(bool(e.source))
+                    pub = getattr(e, "published", None)
+                    ep = epoch_cache.get(pub)
+                    if ep is None:
+                        ep = iso_epoch_us(pub) if pub else None
+                        ep = epoch_cache[pub] = NO_DATE if ep is None else ep
+                    published.append(ep)
+
+        self.group = np.asarray(group, dtype=np.int64)
+        self.domain = np.asarray(domain, dtype=np.int64)
+        self.strength = np.asarray(strength, dtype=np.int64)
+        self.has_source = np.asarray(has_source, dtype=bool)
+        self.published = np.asarray(published, dtype=np.int64)
+        self.n_domains = max(1, len(domains))
+        self.n_strengths = max(1, len(strengths))
+        self.bonus = np.asarray(
+            [float(STRENGTH_BONUS.get(s, 1)) for s in strengths] or [1.0], dtype=np.float64
+        )
+
+    def recent_mask(self, months: int, now_us: Optional[int] = None) -> np.ndarray:
+        """Per-evidence `within_recency(published, months)` flags."""
+        now = now_epoch_us() if now_us is None else now_us
+        dated = self.published != NO_DATE
+        age = now - np.where(dated, self.published, now)
+        return dated & (age <= recency_window_us(months))
+
+
+def _unique_per_group(group: np.ndarray, values: np.ndarray, n_values: int, n_groups: int):
+    """Number of distinct `values` inside each group."""
+    if not len(group):
+        return np.zeros(n_groups, dtype=np.int64)
+    keys = np.unique(group * n_values + values)
+    return np.bincount(keys // n_values, minlength=n_groups)
+
+
+def _group_counts(cols: EvidenceColumns):
+    """Per group: evidence count, distinct domains, distinct domains of sourced evidence."""
+    n_groups = cols.n_groups
+    count = np.bincount(cols.group, minlength=n_groups)
+    uniq_all = _unique_per_group(cols.group, cols.domain, cols.n_domains, n_groups)
+    uniq_src = _unique_per_group(
+        cols.group[cols.has_source], cols.domain[cols.has_source], cols.n_domains, n_groups
+    )
+    return count, uniq_all, uniq_src
+
+
+def _axis_values(cols: EvidenceColumns) -> np.ndarray:
+    """_score_axis: (그룹, 도메인, 강도)별 첫 건 1.0, 이후 0.5 가중 → 0~10 클립 (반올림 전)"""
+    raw = np.zeros(cols.n_groups, dtype=np.float64)
+    if len(cols.group):
+        key = (cols.group * cols.n_domains + cols.domain) * cols.n_strengths + cols.strength
+        ukeys, ucount = np.unique(key, return_counts=True)
+        contrib = cols.bonus[ukeys % cols.n_strengths] * (1.0 + 0.5 * (ucount - 1))
+        raw = np.bincount(
+            ukeys // (cols.n_domains * cols.n_strengths), weights=contrib, minlength=cols.n_groups
+        )
+    return np.minimum(10.0, np.maximum(0.0, raw))
+
+
+def _blended_confidence(
+    cols: EvidenceColumns,
+    count: np.ndarray,
+    uniq_src: np.ndarray,
+    min_items: Dict[str, int],
+    months: int,
+    now_us: Optional[int] = None,
+) -> np.ndarray:
+    """_calc_confidence + _blend_confidence per group (반올림 전, 연산 순서 동일)."""
+    recent = np.bincount(
+        cols.group,
+        weights=cols.recent_mask(months, now_us).astype(np.float64),
+        minlength=cols.n_groups,
+    )
+    need = np.tile(np.asarray([float(max(1, min_items.get(a, 2))) for a in AXES]), cols.n_companies)
+    n = count.astype(np.float64)
+    safe_n = np.where(count > 0, n, 1.0)
+    coverage = np.minimum(1.0, n / need)
+    diversity = np.minimum(1.0, uniq_src / np.maximum(1.0, n))
+    recency = recent / safe_n
+    return 0.4 * coverage + 0.3 * diversity + 0.3 * recency
+
+
+def py_round(values: np.ndarray, ndigits: int) -> np.ndarray:
+    """
+    Element-wise Python round(x, ndigits): np.round, with the few values that sit
+    within float error of a rounding tie re-rounded by Python.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    out = np.round(values, ndigits)
+    scaled = values * 10.0**ndigits
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_tie.any():
+        out[near_tie] = [round(v, ndigits) for v in values[near_tie].tolist()]
+    return out
+
+
+def score_companies(
+    axis_maps: Sequence[Dict[str, List[Evidence]]],
+    months: int = CONF_RECENCY_MONTHS,
+) -> List[ScoreCard]:
+    """
+    Score every company (one axis_map per company, in order) in one columnar pass.
+    Returns ScoreCards equal to what ScoringAgent's per-company loop produces.
+    """
+    n_axes = len(AXES)
+    cols = EvidenceColumns(axis_maps)
+    if not cols.n_groups:
+        return []
+
+    count, uniq_all, uniq_src = _group_counts(cols)
+    value = _axis_values(cols)
+    blended = _blended_confidence(cols, count, uniq_src, MIN_ITEMS_FOR_AXIS, months)
+
+    # ── 파이썬 round()로 반올림 (기존 구현과 동일한 값)
+    value_l = value.tolist()
+    blended_l = blended.tolist()
+    count_l = count.tolist()
+    uniq_all_l = uniq_all.tolist()
+    item_value = [round(v, 2) if c else 0.0 for v, c in zip(value_l, count_l)]
+    item_conf = [round(round(b, 4), 3) if c else 0.0 for b, c in zip(blended_l, count_l)]
+
+    # ── _weighted_total / _decide: 축 순서대로 누적
+    vals = np.asarray(item_value).reshape(cols.n_companies, n_axes)
+    confs = np.asarray(item_conf).reshape(cols.n_companies, n_axes)
+    acc = np.zeros(cols.n_companies)
+    conf_sum = np.zeros(cols.n_companies)
+    for ai, axis in enumerate(AXES):
+        acc = acc + AXIS_WEIGHTS.get(axis, 10) * vals[:, ai]
+        conf_sum = conf_sum + confs[:, ai]
+    totals = [round(t, 2) for t in (acc / 100.0).tolist()]
+    invest = (np.asarray(totals) >= INVEST_TOTAL) & (conf_sum / n_axes >= INVEST_CONF)
+
+    cards: List[ScoreCard] = []
+    for ci in range(cols.n_companies):
+        items = []
+        for ai, axis in enumerate(AXES):
+            g = ci * n_axes + ai
+            c = count_l[g]
+            items.append(
+                trusted_score_item(
+                    key=axis,
+                    value=item_value[g],
+                    confidence=item_conf[g],
+                    notes=f"{c} evidences, domains={uniq_all_l[g]}" if c else "No evidence.",
+                    evidence=cols.groups[g],
+                )
+            )
+        cards.append(
+            trusted_score_card(
+                items=items,
+                total=totals[ci],
+                decision="invest" if invest[ci] else "hold",
+            )
+        )
+    return cards
+
+
+__all__ = ["AXES", "EvidenceColumns", "py_round", "score_companies"]
@@ -0,0 +1,260 @@
+# agents/scoring_scenarios.py
+# What-if scoring: evaluate many weight/threshold scenarios over persisted evidence
+#
+# [KO] 크롤링/검색을 다시 돌리지 않고 저장된 근거(PipelineState 스냅샷)만으로
+#      AXIS_WEIGHTS / MIN_ITEMS_FOR_AXIS / CONF_RECENCY_MONTHS / 투자 게이트(INVEST_TOTAL/CONF)를 바꿔 가며
+#      회사별 decision 이 어떻게 달라지는지 계산합니다.
+#      - 축 점수(value)는 시나리오와 무관 → 1회 계산
+#      - confidence 는 (MIN_ITEMS, recency 개월) 조합별 1회 계산
+#      - 총점/결정은 (시나리오 × 회사) 행렬로 한 번에 계산 (축 순서 누적, 반올림은 기존과 동일)
+#      기준 시나리오(현재 상수)의 결과는 ScoringAgent 결과와 같습니다.
+#
+# 입력: graph/run.py --save-evidence 스냅샷(outputs/evidence/run_YYYYMMDD_HHMM.json) 또는
+#       rag/scoring 단계 체크포인트(outputs/checkpoints/run_*/rag.ckpt, 별도 저장 없이 사용 가능)
+# 실행: python -m scripts.whatif_scoring --grid grid.json
+
+from __future__ import annotations
+
+import csv
+import glob
+import itertools
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from graph.checkpoint import CHECKPOINT_DIR, MAGIC, latest_checkpoint, load_checkpoint
+from graph.state import Evidence, PipelineState
+
+from agents.normalize import now_epoch_us
+from agents.scoring_agent import (
+    AXIS_WEIGHTS,
+    CONF_RECENCY_MONTHS,
+    INVEST_CONF,
+    INVEST_TOTAL,
+    MIN_ITEMS_FOR_AXIS,
+    ScoringAgent,
+)
+from agents.scoring_engine import (
+    AXES,
+    EvidenceColumns,
+    _axis_values,
+    _blended_confidence,
+    _group_counts,
+    py_round,
+)
+
+EVIDENCE_DIR = "outputs/evidence"
+
+
+@dataclass
+class Scenario:
+    """One scoring configuration (unspecified axes fall back to the current constants)."""
+
+    name: str
+    weights: Dict[str, float] = field(default_factory=lambda: dict(AXIS_WEIGHTS))
+    min_items: Dict[str, int] = field(default_factory=lambda: dict(MIN_ITEMS_FOR_AXIS))
+    recency_months: int = CONF_RECENCY_MONTHS
+    invest_total: float = INVEST_TOTAL
+    invest_conf: float = INVEST_CONF
+
+    def weight_vector(self) -> List[float]:
+        return [float(self.weights.get(a, AXIS_WEIGHTS.get(a, 10))) for a in AXES]
+
+    def min_items_key(self) -> Tuple[int, ...]:
+        return tuple(int(self.min_items.get(a, MIN_ITEMS_FOR_AXIS.get(a, 2))) for a in AXES)
+
+
+def baseline() -> Scenario:
+    return Scenario(name="baseline")
+
+
+def scenario_grid(spec: Dict[str, Any]) -> List[Scenario]:
+    """
+    Cartesian product of a grid spec, baseline first. Keys (all optional):
+      weights: {axis: [w, ...]}, min_items: {axis: [n, ...]},
+      recency_months: [m, ...], invest_total: [t, ...], invest_conf: [c, ...]
+    """
+    weights = spec.get("weights") or {}
+    min_items = spec.get("min_items") or {}
+    w_axes, mi_axes = list(weights), list(min_items)
+    dims = (
+        [weights[a] for a in w_axes]
+        + [min_items[a] for a in mi_axes]
+        + [
+            spec.get("recency_months") or [CONF_RECENCY_MONTHS],
+            spec.get("invest_total") or [INVEST_TOTAL],
+            spec.get("invest_conf") or [INVEST_CONF],
+        ]
+    )
+    out = [baseline()]
+    for combo in itertools.product(*dims):
+        w = dict(AXIS_WEIGHTS, **dict(zip(w_axes, combo[: len(w_axes)])))
+        mi = dict(MIN_ITEMS_FOR_AXIS, **dict(zip(mi_axes, combo[len(w_axes) : -3])))
+        months, total, conf = combo[-3:]
+        parts = [f"{a}={w[a]}" for a in w_axes if w[a] != AXIS_WEIGHTS.get(a)]
+        parts += [f"min_{a}={mi[a]}" for a in mi_axes if mi[a] != MIN_ITEMS_FOR_AXIS.get(a)]
+        if months != CONF_RECENCY_MONTHS:
+            parts.append(f"recency={months}m")
+        if total != INVEST_TOTAL:
+            parts.append(f"total>={total}")
+        if conf != INVEST_CONF:
+            parts.append(f"conf>={conf}")
+        if not parts:
+            continue  # baseline과 동일
+        out.append(Scenario(",".join(parts), w, mi, int(months), float(total), float(conf)))
+    return out
+
+
+def default_grid() -> List[Scenario]:
+    """Baseline, each axis weight ±5, gates and recency window one at a time."""
+    out = [baseline()]
+    for a in AXES:
+        for d in (-5, 5):
+            w = dict(AXIS_WEIGHTS, **{a: max(0, AXIS_WEIGHTS[a] + d)})
+            out.append(Scenario(f"{a}={w[a]}", weights=w))
+    out += [Scenario(f"total>={t}", invest_total=t) for t in (7.0, 8.0)]
+    out += [Scenario(f"conf>={c}", invest_conf=c) for c in (0.5, 0.6)]
+    out += [Scenario(f"recency={m}m", recency_months=m) for m in (12, 24)]
+    return out
+
+
+# ─────────────────────────────────────────────────────────────
+# 평가
+# ─────────────────────────────────────────────────────────────
+
+
+@dataclass
+class SensitivityResult:
+    """(scenario × company) totals, mean confidences and invest flags."""
+
+    scenarios: List[Scenario]
+    company_ids: List[str]
+    totals: np.ndarray
+    mean_conf: np.ndarray
+    invest: np.ndarray
+
+    def flips(self) -> np.ndarray:
+        """Per scenario: number of companies whose decision differs from row 0."""
+        return (self.invest != self.invest[:1]).sum(axis=1)
+
+    def invest_share(self) -> np.ndarray:
+        """Per company: share of scenarios that end in invest."""
+        if not len(self.scenarios):
+            return np.zeros(len(self.company_ids))
+        return self.invest.mean(axis=0)
+
+    def write_csv(self, path: str) -> str:
+        """Decision matrix: one row per company, one column per scenario."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
+            w.writerow(["company_id", "invest_share"] + [s.name for s in self.scenarios])
+            share = self.invest_share()
+            for ci, cid in enumerate(self.company_ids):
+                row = ["invest" if x else "hold" for x in self.invest[:, ci].tolist()]
+                w.writerow([cid, round(float(share[ci]), 3)] + row)
+        return path
+
+
+def evaluate_scenarios(
+    axis_maps: Sequence[Dict[str, List[Evidence]]],
+    scenarios: Sequence[Scenario],
+    company_ids: Optional[Sequence[str]] = None,
+    now_us: Optional[int] = None,
+) -> SensitivityResult:
+    """Score every company under every scenario in one vectorized pass."""
+    n_axes = len(AXES)
+    cols = EvidenceColumns(axis_maps)
+    n_c, n_s = cols.n_companies, len(scenarios)
+    ids = list(company_ids) if company_ids is not None else [str(i) for i in range(n_c)]
+    now_us = now_epoch_us() if now_us is None else now_us
+
+    count, _, uniq_src = _group_counts(cols)
+    has_ev = count > 0
+    vals = np.where(has_ev, py_round(_axis_values(cols), 2), 0.0).reshape(n_c, n_axes)
+
+    # confidence: (MIN_ITEMS, 개월) 조합별 회사당 축 confidence 합
+    conf_sums: Dict[Tuple[Tuple[int, ...], int], np.ndarray] = {}
+    for s in scenarios:
+        key = (s.min_items_key(), s.recency_months)
+        if key in conf_sums:
+            continue
+        blended = _blended_confidence(
+            cols, count, uniq_src, dict(zip(AXES, key[0])), key[1], now_us
+        )
+        conf = np.where(has_ev, py_round(py_round(blended, 4), 3), 0.0).reshape(n_c, n_axes)
+        acc = np.zeros(n_c)
+        for ai in range(n_axes):
+            acc = acc + conf[:, ai]
+        conf_sums[key] = acc
+    mean_conf = np.asarray(
+        [conf_sums[(s.min_items_key(), s.recency_months)] / n_axes for s in scenarios]
+    ).reshape(n_s, n_c)
+
+    # 총점: Σ(weight × value) / 100 을 축 순서대로 누적 (시나리오 × 회사)
+    weights = np.asarray([s.weight_vector() for s in scenarios], dtype=np.float64)
+    weights = weights.reshape(n_s, n_axes)
+    acc = np.zeros((n_s, n_c))
+    for ai in range(n_axes):
+        acc = acc + weights[:, ai : ai + 1] * vals[None, :, ai]
+    totals = py_round(acc / 100.0, 2)
+
+    gate_total = np.asarray([s.invest_total for s in scenarios], dtype=np.float64)[:, None]
+    gate_conf = np.asarray([s.invest_conf for s in scenarios], dtype=np.float64)[:, None]
+    invest = (totals >= gate_total) & (mean_conf >= gate_conf)
+    return SensitivityResult(list(scenarios), ids, totals, mean_conf, invest)
+
+
+# ─────────────────────────────────────────────────────────────
+# 근거 스냅샷 저장/로드
+# ─────────────────────────────────────────────────────────────
+
+
+def save_scoring_inputs(state: PipelineState, path: str) -> str:
+    """Persist what ScoringAgent needs (companies, retrieved evidence, fallback chunks)."""
+    include = {"query", "companies", "retrieved_evidence"}
+    if any(not state.retrieved_evidence.get(c.id) for c in state.companies):
+        # 청크 폴백이 필요한 회사가 있을 때만 (저장소 기반 청크는 ID/경로만)
+        include.update({"chunks", "chunk_ids", "evidence_store"})
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(state.model_dump_json(include=include))
+    return path
+
+
+def latest_inputs(
+    evidence_dir: str = EVIDENCE_DIR, checkpoint_dir: str = CHECKPOINT_DIR
+) -> Optional[str]:
+    """Newest evidence snapshot or rag/scoring checkpoint, whichever is more recent."""
+    paths = glob.glob(os.path.join(evidence_dir, "*.json"))
+    paths += [p for p in (latest_checkpoint(s, checkpoint_dir) for s in ("rag", "scoring")) if p]
+    return max(paths, key=os.path.getmtime) if paths else None
+
+
+def load_scoring_inputs(path: str) -> Tuple[List[str], List[Dict[str, List[Evidence]]]]:
+    """Company ids and per-company axis maps (resolved exactly like ScoringAgent).
+    `path` is an evidence snapshot JSON or a stage checkpoint (graph/checkpoint.py)."""
+    with open(path, "rb") as f:
+        is_checkpoint = f.read(len(MAGIC)) == MAGIC
+    if is_checkpoint:
+        state, _ = load_checkpoint(path)
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            state = PipelineState.model_validate_json(f.read())
+    return [c.id for c in state.companies], ScoringAgent(engine="python")._axis_maps(state)
+
+
+__all__ = [
+    "EVIDENCE_DIR",
+    "Scenario",
+    "SensitivityResult",
+    "baseline",
+    "default_grid",
+    "evaluate_scenarios",
+    "latest_inputs",
+    "load_scoring_inputs",
+    "save_scoring_inputs",
+    "scenario_grid",
+]
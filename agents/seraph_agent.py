@@ -1,34 +1,24 @@
-import os, json, logging, requests
+import os, json, logging
 from serpapi import GoogleSearch
 from dotenv import load_dotenv
 from typing import List, Dict, Any
-from urllib.parse import urlparse
 
 from graph.state import PipelineState, CompanyMeta
+from agents.http_client import get_http_client
+from agents.normalize import netloc, registrable_domain, root_origin
 
 TAVILY_ENDPOINT = "https://api.tavily.com/search"
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
 
-def _root_origin(u: str) -> str:
-    try:
-        p = urlparse(u)
-        if not p.scheme or not p.netloc:
-            return u
-        return f"{p.scheme}://{p.netloc}"
-    except Exception:
-        return u
-
-
 def _infer_company_name(title: str, url: str) -> str:
     """
     검색 결과의 장문 타이틀에서 노이즈 제거.
     - ' | ' 또는 ' – ' 구분자를 기준으로 좌측 토큰 우선
     - 도메인 루트의 호스트명을 참고 (예: finchat.ai -> Finchat)
     """
-    host = (urlparse(url).netloc or "").split(":")[0]
-    host_core = host.split(".")[-2] if "." in host else host
+    host_core = registrable_domain(url).split(".")[0]  # finchat.co.uk -> finchat
     host_guess = host_core.capitalize() if host_core else ""
     cand = title.split(" | ")[0].split(" – ")[0].strip() or host_guess
     return cand if 1 <= len(cand) <= 50 else host_guess
@@ -61,13 +51,13 @@ class SeraphAgent:
             title = r.get("title", "") or ""
             if not link:
                 continue
-            website = _root_origin(link)
+            website = root_origin(link)
             name = _infer_company_name(title, link)
             cleaned.append({"name": name, "url": website, "summary": r.get("snippet", "")})
         seen = set()
         uniq = []
         for c in cleaned:
-            host = urlparse(c["url"]).netloc
+            host = netloc(c["url"])
             if host in seen:
                 continue
             seen.add(host)
@@ -78,7 +68,7 @@ class SeraphAgent:
         if not self.tavily_key:
             return []
         try:
-            r = requests.post(
+            r = get_http_client().post(
                 TAVILY_ENDPOINT,
                 json={
                     "api_key": self.tavily_key,
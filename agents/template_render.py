@@ -0,0 +1,65 @@
+# agents/template_render.py
+# Shared Jinja2 environment with a persistent bytecode cache
+#
+# [KO] 리포트 템플릿 렌더링 공용 모듈입니다. (ReportWriterAgent, scripts/*)
+#      - FileSystemBytecodeCache: 컴파일된 템플릿 바이트코드를 outputs/cache/jinja 에 저장
+#        → 새 프로세스에서도 템플릿 파싱/컴파일 생략 (소스 체크섬이 바뀌면 자동 재컴파일)
+#      - (template_dir, cache_dir) 단위로 Environment 1개를 프로세스 내에서 공유
+#      - TemplateRenderer: 생성 시점에 템플릿을 미리 로드(precompile)
+#      ※ auto_reload 유지: 템플릿 파일이 수정되면 다음 렌더에서 반영됩니다.
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import Any, Dict, Tuple
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+
+DEFAULT_TEMPLATE_DIR = "docs/templates"
+DEFAULT_BYTECODE_DIR = "outputs/cache/jinja"
+
+_envs: Dict[Tuple[str, str], Environment] = {}
+_envs_lock = threading.Lock()
+
+
+def get_environment(
+    template_dir: str = DEFAULT_TEMPLATE_DIR, bytecode_dir: str | None = DEFAULT_BYTECODE_DIR
+) -> Environment:
+    """Process-wide Environment per (template_dir, bytecode_dir); bytecode_dir=None disables."""
+    key = (os.path.abspath(template_dir), os.path.abspath(bytecode_dir) if bytecode_dir else "")
+    with _envs_lock:
+        env = _envs.get(key)
+        if env is None:
+            bcc = None
+            if bytecode_dir:
+                os.makedirs(bytecode_dir, exist_ok=True)
+                bcc = FileSystemBytecodeCache(bytecode_dir)
+            env = Environment(
+                loader=FileSystemLoader(template_dir),
+                autoescape=select_autoescape(["html", "xml"]),
+                bytecode_cache=bcc,
+            )
+            _envs[key] = env
+        return env
+
+
+class TemplateRenderer:
+    """One template of a shared Environment, loaded (compiled) at construction."""
+
+    def __init__(
+        self,
+        template_dir: str = DEFAULT_TEMPLATE_DIR,
+        template_name: str = "report.html.j2",
+        bytecode_dir: str | None = DEFAULT_BYTECODE_DIR,
+    ):
+        self.template_name = template_name
+        self.env = get_environment(template_dir, bytecode_dir)
+        self.env.get_template(template_name)  # precompile (+ 바이트코드 캐시 기록)
+
+    def render(self, **context: Any) -> str:
+        # Environment 메모리 캐시에서 조회 (소스 변경 시에만 재로딩)
+        return self.env.get_template(self.template_name).render(**context)
+
+
+__all__ = ["TemplateRenderer", "get_environment"]
@@ -0,0 +1,96 @@
+# agents/text_dedupe.py
+# Near-duplicate text detection (difflib ratio, exact) with cheap upper-bound filters
+#
+# [KO] 리포트 장·단점 불릿/근거 텍스트의 근사 중복 제거용 공용 모듈입니다.
+#      기존 `_dedupe_list`(모든 보존 항목과 SequenceMatcher.ratio 비교)와 **결과가 동일**하도록,
+#      ratio의 상한값으로 후보를 먼저 걸러내고 마지막 후보에만 ratio를 계산합니다.
+#        1) 길이 상한  real_quick_ratio = 2·min(la,lb)/(la+lb)  → 정렬된 길이 구간(bisect)으로 후보 축소
+#        2) 문자 멀티셋 교집합 상한  quick_ratio
+#        3) 보존 항목별 SequenceMatcher(seq2 고정) 재사용 → b 쪽 인덱스(b2j) 재계산 없음
+#      ※ MinHash/Jaccard 같은 근사 기법은 0.88 경계에서 결과가 달라질 수 있어 사용하지 않습니다.
+
+from __future__ import annotations
+
+import bisect
+import math
+from collections import Counter
+from difflib import SequenceMatcher
+from typing import Iterable, List
+
+
+class NearDuplicateIndex:
+    """
+    Keeps accepted texts; `add(s)` accepts `s` unless some kept `t` has
+    SequenceMatcher(None, s, t).ratio() >= thresh.
+    """
+
+    def __init__(self, thresh: float = 0.88):
+        self.thresh = float(thresh)
+        # ratio >= thresh 이려면 min/max 길이비 >= thresh / (2 - thresh)
+        self._len_ratio = self.thresh / (2.0 - self.thresh) if self.thresh < 2.0 else math.inf
+        self.items: List[str] = []
+        self._lens: List[int] = []  # 정렬된 길이
+        self._by_len: List[int] = []  # _lens와 같은 순서의 items 인덱스
+        self._counts: List[Counter] = []
+        self._matchers: List[SequenceMatcher] = []
+        self.full_compares = 0  # 실제 ratio 계산 횟수 (벤치마크용)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def is_duplicate(self, s: str) -> bool:
+        la = len(s)
+        if not self._lens:
+            return False
+        lo = bisect.bisect_left(self._lens, math.floor(la * self._len_ratio) - 1)
+        hi = bisect.bisect_right(
+            self._lens, math.ceil(la / self._len_ratio) + 1 if self._len_ratio > 0 else math.inf
+        )
+        if lo >= hi:
+            return False
+
+        ca = None
+        thresh = self.thresh
+        for j in self._by_len[lo:hi]:  # 결과는 "하나라도 ratio >= thresh" 여부라 순서 무관
+            t = self.items[j]
+            total = la + len(t)
+            if not total or 2.0 * min(la, len(t)) / total < thresh:
+                continue
+            if ca is None:
+                ca = Counter(s)
+            if 2.0 * sum((ca & self._counts[j]).values()) / total < thresh:
+                continue
+            m = self._matchers[j]
+            m.set_seq1(s)
+            self.full_compares += 1
+            if m.ratio() >= thresh:
+                return True
+        return False
+
+    def add(self, s: str) -> bool:
+        """Keep `s` if it is not a near duplicate; returns True when kept."""
+        if self.is_duplicate(s):
+            return False
+        idx = len(self.items)
+        self.items.append(s)
+        self._counts.append(Counter(s))
+        m = SequenceMatcher(None)
+        m.set_seq2(s)
+        self._matchers.append(m)
+        pos = bisect.bisect_right(self._lens, len(s))
+        self._lens.insert(pos, len(s))
+        self._by_len.insert(pos, idx)
+        return True
+
+
+def dedupe_texts(items: Iterable[str], thresh: float = 0.88) -> List[str]:
+    """Order-preserving near-duplicate removal (strips, drops empties)."""
+    index = NearDuplicateIndex(thresh)
+    for s in items or []:
+        s = (s or "").strip()
+        if s:
+            index.add(s)
+    return index.items
+
+
+__all__ = ["NearDuplicateIndex", "dedupe_texts"]
@@ -0,0 +1,105 @@
+# Agentic RAG v2 - Level-gated diagnostics with an optional JSONL trace sink
+# Python 3.11+
+#
+# [KO] 에이전트 내부 루프(축별 채점 상세, 페이지별 크롤링, 회사별 검색)의 진단 출력을 위한 모듈입니다.
+#      - enabled(level): 로거 레벨 또는 trace sink 가 해당 레벨을 받는지 확인
+#        → 호출 측은 `if diagnostics.enabled(...)` 로 감싸 비활성 시 문자열/집계 작업 자체를 생략
+#      - emit(event, level, msg, *args, **fields): 로그 1줄 + (sink 활성 시) JSONL 레코드 1줄
+#      - trace sink: open_trace(path) / close_trace() 또는 DIAG_TRACE=<path> 환경변수
+#        graph/run.py --trace 는 outputs/logs/run_YYYYMMDD_HHMM.trace.jsonl 로 기록합니다.
+#
+#      이벤트 이름 규약: "<단계>.<항목>"  (예: scoring.axis, augment.page, rag.company)
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional, TextIO
+
+_logger = logging.getLogger("diag")
+_lock = threading.Lock()
+
+
+class _TraceSink:
+    """Append-only JSONL writer shared by all threads."""
+
+    def __init__(self, path: str, level: int):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.level = level
+        self._f: TextIO = open(path, "a", encoding="utf-8")
+
+    def write(self, event: str, level: int, fields: dict) -> None:
+        record = {
+            "ts": round(time.time(), 6),
+            "event": event,
+            "level": logging.getLevelName(level),
+            "thread": threading.current_thread().name,
+            **fields,
+        }
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        with _lock:
+            if not self._f.closed:
+                self._f.write(line)
+
+    def close(self) -> None:
+        with _lock:
+            self._f.close()
+
+
+_sink: Optional[_TraceSink] = None
+
+
+def enabled(level: int = logging.DEBUG) -> bool:
+    """True if a diagnostic at `level` would be logged or traced."""
+    sink = _sink
+    return _logger.isEnabledFor(level) or (sink is not None and level >= sink.level)
+
+
+def emit(event: str, level: int, msg: Optional[str] = None, *args: Any, **fields: Any) -> None:
+    """Log `msg % args` at `level` and write `fields` to the trace sink (guard with enabled())."""
+    if msg is not None and _logger.isEnabledFor(level):
+        _logger.log(level, msg, *args)
+    sink = _sink
+    if sink is not None and level >= sink.level:
+        sink.write(event, level, fields)
+
+
+def open_trace(path: str, level: int = logging.DEBUG) -> str:
+    """Start writing diagnostics at `level` and above to a JSONL file."""
+    global _sink
+    close_trace()
+    _sink = _TraceSink(path, level)
+    return path
+
+
+def close_trace() -> None:
+    global _sink
+    sink, _sink = _sink, None
+    if sink is not None:
+        sink.close()
+
+
+@contextmanager
+def trace(path: str, level: int = logging.DEBUG) -> Iterator[str]:
+    open_trace(path, level)
+    try:
+        yield path
+    finally:
+        close_trace()
+
+
+def trace_from_env() -> Optional[str]:
+    """Open the sink named by DIAG_TRACE (level: DIAG_TRACE_LEVEL, default DEBUG)."""
+    path = os.getenv("DIAG_TRACE", "").strip()
+    if not path:
+        return None
+    level = logging.getLevelName(os.getenv("DIAG_TRACE_LEVEL", "DEBUG").strip().upper())
+    return open_trace(path, level if isinstance(level, int) else logging.DEBUG)
+
+
+__all__ = ["enabled", "emit", "open_trace", "close_trace", "trace", "trace_from_env"]
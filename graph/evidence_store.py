@@ -0,0 +1,335 @@
+# Agentic RAG v2 - SQLite-backed evidence store (chunks referenced by integer id)
+# Python 3.11+
+#
+# [KO] Augment 단계가 수집한 청크(Evidence)를 파이썬 객체 리스트 대신 SQLite 파일에 저장하고,
+#      PipelineState 에는 행 ID(chunk_ids)와 저장소 경로(evidence_store)만 남깁니다.
+#      - 출처(URL)는 sources 테이블에 1회만 저장 (interning), 근거 행은 source_id 로 참조
+#      - 동일 근거(출처/본문/카테고리/강도/게시일)는 같은 ID 로 중복 제거
+#      - 본문(text)은 필요한 곳(청크 폴백 매칭, 보고서)에서 배치 단위로만 읽어 Evidence 로 복원
+#      - 여러 스레드(streaming/fan-out)에서 같은 파일을 공유: open_store(path) 로 연결 1개 재사용
+#      - 보존 기간: 행마다 마지막 사용 시각(last_used, 적재/touch 시 갱신)을 기록하고,
+#        prune(max_age_s) 가 보존 기간보다 오래 쓰이지 않은 행과 고아 출처를 삭제
+#        (graph.run 이 실행 시작 시 호출; EVIDENCE_STORE_RETENTION_DAYS 또는
+#        --evidence-retention-days, 기본 30일, 0 이면 삭제 안 함). 삭제된 페이지는 SQLite 가
+#        재사용하므로 매일 전체 실행에서도 파일 크기는 보존 기간 분량에서 멈춤
+#
+#      사용 예)
+#        store = open_store("outputs/cache/evidence.sqlite")
+#        state.chunk_ids += store.add(evidences); state.evidence_store = store.path
+#        for ev in iter_chunks(state): ...
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, overload
+
+from .state import Evidence, PipelineState, trusted_evidence
+
+DEFAULT_STORE_PATH = "outputs/cache/evidence.sqlite"
+DEFAULT_RETENTION_DAYS = 30.0
+_BATCH = 500  # SQLite 변수 개수 제한(999) 이하
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    id  INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS evidence (
+    id        INTEGER PRIMARY KEY,
+    key       BLOB NOT NULL UNIQUE,
+    source_id INTEGER NOT NULL REFERENCES sources(id),
+    category  TEXT NOT NULL,
+    strength  TEXT NOT NULL,
+    published TEXT,
+    text      TEXT NOT NULL,
+    last_used INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+# (id, source, category, strength, published)
+EvidenceMeta = Tuple[int, str, str, str, Optional[str]]
+
+
+def store_from_env() -> Optional[str]:
+    """Store path from EVIDENCE_STORE (default DEFAULT_STORE_PATH); None for 'off'/'0'."""
+    path = os.getenv("EVIDENCE_STORE", DEFAULT_STORE_PATH).strip()
+    return None if path.lower() in {"", "0", "off", "false", "none"} else path
+
+
+def retention_days_from_env() -> float:
+    """EVIDENCE_STORE_RETENTION_DAYS (default DEFAULT_RETENTION_DAYS); 0 disables pruning."""
+    try:
+        return max(0.0, float(os.getenv("EVIDENCE_STORE_RETENTION_DAYS", DEFAULT_RETENTION_DAYS)))
+    except ValueError:
+        return DEFAULT_RETENTION_DAYS
+
+
+def _key(source: str, text: str, category: str, strength: str, published: Optional[str]) -> bytes:
+    raw = json.dumps([source, text, category, strength, published], ensure_ascii=False)
+    return hashlib.sha1(raw.encode("utf-8")).digest()
+
+
+class EvidenceStore:
+    """Evidence rows with interned sources, addressed by integer id."""
+
+    def __init__(self, path: str = DEFAULT_STORE_PATH):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._migrate()
+        self._lock = threading.Lock()
+        self._source_ids: Dict[str, int] = {}
+        self._source_urls: Dict[int, str] = {}
+
+    def _migrate(self) -> None:
+        """Add last_used to stores created before retention (existing rows count as used now)."""
+        cols = {row[1] for row in self._conn.execute("PRAGMA table_info(evidence)")}
+        if "last_used" not in cols:
+            self._conn.execute(
+                "ALTER TABLE evidence ADD COLUMN last_used INTEGER NOT NULL DEFAULT 0"
+            )
+            self._conn.execute("UPDATE evidence SET last_used = ?", (int(time.time()),))
+        self._conn.execute("CREATE INDEX IF NOT EXISTS evidence_last_used ON evidence(last_used)")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM evidence").fetchone()[0]
+
+    # -------------------- write --------------------
+    def _intern_sources(self, urls: Iterable[str]) -> None:
+        new = [u for u in dict.fromkeys(urls) if u not in self._source_ids]
+        if not new:
+            return
+        self._conn.executemany("INSERT OR IGNORE INTO sources(url) VALUES (?)", [(u,) for u in new])
+        for i in range(0, len(new), _BATCH):
+            part = new[i : i + _BATCH]
+            marks = ",".join("?" * len(part))
+            for sid, url in self._conn.execute(
+                f"SELECT id, url FROM sources WHERE url IN ({marks})", part
+            ):
+                url = sys.intern(url)
+                self._source_ids[url] = sid
+                self._source_urls[sid] = url
+
+    def add_rows(self, rows: Sequence[Tuple[str, str, str, str, Optional[str]]]) -> List[int]:
+        """Insert (source, text, category, strength, published) rows; ids in input order."""
+        if not rows:
+            return []
+        keys = [_key(*r) for r in rows]
+        with self._lock:
+            self._intern_sources(r[0] for r in rows)
+            self._conn.execute("BEGIN")
+            try:
+                now = int(time.time())
+                self._conn.executemany(
+                    "INSERT INTO evidence(key, source_id, category, strength, published, text,"
+                    " last_used) VALUES (?, ?, ?, ?, ?, ?, ?)"
+                    " ON CONFLICT(key) DO UPDATE SET last_used = excluded.last_used",
+                    [
+                        (k, self._source_ids[src], cat, st, pub, text, now)
+                        for k, (src, text, cat, st, pub) in zip(keys, rows)
+                    ],
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            ids: Dict[bytes, int] = {}
+            uniq = list(dict.fromkeys(keys))
+            for i in range(0, len(uniq), _BATCH):
+                part = uniq[i : i + _BATCH]
+                marks = ",".join("?" * len(part))
+                ids.update(
+                    self._conn.execute(f"SELECT key, id FROM evidence WHERE key IN ({marks})", part)
+                )
+        return [ids[k] for k in keys]
+
+    def add(self, evs: Iterable[Evidence]) -> List[int]:
+        """Insert Evidence objects; identical evidence maps to the same id."""
+        return self.add_rows([(e.source, e.text, e.category, e.strength, e.published) for e in evs])
+
+    # -------------------- retention --------------------
+    def touch(self, ids: Sequence[int]) -> None:
+        """Mark rows as used now (e.g. chunk_ids of a resumed checkpoint) so prune keeps them."""
+        now = int(time.time())
+        uniq = list(dict.fromkeys(ids))
+        with self._lock:
+            for i in range(0, len(uniq), _BATCH):
+                part = uniq[i : i + _BATCH]
+                marks = ",".join("?" * len(part))
+                self._conn.execute(
+                    f"UPDATE evidence SET last_used = ? WHERE id IN ({marks})", [now, *part]
+                )
+
+    def prune(self, max_age_s: float) -> int:
+        """Delete rows unused for longer than `max_age_s` and sources left without rows."""
+        cutoff = int(time.time() - max_age_s)
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                deleted = self._conn.execute(
+                    "DELETE FROM evidence WHERE last_used < ?", (cutoff,)
+                ).rowcount
+                if deleted:
+                    self._conn.execute(
+                        "DELETE FROM sources WHERE id NOT IN (SELECT source_id FROM evidence)"
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            if deleted:
+                # 삭제된 출처 ID 가 캐시에 남지 않도록 다시 조회
+                self._source_ids.clear()
+                self._source_urls.clear()
+        return deleted
+
+    # -------------------- read --------------------
+    def _fetch(self, ids: Sequence[int], with_text: bool) -> Dict[int, tuple]:
+        cols = "id, source_id, category, strength, published" + (", text" if with_text else "")
+        out: Dict[int, tuple] = {}
+        uniq = list(dict.fromkeys(ids))
+        with self._lock:
+            for i in range(0, len(uniq), _BATCH):
+                part = uniq[i : i + _BATCH]
+                marks = ",".join("?" * len(part))
+                for row in self._conn.execute(
+                    f"SELECT {cols} FROM evidence WHERE id IN ({marks})", part
+                ):
+                    out[row[0]] = row
+            missing = {r[1] for r in out.values()} - self._source_urls.keys()
+            if missing:
+                for sid, url in self._conn.execute(
+                    f"SELECT id, url FROM sources WHERE id IN ({','.join('?' * len(missing))})",
+                    list(missing),
+                ):
+                    url = sys.intern(url)
+                    self._source_ids[url] = sid
+                    self._source_urls[sid] = url
+        return out
+
+    def meta(self, ids: Sequence[int]) -> List[EvidenceMeta]:
+        """(id, source, category, strength, published) per id, without loading text."""
+        rows = self._fetch(ids, with_text=False)
+        urls = self._source_urls
+        return [(i, urls[rows[i][1]], rows[i][2], rows[i][3], rows[i][4]) for i in ids]
+
+    def get(self, ids: Sequence[int]) -> List[Evidence]:
+        """Materialize Evidence objects (with text) in `ids` order."""
+        rows = self._fetch(ids, with_text=True)
+        urls = self._source_urls
+        out = []
+        for i in ids:
+            _, sid, cat, st, pub, text = rows[i]
+            out.append(trusted_evidence(urls[sid], text, cat, st, pub))
+        return out
+
+    def iter_evidence(self, ids: Sequence[int], batch: int = 2000) -> Iterator[Evidence]:
+        """Stream Evidence objects batch by batch (only one batch of text in memory)."""
+        for i in range(0, len(ids), batch):
+            yield from self.get(ids[i : i + batch])
+
+
+class StoredChunks(Sequence[Evidence]):
+    """Read-only sequence view over store ids; iteration is batched, indexing is lazy."""
+
+    def __init__(self, store: EvidenceStore, ids: Sequence[int]):
+        self.store = store
+        self.ids = list(ids)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @overload
+    def __getitem__(self, i: int) -> Evidence: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> List[Evidence]: ...
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return self.store.get(self.ids[i])
+        return self.store.get([self.ids[i]])[0]
+
+    def __iter__(self) -> Iterator[Evidence]:
+        return self.store.iter_evidence(self.ids)
+
+    def take(self, indices: Sequence[int]) -> List[Evidence]:
+        """Evidence at several positions with one batched read."""
+        return self.store.get([self.ids[i] for i in indices])
+
+
+# ─────────────────────────────────────────────────────────────
+# 경로별 공유 연결 + PipelineState 헬퍼
+# ─────────────────────────────────────────────────────────────
+
+_stores: Dict[str, EvidenceStore] = {}
+_stores_lock = threading.Lock()
+
+
+def open_store(path: str = DEFAULT_STORE_PATH) -> EvidenceStore:
+    """Shared EvidenceStore per file path (one connection per process)."""
+    key = path if path == ":memory:" else os.path.abspath(path)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = EvidenceStore(path)
+        return store
+
+
+def close_stores() -> None:
+    with _stores_lock:
+        for store in _stores.values():
+            store.close()
+        _stores.clear()
+
+
+def state_chunks(state: PipelineState) -> Sequence[Evidence]:
+    """All chunks of `state`: in-memory `chunks` or a lazy view over `chunk_ids`."""
+    if not state.chunk_ids or not state.evidence_store:
+        return state.chunks
+    stored = StoredChunks(open_store(state.evidence_store), state.chunk_ids)
+    if not state.chunks:
+        return stored
+    return list(state.chunks) + list(stored)  # 혼합 상태(드묾): 전체 복원
+
+
+def iter_chunks(state: PipelineState) -> Iterator[Evidence]:
+    """Iterate in-memory chunks, then stored chunks batch by batch."""
+    yield from state.chunks
+    if state.chunk_ids and state.evidence_store:
+        yield from open_store(state.evidence_store).iter_evidence(state.chunk_ids)
+
+
+def chunk_count(state: PipelineState) -> int:
+    return len(state.chunks) + len(state.chunk_ids)
+
+
+__all__ = [
+    "DEFAULT_RETENTION_DAYS",
+    "DEFAULT_STORE_PATH",
+    "EvidenceMeta",
+    "EvidenceStore",
+    "StoredChunks",
+    "chunk_count",
+    "close_stores",
+    "iter_chunks",
+    "open_store",
+    "retention_days_from_env",
+    "state_chunks",
+    "store_from_env",
+]
@@ -0,0 +1,285 @@
+# Agentic RAG v2 - Streaming export of run results (chunks / evidence / scorecards)
+# Python 3.11+
+#
+# [KO] 실행 결과를 생성되는 즉시 파일에 덧붙여 쓰는 export 계층입니다 (전체를 메모리에 모으지 않음).
+#      - chunks     : JSONL (Augment 가 페이지 단위로 추가)
+#      - evidence   : Parquet (RAG 단계 직후, 회사별 축 근거)
+#      - scorecards : Parquet (Scoring 단계 직후, 회사 × 축 1행)
+#      - 경로: outputs/exports/run_id=<run>/<dataset>/company_id=<id>/part-00000.<ext>
+#        (Hive 파티션 → pyarrow.dataset / pandas / DuckDB 에서 컬럼 선택·파티션 필터로 읽기)
+#      - pyarrow 미설치 시 Parquet 대상도 JSONL 로 폴백 (manifest.json 에 실제 포맷 기록)
+#      - 회사별 버퍼는 flush_rows 행마다, 그리고 회사의 단계가 끝날 때마다 part 파일로 내려씀
+#
+#      graph/run.py 가 실행마다 open_export() 로 활성화하고 instrument(nodes) 로 rag/scoring 을 감쌉니다.
+
+from __future__ import annotations
+
+import glob
+import json
+import os
+import threading
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import quote
+
+from .state import Evidence, PipelineState, ScoreCard
+
+try:  # 선택 의존성
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - 환경에 따라 다름
+    pa = pq = None
+
+EXPORT_DIR = "outputs/exports"
+JSONL_DATASETS = ("chunks",)
+COLUMNAR_DATASETS = ("evidence", "scorecards")
+
+# Parquet 스키마 (파티션 컬럼 run_id/company_id 는 경로에만 존재)
+_SCHEMAS: Dict[str, List[Tuple[str, str]]] = {
+    "evidence": [
+        ("axis", "string"),
+        ("rank", "int32"),
+        ("source", "string"),
+        ("strength", "string"),
+        ("published", "string"),
+        ("text", "string"),
+    ],
+    "scorecards": [
+        ("axis", "string"),
+        ("value", "float64"),
+        ("confidence", "float64"),
+        ("notes", "string"),
+        ("n_evidence", "int32"),
+        ("total", "float64"),
+        ("decision", "string"),
+    ],
+}
+
+
+def parquet_available() -> bool:
+    return pq is not None
+
+
+# ─────────────────────────────────────────────────────────────
+# 레코드 변환
+# ─────────────────────────────────────────────────────────────
+
+
+def chunk_rows(evs: Iterable[Evidence]) -> Iterable[Dict[str, Any]]:
+    for e in evs:
+        yield {
+            "source": e.source,
+            "category": e.category,
+            "strength": e.strength,
+            "published": e.published,
+            "text": e.text,
+        }
+
+
+def evidence_rows(axis_map: Dict[str, List[Evidence]]) -> Iterable[Dict[str, Any]]:
+    for axis, evs in axis_map.items():
+        for rank, e in enumerate(evs):
+            yield {
+                "axis": axis,
+                "rank": rank,
+                "source": e.source,
+                "strength": e.strength,
+                "published": e.published,
+                "text": e.text,
+            }
+
+
+def scorecard_rows(card: ScoreCard) -> Iterable[Dict[str, Any]]:
+    for it in card.items:
+        yield {
+            "axis": it.key,
+            "value": it.value,
+            "confidence": it.confidence,
+            "notes": it.notes,
+            "n_evidence": len(it.evidence),
+            "total": card.total,
+            "decision": card.decision,
+        }
+
+
+# ─────────────────────────────────────────────────────────────
+# Exporter
+# ─────────────────────────────────────────────────────────────
+
+
+class RunExporter:
+    """Appends per-company records to a run_id/company_id-partitioned dataset tree."""
+
+    def __init__(
+        self,
+        run_id: str,
+        root: str = EXPORT_DIR,
+        columnar: str = "auto",
+        flush_rows: int = 2000,
+    ):
+        if columnar not in ("auto", "parquet", "jsonl"):
+            raise ValueError(f"columnar must be auto|parquet|jsonl, got {columnar!r}")
+        if columnar == "parquet" and pq is None:
+            raise RuntimeError("parquet export requested but `pyarrow` is not installed")
+        self.run_id = run_id
+        self.root = os.path.join(root, f"run_id={quote(run_id, safe='')}")
+        self.columnar_format = "parquet" if columnar != "jsonl" and pq is not None else "jsonl"
+        self.flush_rows = flush_rows
+        self._lock = threading.Lock()
+        self._buffers: Dict[Tuple[str, str], List[Dict[str, Any]]] = defaultdict(list)
+        self._parts: Dict[Tuple[str, str], int] = {}
+        self.rows: Dict[str, int] = defaultdict(int)
+        self.files: Dict[str, int] = defaultdict(int)
+
+    def format_of(self, dataset: str) -> str:
+        return "jsonl" if dataset in JSONL_DATASETS else self.columnar_format
+
+    def _partition_dir(self, dataset: str, company_id: str) -> str:
+        return os.path.join(self.root, dataset, f"company_id={quote(company_id or '_', safe='')}")
+
+    # -------------------- 쓰기 --------------------
+    def append(self, dataset: str, company_id: str, rows: Iterable[Dict[str, Any]]) -> int:
+        """Buffer rows for one company; JSONL rows are appended to disk right away."""
+        rows = list(rows)
+        if not rows:
+            return 0
+        key = (dataset, company_id)
+        with self._lock:
+            self.rows[dataset] += len(rows)
+            if dataset in JSONL_DATASETS:
+                self._write_jsonl(key, rows)
+                return len(rows)
+            buf = self._buffers[key]
+            buf.extend(rows)
+            if len(buf) >= self.flush_rows:
+                self._flush_key(key)
+        return len(rows)
+
+    def flush(self, company_id: Optional[str] = None) -> None:
+        """Write buffered rows (of one company, or all) as new part files."""
+        with self._lock:
+            for key in list(self._buffers):
+                if company_id is None or key[1] == company_id:
+                    self._flush_key(key)
+
+    def _next_part(self, key: Tuple[str, str], ext: str) -> str:
+        d = self._partition_dir(*key)
+        if key not in self._parts:
+            os.makedirs(d, exist_ok=True)
+            self._parts[key] = len(glob.glob(os.path.join(d, f"part-*.{ext}")))
+        n = self._parts[key]
+        self._parts[key] = n + 1
+        self.files[key[0]] += 1
+        return os.path.join(d, f"part-{n:05d}.{ext}")
+
+    def _write_jsonl(self, key: Tuple[str, str], rows: List[Dict[str, Any]]) -> None:
+        d = self._partition_dir(*key)
+        if key not in self._parts:
+            os.makedirs(d, exist_ok=True)
+            self._parts[key] = 1
+            self.files[key[0]] += 1
+        with open(os.path.join(d, "part-00000.jsonl"), "a", encoding="utf-8") as f:
+            f.writelines(json.dumps(r, ensure_ascii=False) + "\n" for r in rows)
+
+    def _flush_key(self, key: Tuple[str, str]) -> None:
+        rows = self._buffers.pop(key, None) or []
+        for i in range(0, len(rows), self.flush_rows):  # part 파일당 최대 flush_rows 행
+            part = rows[i : i + self.flush_rows]
+            if self.columnar_format == "parquet":
+                schema = pa.schema([(name, getattr(pa, t)()) for name, t in _SCHEMAS[key[0]]])
+                table = pa.Table.from_pylist(part, schema=schema)
+                pq.write_table(table, self._next_part(key, "parquet"), compression="zstd")
+            else:
+                with open(self._next_part(key, "jsonl"), "w", encoding="utf-8") as f:
+                    f.writelines(json.dumps(r, ensure_ascii=False) + "\n" for r in part)
+
+    # -------------------- 단계 연결 --------------------
+    def export_state(self, stage: str, state: PipelineState) -> None:
+        """Export what `stage` produced for the companies in `state`, then flush them."""
+        for c in state.companies:
+            if stage == "rag" and c.id in state.retrieved_evidence:
+                self.append("evidence", c.id, evidence_rows(state.retrieved_evidence[c.id]))
+            elif stage == "scoring" and c.id in state.scorecard:
+                self.append("scorecards", c.id, scorecard_rows(state.scorecard[c.id]))
+            self.flush(c.id)
+
+    def wrap(
+        self, stage: str, node: Callable[[PipelineState], PipelineState]
+    ) -> Callable[[PipelineState], PipelineState]:
+        def _node(state: PipelineState) -> PipelineState:
+            out = node(state)
+            self.export_state(stage, out)
+            return out
+
+        _node.__name__ = getattr(node, "__name__", stage)
+        return _node
+
+    def instrument(
+        self, nodes: Dict[str, Callable[[PipelineState], PipelineState]]
+    ) -> Dict[str, Callable[[PipelineState], PipelineState]]:
+        """Copy of `nodes` with rag/scoring wrapped to export their output per company."""
+        return {k: self.wrap(k, n) if k in ("rag", "scoring") else n for k, n in nodes.items()}
+
+    def close(self) -> Dict[str, Any]:
+        """Flush everything and write `manifest.json`; returns the manifest."""
+        self.flush()
+        manifest = {
+            "run_id": self.run_id,
+            "closed": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "datasets": {
+                ds: {"format": self.format_of(ds), "rows": self.rows[ds], "files": self.files[ds]}
+                for ds in (*JSONL_DATASETS, *COLUMNAR_DATASETS)
+                if self.rows[ds]
+            },
+            "partitioning": ["run_id", "company_id"],
+        }
+        os.makedirs(self.root, exist_ok=True)
+        with open(os.path.join(self.root, "manifest.json"), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False)
+        return manifest
+
+
+# ─────────────────────────────────────────────────────────────
+# 실행 단위 활성 exporter (에이전트는 current() 로 조회)
+# ─────────────────────────────────────────────────────────────
+
+_active: Optional[RunExporter] = None
+
+
+def open_export(run_id: str, root: str = EXPORT_DIR, columnar: str = "auto") -> RunExporter:
+    global _active
+    close_export()
+    _active = RunExporter(run_id, root=root, columnar=columnar)
+    return _active
+
+
+def current() -> Optional[RunExporter]:
+    return _active
+
+
+def close_export() -> Optional[Dict[str, Any]]:
+    global _active
+    exporter, _active = _active, None
+    return exporter.close() if exporter is not None else None
+
+
+def export_chunks(company_id: str, evs: Sequence[Evidence]) -> None:
+    """Append freshly crawled chunks to the active export (no-op when exporting is off)."""
+    exporter = _active
+    if exporter is not None:
+        exporter.append("chunks", company_id, chunk_rows(evs))
+
+
+__all__ = [
+    "EXPORT_DIR",
+    "RunExporter",
+    "chunk_rows",
+    "close_export",
+    "current",
+    "evidence_rows",
+    "export_chunks",
+    "open_export",
+    "parquet_available",
+    "scorecard_rows",
+]
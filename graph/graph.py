@@ -2,66 +2,29 @@
 # Python 3.11+
 #
 # [KO] 이 파일은 LangGraph 파이프라인의 "노드/엣지"를 정의합니다.
+#      - build_graph(): 6단계 선형 체인 (기본)
+#      - build_fanout_graph(): seraph → filter 후 회사별 하위 그래프를 Send로 병렬 실행
 
 from __future__ import annotations
 
-from typing import Any, Callable, Optional
+from typing import Any, Callable, TypedDict
 import logging
 
 # LangGraph
 try:
     from langgraph.graph import StateGraph, END
+    from langgraph.types import Send
 except Exception as e:  # pragma: no cover
     raise RuntimeError("[graph/graph.py] LangGraph import failed. Please install langgraph.") from e
 
-# Shared state
-from .state import PipelineState
+# Shared state / node resolution (graph/nodes.py는 langgraph 없이 임포트 가능)
+from .nodes import NodePool, load_nodes
+from .state import CompanyMeta, FanoutState, PipelineState
+from .stream import company_state
 
 logger = logging.getLogger(__name__)
 
 
-def _fallback_node_factory(name: str) -> Callable[[PipelineState], PipelineState]:
-    """Create a no-op node that only logs and returns the state."""
-
-    def _node(state: PipelineState) -> PipelineState:
-        logger.info(f"[fallback:{name}] pass-through (no-op)")
-        return state
-
-    _node.__name__ = f"fallback_{name}"
-    return _node
-
-
-def _resolve_agent(name: str, dotted: str) -> Callable[[PipelineState], PipelineState]:
-    """
-    Try to import a callable {Agent}.{__call__ or run}; otherwise return a no-op.
-    """
-    try:
-        module_path, attr = dotted.rsplit(".", 1)
-        mod = __import__(module_path, fromlist=[attr])
-        obj = getattr(mod, attr)
-        node = obj() if isinstance(obj, type) else obj
-        if not callable(node):
-            raise TypeError(f"{dotted} is not callable")
-        logger.info(f"[graph] resolved agent: {dotted}")
-        return node
-    except Exception as e:  # pragma: no cover
-        # ↓ 경고를 정보로 낮춰 노이즈 감소
-        logger.info(f"[graph] use fallback for {name} (reason: {e})")
-        return _fallback_node_factory(name)
-
-
-def load_nodes() -> dict[str, Callable[[PipelineState], PipelineState]]:
-    """Resolve all pipeline nodes (real agent or fallback)."""
-    return {
-        "seraph": _resolve_agent("seraph", "agents.seraph_agent.SeraphAgent"),
-        "filter": _resolve_agent("filter", "agents.filter_agent.FilterAgent"),
-        "augment": _resolve_agent("augment", "agents.augment_agent.AugmentAgent"),
-        "rag": _resolve_agent("rag", "agents.rag_retriever_agent.RAGRetrieverAgent"),
-        "scoring": _resolve_agent("scoring", "agents.scoring_agent.ScoringAgent"),
-        "report": _resolve_agent("report", "agents.report_writer_agent.ReportWriterAgent"),
-    }
-
-
 def build_graph() -> Any:
     """Build and compile the LangGraph pipeline."""
     nodes = load_nodes()
@@ -97,3 +60,85 @@ def run_step_by_step(state: PipelineState) -> PipelineState:
     for key in ("seraph", "filter", "augment", "rag", "scoring", "report"):
         state = nodes[key](state)
     return state
+
+
+# ─────────────────────────────────────────────────────────────
+# [KO] Fan-out(map-reduce) 그래프
+#     seraph → filter → Send("company", …) × N → join → END
+#     - company 노드: 회사 1곳에 대해 augment → rag → scoring → report 실행
+#     - 병렬 분기 결과는 FanoutState의 reducer로 병합
+#     - 에이전트는 _state_ref 등 호출 단위 상태를 가지므로 분기마다 풀에서 1벌을 빌려 사용
+#       (LangGraph 는 invoke 마다 새 스레드를 쓰므로 스레드별이 아닌 NodePool 로 재사용)
+# ─────────────────────────────────────────────────────────────
+
+COMPANY_STAGES: tuple[str, ...] = ("augment", "rag", "scoring", "report")
+
+
+class CompanyTask(TypedDict):
+    """Send payload for one per-company branch."""
+
+    query: str
+    company: CompanyMeta
+
+
+def build_fanout_graph(
+    max_concurrency: int = 4,
+    node_factory: Callable[[tuple[str, ...]], dict[str, Callable]] = load_nodes,
+) -> Any:
+    """
+    Build a LangGraph pipeline that fans out per-company work with `Send`.
+    `max_concurrency` caps how many company branches run at once.
+    """
+    head = node_factory(("seraph", "filter"))
+    workers = NodePool(COMPANY_STAGES, node_factory)
+
+    def _companies_only(key: str) -> Callable[[FanoutState], dict]:
+        node = head[key]
+
+        def _node(state: FanoutState) -> dict:
+            # [KO] 전체 state를 반환하면 reducer 필드(chunks 등)가 중복 병합되므로 companies만 반환
+            return {"companies": node(state).companies}
+
+        _node.__name__ = f"{key}_companies"
+        return _node
+
+    def _dispatch(state: FanoutState):
+        if not state.companies:
+            return "join"
+        return [Send("company", {"query": state.query, "company": c}) for c in state.companies]
+
+    def _company(task: CompanyTask) -> dict:
+        sub = company_state(PipelineState(query=task["query"]), task["company"])
+        with workers.borrow() as nodes:
+            for key in COMPANY_STAGES:
+                try:
+                    sub = nodes[key](sub)
+                except Exception as e:
+                    logger.exception(f"[Fanout:{key}] {task['company'].id} failed: {e}")
+        return {
+            "chunks": sub.chunks,
+            "chunk_ids": sub.chunk_ids,
+            "evidence_store": sub.evidence_store,
+            "retrieved_evidence": sub.retrieved_evidence,
+            "scorecard": sub.scorecard,
+            "reports": sub.reports,
+            "company_updates": {c.id: c for c in sub.companies},
+        }
+
+    def _join(state: FanoutState) -> dict:
+        updates = state.company_updates
+        return {"companies": [updates.get(c.id, c) for c in state.companies]}
+
+    g = StateGraph(FanoutState)
+    g.add_node("seraph", _companies_only("seraph"))
+    g.add_node("filter", _companies_only("filter"))
+    g.add_node("company", _company, input_schema=CompanyTask)
+    g.add_node("join", _join)
+
+    g.set_entry_point("seraph")
+    g.add_edge("seraph", "filter")
+    g.add_conditional_edges("filter", _dispatch, ["company", "join"])
+    g.add_edge("company", "join")
+    g.add_edge("join", END)
+
+    return g.compile().with_config({"max_concurrency": max(1, int(max_concurrency))})
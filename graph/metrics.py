@@ -0,0 +1,64 @@
+# Agentic RAG v2 - Lightweight run counters
+# Python 3.11+
+#
+# [KO] 에이전트가 외부 호출(HTTP/LLM/임베딩) 수와 바이트/토큰을 기록하는 카운터입니다.
+#      - incr(): 프로세스 전체 합계 + 현재 스레드의 측정 scope에 동시에 누적
+#      - scope(): graph/profiling.py가 노드 호출을 감싸 단계/회사별로 집계할 때 사용
+#      - streaming 모드처럼 단계가 서로 다른 스레드에서 겹쳐 실행되어도 귀속이 정확합니다.
+#
+#      카운터 이름 규약: "<종류>.<항목>"  (예: http.requests, http.bytes, llm.calls, llm.tokens,
+#                                          embed.calls, embed.tokens)
+
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+
+_totals: Counter = Counter()
+_lock = threading.Lock()
+_local = threading.local()
+
+
+def incr(name: str, n: int = 1) -> None:
+    """Add `n` to counter `name` (process total and the active thread scope)."""
+    if not n:
+        return
+    with _lock:
+        _totals[name] += n
+    scope_counter = getattr(_local, "scope", None)
+    if scope_counter is not None:
+        scope_counter[name] += n
+
+
+def usage_tokens(usage: Any) -> int:
+    """Best-effort total token count from an OpenAI/LangChain usage object or dict."""
+    if usage is None:
+        return 0
+    if isinstance(usage, dict):
+        return int(usage.get("total_tokens") or 0)
+    return int(getattr(usage, "total_tokens", 0) or 0)
+
+
+@contextmanager
+def scope() -> Iterator[Counter]:
+    """Collect counters incremented by the current thread inside the block."""
+    prev = getattr(_local, "scope", None)
+    counter: Counter = Counter()
+    _local.scope = counter
+    try:
+        yield counter
+    finally:
+        _local.scope = prev
+        if prev is not None:
+            prev.update(counter)  # 중첩 scope는 바깥 scope에도 반영
+
+
+def snapshot() -> Dict[str, int]:
+    """Process-wide totals so far."""
+    with _lock:
+        return dict(_totals)
+
+
+__all__ = ["incr", "usage_tokens", "scope", "snapshot"]
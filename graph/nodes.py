@@ -0,0 +1,198 @@
+# Agentic RAG v2 - Pipeline node resolution
+# Python 3.11+
+#
+# [KO] NODE_SPECS의 에이전트를 노드(callable)로 해석합니다. (graph.py / run.py / server.py 공용)
+#      - langgraph 없이 임포트 가능 → CLI/서버 기동 시 LangGraph 로딩 불필요
+#      - load_nodes()는 기본적으로 LazyNode를 반환: 에이전트 모듈(openai, chromadb, bs4,
+#        pdfplumber, playwright, langchain_openai …)은 해당 단계가 처음 실행될 때 임포트
+#      - 구현이 없거나 초기화에 실패하면 통과(no-op) 노드로 대체
+#      - 단계별 생성자 인자는 config={"scoring": {...}, ...} 로 전달
+#        (지정하지 않으면 node_config_from_env() 의 환경변수 기본값 사용)
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from .state import PipelineState
+
+logger = logging.getLogger(__name__)
+
+
+def _fallback_node_factory(name: str) -> Callable[[PipelineState], PipelineState]:
+    """Create a no-op node that only logs and returns the state."""
+
+    def _node(state: PipelineState) -> PipelineState:
+        logger.info(f"[fallback:{name}] pass-through (no-op)")
+        return state
+
+    _node.__name__ = f"fallback_{name}"
+    return _node
+
+
+NodeConfig = Dict[str, Dict[str, Any]]
+
+
+def _env_flag(name: str, default: str = "0") -> bool:
+    return os.getenv(name, default).strip().lower() in {"1", "true", "on", "yes"}
+
+
+def node_config_from_env() -> NodeConfig:
+    """
+    Per-stage agent constructor kwargs derived from environment defaults.
+    Stages not listed here (e.g. report) read their own env defaults for unset kwargs.
+    """
+    return {
+        "scoring": {"incremental": not _env_flag("SCORING_FORCE")},
+    }
+
+
+def _resolve_agent(
+    name: str, dotted: str, kwargs: Optional[Dict[str, Any]] = None
+) -> Callable[[PipelineState], PipelineState]:
+    """
+    Try to import a callable {Agent}.{__call__ or run}; otherwise return a no-op.
+    """
+    try:
+        module_path, attr = dotted.rsplit(".", 1)
+        mod = __import__(module_path, fromlist=[attr])
+        obj = getattr(mod, attr)
+        node = obj(**(kwargs or {})) if isinstance(obj, type) else obj
+        if not callable(node):
+            raise TypeError(f"{dotted} is not callable")
+        logger.info(f"[graph] resolved agent: {dotted}")
+        return node
+    except Exception as e:  # pragma: no cover
+        # ↓ 경고를 정보로 낮춰 노이즈 감소
+        logger.info(f"[graph] use fallback for {name} (reason: {e})")
+        return _fallback_node_factory(name)
+
+
+NODE_SPECS: dict[str, str] = {
+    "seraph": "agents.seraph_agent.SeraphAgent",
+    "filter": "agents.filter_agent.FilterAgent",
+    "augment": "agents.augment_agent.AugmentAgent",
+    "rag": "agents.rag_retriever_agent.RAGRetrieverAgent",
+    "scoring": "agents.scoring_agent.ScoringAgent",
+    "report": "agents.report_writer_agent.ReportWriterAgent",
+}
+
+
+class LazyNode:
+    """
+    Node proxy that imports/constructs its agent on the first call (or resolve()).
+    Keeps a stage's heavy dependencies (openai, chromadb, playwright …) out of startup.
+    """
+
+    def __init__(self, name: str, dotted: str, kwargs: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.dotted = dotted
+        self.kwargs = dict(kwargs or {})
+        self.__name__ = name
+        self._node: Optional[Callable[[PipelineState], PipelineState]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def resolved(self) -> bool:
+        return self._node is not None
+
+    def resolve(self) -> Callable[[PipelineState], PipelineState]:
+        if self._node is None:
+            with self._lock:
+                if self._node is None:
+                    self._node = _resolve_agent(self.name, self.dotted, self.kwargs)
+        return self._node
+
+    def __call__(self, state: PipelineState) -> PipelineState:
+        return (self._node or self.resolve())(state)
+
+
+def load_nodes(
+    keys: Optional[tuple[str, ...]] = None,
+    lazy: bool = True,
+    config: Optional[NodeConfig] = None,
+) -> dict[str, Callable[[PipelineState], PipelineState]]:
+    """
+    Pipeline nodes (real agent or fallback). `keys` limits which ones.
+    With lazy=True (default) agents are imported on their first call.
+    `config` maps a stage to its agent's constructor kwargs (default: node_config_from_env()).
+    """
+    keys = keys or tuple(NODE_SPECS)
+    config = node_config_from_env() if config is None else config
+    if lazy:
+        return {k: LazyNode(k, NODE_SPECS[k], config.get(k)) for k in keys}
+    return {k: _resolve_agent(k, NODE_SPECS[k], config.get(k)) for k in keys}
+
+
+def resolve_nodes(nodes: dict[str, Callable]) -> dict[str, Callable]:
+    """Force resolution of lazy nodes (e.g. to warm a long-running worker)."""
+    for node in nodes.values():
+        if isinstance(node, LazyNode):
+            node.resolve()
+    return nodes
+
+
+class ThreadLocalNodes:
+    """Lazily resolve one set of nodes per worker thread."""
+
+    def __init__(
+        self,
+        keys: tuple[str, ...],
+        factory: Callable[[tuple[str, ...]], dict[str, Callable]] = load_nodes,
+    ):
+        self.keys = keys
+        self.factory = factory
+        self._local = threading.local()
+
+    def get(self) -> dict[str, Callable[[PipelineState], PipelineState]]:
+        nodes = getattr(self._local, "nodes", None)
+        if nodes is None:
+            nodes = self._local.nodes = self.factory(self.keys)
+        return nodes
+
+
+class NodePool:
+    """
+    Node sets lent to one caller at a time and reused afterwards (not bound to a thread).
+    For executors that start fresh threads per run (LangGraph fan-out branches).
+    """
+
+    def __init__(
+        self,
+        keys: tuple[str, ...],
+        factory: Callable[[tuple[str, ...]], dict[str, Callable]] = load_nodes,
+    ):
+        self.keys = keys
+        self.factory = factory
+        self.created = 0
+        self._free: list[dict[str, Callable]] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def borrow(self) -> Iterator[dict[str, Callable[[PipelineState], PipelineState]]]:
+        with self._lock:
+            nodes = self._free.pop() if self._free else None
+            if nodes is None:
+                self.created += 1
+        if nodes is None:
+            nodes = self.factory(self.keys)
+        try:
+            yield nodes
+        finally:
+            with self._lock:
+                self._free.append(nodes)
+
+
+__all__ = [
+    "NODE_SPECS",
+    "LazyNode",
+    "NodePool",
+    "NodeConfig",
+    "ThreadLocalNodes",
+    "load_nodes",
+    "node_config_from_env",
+    "resolve_nodes",
+]
@@ -0,0 +1,171 @@
+# Agentic RAG v2 - Stage-level run profiling
+# Python 3.11+
+#
+# [KO] load_nodes()가 반환한 노드를 감싸 단계(및 회사)별로 아래 항목을 기록합니다.
+#      - wall/CPU 시간 (CPU는 노드를 실행한 스레드 기준 → streaming 모드에서도 단계별 분리)
+#      - HTTP/LLM/임베딩 호출 수, 바이트/토큰 (graph/metrics.py scope)
+#      - RSS 시작/종료 및 프로세스 최대 RSS (resource 모듈이 없는 Windows 에서는 null)
+#      - (옵션) tracemalloc 파이썬 할당 피크: 프로세스 전역이므로 batch 모드에서만 정확
+#      결과는 outputs/logs/run_YYYYMMDD_HHMM.profile.json 으로 저장해 실행 간 비교에 사용합니다.
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from . import metrics
+from .state import PipelineState
+
+_MB = 1024 * 1024
+
+
+def _rss_mb() -> Optional[float]:
+    """Current resident set size in MB (Linux /proc, else peak RSS as fallback)."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            pages = int(f.read().split()[1])
+        return round(pages * os.sysconf("SC_PAGE_SIZE") / _MB, 1)
+    except Exception:
+        return _peak_rss_mb()
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Process peak RSS in MB, or None where the Unix-only resource module is missing."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 bytes, Linux는 KB 단위
+    return round(peak / _MB if sys.platform == "darwin" else peak / 1024, 1)
+
+
+@dataclass
+class StageRecord:
+    """One node invocation (a whole stage in batch mode, one company in stream mode)."""
+
+    stage: str
+    company_id: Optional[str]
+    started_s: float  # 실행 시작 시점 (run 시작 기준 초)
+    wall_s: float
+    cpu_s: float
+    rss_start_mb: Optional[float]
+    rss_end_mb: Optional[float]
+    peak_rss_mb: Optional[float]
+    py_peak_mb: Optional[float] = None
+    counters: Dict[str, int] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+class RunProfiler:
+    """Wrap pipeline nodes and collect per-stage / per-company measurements."""
+
+    def __init__(self, trace_alloc: bool = False):
+        self.trace_alloc = trace_alloc
+        self.records: List[StageRecord] = []
+        self._lock = threading.Lock()
+        self._t0 = time.perf_counter()
+        self._cpu0 = time.process_time()
+        self._started_at = datetime.now().isoformat(timespec="seconds")
+        if trace_alloc and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def wrap(
+        self, name: str, node: Callable[[PipelineState], PipelineState]
+    ) -> Callable[[PipelineState], PipelineState]:
+        def _profiled(state: PipelineState) -> PipelineState:
+            company_id = state.companies[0].id if len(state.companies) == 1 else None
+            if self.trace_alloc:
+                tracemalloc.reset_peak()
+            rss0 = _rss_mb()
+            started = time.perf_counter()
+            cpu0 = time.thread_time()
+            error: Optional[str] = None
+            with metrics.scope() as counters:
+                try:
+                    return node(state)
+                except Exception as e:
+                    error = f"{type(e).__name__}: {e}"
+                    raise
+                finally:
+                    rec = StageRecord(
+                        stage=name,
+                        company_id=company_id,
+                        started_s=round(started - self._t0, 3),
+                        wall_s=round(time.perf_counter() - started, 3),
+                        cpu_s=round(time.thread_time() - cpu0, 3),
+                        rss_start_mb=rss0,
+                        rss_end_mb=_rss_mb(),
+                        peak_rss_mb=_peak_rss_mb(),
+                        py_peak_mb=(
+                            round(tracemalloc.get_traced_memory()[1] / _MB, 1)
+                            if self.trace_alloc
+                            else None
+                        ),
+                        counters=dict(counters),
+                        error=error,
+                    )
+                    with self._lock:
+                        self.records.append(rec)
+
+        _profiled.__name__ = getattr(node, "__name__", name)
+        return _profiled
+
+    def instrument(
+        self, nodes: dict[str, Callable[[PipelineState], PipelineState]]
+    ) -> dict[str, Callable[[PipelineState], PipelineState]]:
+        """Return a copy of `nodes` with every node wrapped."""
+        return {name: self.wrap(name, node) for name, node in nodes.items()}
+
+    # -------------------- 요약/저장 --------------------
+    def stage_summary(self) -> Dict[str, Dict[str, Any]]:
+        """Aggregate records per stage (sum of wall/cpu/counters, max of peaks)."""
+        out: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            records = list(self.records)
+        for r in records:
+            agg = out.setdefault(
+                r.stage,
+                {"calls": 0, "wall_s": 0.0, "cpu_s": 0.0, "peak_rss_mb": None, "counters": {}},
+            )
+            agg["calls"] += 1
+            agg["wall_s"] = round(agg["wall_s"] + r.wall_s, 3)
+            agg["cpu_s"] = round(agg["cpu_s"] + r.cpu_s, 3)
+            if r.peak_rss_mb is not None:
+                agg["peak_rss_mb"] = max(agg["peak_rss_mb"] or 0.0, r.peak_rss_mb)
+            for k, v in r.counters.items():
+                agg["counters"][k] = agg["counters"].get(k, 0) + v
+        return out
+
+    def to_dict(self, **run_meta: Any) -> Dict[str, Any]:
+        with self._lock:
+            records = [asdict(r) for r in self.records]
+        return {
+            "run": {
+                "started_at": self._started_at,
+                "wall_s": round(time.perf_counter() - self._t0, 3),
+                "cpu_s": round(time.process_time() - self._cpu0, 3),
+                "peak_rss_mb": _peak_rss_mb(),
+                **run_meta,
+            },
+            "stages": self.stage_summary(),
+            "records": records,
+            "totals": metrics.snapshot(),
+        }
+
+    def write(self, path: Path, **run_meta: Any) -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(**run_meta), f, ensure_ascii=False, indent=2)
+        return path
+
+
+__all__ = ["RunProfiler", "StageRecord"]
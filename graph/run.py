@@ -5,6 +5,28 @@
 #      - argparse로 질의(--query)와 로그레벨을 받아 실행합니다.
 #      - rich.Progress로 주요 단계를 시각화합니다.
 #      - 로그 파일은 outputs/logs/run_YYYYMMDD_HHMM.log 로 저장합니다.
+#      - --mode stream: 회사별로 augment → rag → scoring → report 를 파이프라이닝 (graph/stream.py)
+#      - --report-mode html/deferred: PDF 변환 생략/지연 (state.reports는 준비된 HTML 경로)
+#      - --portfolio: 투자 대상 전체를 순위표 + 기업별 페이지의 통합 보고서 1개로 출력
+#      - 입력(점수/근거/템플릿/LLM 설정)이 그대로인 회사의 리포트는 재생성하지 않습니다 (--force-reports).
+#      - LLM 응답은 outputs/cache/llm 에 캐시됩니다 (--no-llm-cache 로 우회).
+#      - 단계별 프로파일(시간/호출 수/메모리)은 outputs/logs/run_YYYYMMDD_HHMM.profile.json 에 저장합니다.
+#      - --save-evidence: 스코어링 입력 근거를 outputs/evidence/run_YYYYMMDD_HHMM.json 에 저장합니다
+#        (python -m scripts.whatif_scoring 으로 가중치/게이트 what-if 분석; 스냅샷이 없으면
+#        rag/scoring 체크포인트를 입력으로 사용하므로 보통은 필요 없음).
+#      - 근거가 바뀌지 않은 (회사, 축) 점수는 outputs/cache/scoring 에서 재사용합니다 (--force-rescore).
+#        점수/결정 변화는 outputs/logs/score_changes.jsonl 에 기록됩니다.
+#      - 크롤링 청크는 outputs/cache/evidence.sqlite 근거 저장소에 두고 상태에는 ID만 보관합니다
+#        (EVIDENCE_STORE=off 로 기존 인메모리 방식, graph/evidence_store.py).
+#        실행 시작 시 보존 기간(--evidence-retention-days, 기본 30일)보다 오래 쓰이지 않은 근거는 삭제합니다.
+#      - --trace: 단계 내부 진단 이벤트(축별 채점, 페이지별 크롤링 등)를
+#        outputs/logs/run_YYYYMMDD_HHMM.trace.jsonl 로 기록합니다 (graph/diagnostics.py).
+#      - 단계별 상태 체크포인트: outputs/checkpoints/run_YYYYMMDD_HHMM/<stage>.ckpt (graph/checkpoint.py,
+#        --mode stream 도 단계 완료 시 같은 파일을 저장)
+#        --from-stage scoring [--checkpoint path] 로 앞 단계(크롤링/검색)를 건너뛰고 재시작
+#        (--checkpoint 만 주면 해당 체크포인트의 다음 단계부터, --no-checkpoint 로 저장 생략)
+#      - 실행 결과 export: outputs/exports/run_id=run_YYYYMMDD_HHMM/{chunks,evidence,scorecards}/
+#        company_id=<id>/ (chunks: JSONL, 나머지: Parquet[pyarrow 없으면 JSONL]) — --no-export 로 생략
 #      - agents/* 미구현 상태에서도 최소 실행이 가능하도록 설계되었습니다.
 #
 # [TIP]
@@ -25,8 +47,23 @@ from rich.table import Table
 from rich.progress import Progress, TextColumn, BarColumn, TimeElapsedColumn
 
 # [KO] 파이프라인 그래프/상태 임포트
-from .graph import load_nodes
+from . import diagnostics, export
+from .checkpoint import (
+    CHECKPOINT_DIR,
+    checkpoint_path,
+    latest_checkpoint,
+    load_checkpoint,
+    save_checkpoint,
+)
+from .evidence_store import open_store, retention_days_from_env, store_from_env
+from .nodes import NodeConfig, load_nodes, node_config_from_env
+from .profiling import RunProfiler
 from .state import PipelineState
+from .stream import STREAM_STAGES, run_streaming
+
+
+# [KO] 배치 모드의 단계 실행 순서 (체크포인트/재시작 기준)
+STAGE_ORDER: tuple[str, ...] = ("seraph", "filter", "augment", "rag", "scoring", "report")
 
 
 # ─────────────────────────────────────────────────────────────
@@ -45,7 +82,9 @@ def _ensure_dirs() -> dict[str, Path]:
     return {"root": root, "outputs": outputs, "logs": logs, "reports": reports}
 
 
-def _setup_logging(log_dir: Path, level: str = "INFO") -> tuple[Logger, Console]:
+def _setup_logging(
+    log_dir: Path, level: str = "INFO", ts: str | None = None
+) -> tuple[Logger, Console]:
     log_level = getattr(logging, level.upper(), logging.INFO)
 
     # ★ 하나의 Console 인스턴스 준비 (soft_wrap로 줄바꿈 자연스러움)
@@ -64,7 +103,7 @@ def _setup_logging(log_dir: Path, level: str = "INFO") -> tuple[Logger, Console]
     logger.addHandler(ch)
 
     # 파일 핸들러 (기존 유지)
-    ts = datetime.now().strftime("%Y%m%d_%H%M")
+    ts = ts or datetime.now().strftime("%Y%m%d_%H%M")
     fh = logging.FileHandler(log_dir / f"run_{ts}.log", encoding="utf-8")
     fh.setLevel(log_level)
     fh.setFormatter(
@@ -79,6 +118,34 @@ def _setup_logging(log_dir: Path, level: str = "INFO") -> tuple[Logger, Console]
     return logger, console
 
 
+def node_config(args: argparse.Namespace) -> NodeConfig:
+    """Agent constructor kwargs: CLI flags on top of the environment defaults."""
+    # [KO] 환경변수는 기본값으로만 사용하고 CLI 플래그는 os.environ 을 건드리지 않음
+    config = node_config_from_env()
+    if args.force_rescore:
+        config.setdefault("scoring", {})["incremental"] = False
+    report = config.setdefault("report", {})
+    if args.portfolio:
+        report["portfolio"] = True
+    if args.force_reports:
+        report["incremental"] = False
+    if args.report_mode:
+        report["report_mode"] = args.report_mode
+    if args.no_llm_cache:
+        report["llm_cache"] = False
+    return config
+
+
+def prune_evidence_store(state: PipelineState, retention_days: float) -> int:
+    """Drop evidence rows unused for `retention_days` (0 keeps all); resumed ids are kept."""
+    path = store_from_env()
+    if not path or retention_days <= 0 or not Path(path).exists():
+        return 0
+    if state.chunk_ids and state.evidence_store:
+        open_store(state.evidence_store).touch(state.chunk_ids)  # 재시작 체크포인트가 참조하는 행
+    return open_store(path).prune(retention_days * 86400)
+
+
 # ─────────────────────────────────────────────────────────────
 # [KO] 실행 본문
 # ─────────────────────────────────────────────────────────────
@@ -98,8 +165,9 @@ def main():
     parser.add_argument(
         "--query",
         type=str,
-        required=True,
-        help="Discovery query (e.g., 'AI financial advisory startup')",
+        default=None,
+        help="Discovery query (e.g., 'AI financial advisory startup'); "
+        "not needed when resuming from a checkpoint",
     )
     parser.add_argument(
         "--log-level",
@@ -108,17 +176,155 @@ def main():
         choices=["DEBUG", "INFO", "WARNING", "ERROR"],
         help="Logging level",
     )
+    parser.add_argument(
+        "--mode",
+        type=str,
+        default="batch",
+        choices=["batch", "stream"],
+        help="batch: stage-at-a-time / stream: per-company pipelined stages",
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=2,
+        help="Bounded queue size between streaming stages (stream mode only)",
+    )
+    parser.add_argument(
+        "--no-profile",
+        action="store_true",
+        help="Disable the per-stage run profile (outputs/logs/run_*.profile.json)",
+    )
+    parser.add_argument(
+        "--profile-alloc",
+        action="store_true",
+        help="Also trace Python allocation peaks per stage (tracemalloc, slower)",
+    )
+    parser.add_argument(
+        "--no-llm-cache",
+        action="store_true",
+        help="Bypass the on-disk LLM response cache (outputs/cache/llm)",
+    )
+    parser.add_argument(
+        "--report-mode",
+        type=str,
+        default=None,
+        choices=["pdf", "html", "deferred"],
+        help="pdf: HTML+PDF / html: HTML only / deferred: HTML now, PDF queued "
+        "(python -m scripts.render_pending_pdfs)",
+    )
+    parser.add_argument(
+        "--force-reports",
+        action="store_true",
+        help="Regenerate reports even when their input fingerprint is unchanged",
+    )
+    parser.add_argument(
+        "--portfolio",
+        action="store_true",
+        help="Render all invest companies into one portfolio report (one print job)",
+    )
+    parser.add_argument(
+        "--force-rescore",
+        action="store_true",
+        help="Rescore every axis even when its evidence fingerprint is unchanged",
+    )
+    parser.add_argument(
+        "--from-stage",
+        type=str,
+        default=None,
+        choices=list(STAGE_ORDER),
+        help="Resume at this stage from the checkpoint of the previous one",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=str,
+        default=None,
+        help="Checkpoint file to resume from (default: latest one of the previous stage)",
+    )
+    parser.add_argument(
+        "--no-checkpoint",
+        action="store_true",
+        help="Do not write per-stage checkpoints (outputs/checkpoints/run_*/<stage>.ckpt)",
+    )
+    parser.add_argument(
+        "--no-export",
+        action="store_true",
+        help="Do not stream chunks/evidence/scorecards to outputs/exports/run_id=*/",
+    )
+    parser.add_argument(
+        "--save-evidence",
+        action="store_true",
+        help="Also save scoring inputs to outputs/evidence/run_*.json for what-if runs "
+        "(scripts.whatif_scoring can read stage checkpoints instead)",
+    )
+    parser.add_argument(
+        "--evidence-retention-days",
+        type=float,
+        default=None,
+        help="Delete evidence-store rows unused for this many days at start "
+        "(default: EVIDENCE_STORE_RETENTION_DAYS or 30; 0 keeps everything)",
+    )
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="Write DEBUG-level diagnostic events to outputs/logs/run_*.trace.jsonl",
+    )
     args = parser.parse_args()
 
+    # 재시작 체크포인트 확인 (로그/출력 폴더 준비 전에 인자 오류를 보고)
+    start = STAGE_ORDER.index(args.from_stage) if args.from_stage else 0
+    resume_path = args.checkpoint
+    if resume_path is None and start > 0:
+        resume_path = latest_checkpoint(STAGE_ORDER[start - 1])
+        if resume_path is None:
+            parser.error(f"no checkpoint found for stage '{STAGE_ORDER[start - 1]}'")
+    if resume_path is None and not args.query:
+        parser.error("--query is required unless a checkpoint is loaded")
+
     # Prepare folders and logging
     paths = _ensure_dirs()
-    logger, console = _setup_logging(paths["logs"], args.log_level)
+    ts = datetime.now().strftime("%Y%m%d_%H%M")
+    logger, console = _setup_logging(paths["logs"], args.log_level, ts=ts)
 
     console.rule("[bold]Agentic RAG v2 — Run")
 
-    state = PipelineState(query=args.query)
+    # 진단 trace (JSONL): --trace 또는 DIAG_TRACE=<path>
+    if args.trace:
+        trace_path = diagnostics.open_trace(str(paths["logs"] / f"run_{ts}.trace.jsonl"))
+    else:
+        trace_path = diagnostics.trace_from_env()
+
+    # 체크포인트 재시작: 앞 단계 결과 상태를 로드하고 start 이전 단계는 건너뜀
+    if resume_path:
+        state, meta = load_checkpoint(resume_path)
+        if not args.from_stage and meta.get("stage") in STAGE_ORDER:
+            start = STAGE_ORDER.index(meta["stage"]) + 1
+        next_stage = STAGE_ORDER[start] if start < len(STAGE_ORDER) else "(done)"
+        logger.info(
+            f"[Checkpoint] resumed from {resume_path} (after stage={meta.get('stage')}, "
+            f"companies={meta.get('companies')}) → start at {next_stage}"
+        )
+    else:
+        state = PipelineState(query=args.query)
+
+    def pending(*keys: str) -> tuple[str, ...]:
+        return tuple(k for k in keys if STAGE_ORDER.index(k) >= start)
 
-    nodes = load_nodes()
+    # 근거 저장소 보존 기간 정리 (매일 전체 실행에서도 파일이 계속 커지지 않도록)
+    retention = args.evidence_retention_days
+    retention = retention_days_from_env() if retention is None else max(0.0, retention)
+    pruned = prune_evidence_store(state, retention)
+    if pruned:
+        logger.info(f"[EvidenceStore] pruned {pruned} rows unused for {retention:g} days")
+
+    ckpt_dir = None if args.no_checkpoint else str(Path(CHECKPOINT_DIR) / f"run_{ts}")
+
+    profiler = None if args.no_profile else RunProfiler(trace_alloc=args.profile_alloc)
+    nodes = load_nodes(config=node_config(args))
+    if profiler is not None:
+        nodes = profiler.instrument(nodes)
+    exporter = None if args.no_export else export.open_export(f"run_{ts}")
+    if exporter is not None:
+        nodes = exporter.instrument(nodes)
 
     # ★ Progress에도 같은 console 사용 + stdout/stderr 리다이렉트
     with Progress(
@@ -137,24 +343,85 @@ def main():
         t5 = progress.add_task("▶ Report (PDF)", total=1)
 
         # Seraph → Filter
-        state = run_step_by_step_step(state, steps=("seraph", "filter"), nodes=nodes)
+        state = run_step_by_step_step(
+            state, steps=pending("seraph", "filter"), nodes=nodes, checkpoint_dir=ckpt_dir
+        )
         progress.update(t1, advance=1)
 
-        # Augment
-        state = run_step_by_step_step(state, steps=("augment",), nodes=nodes)
-        progress.update(t2, advance=1)
+        if args.mode == "stream" and start <= STAGE_ORDER.index("augment"):
+            # [KO] 회사 단위 파이프라이닝: 진행률도 회사 수 기준으로 표시
+            stage_tasks = dict(zip(STREAM_STAGES, (t2, t3, t4, t5)))
+            n = len(state.companies)
+            for t in stage_tasks.values():
+                progress.update(t, total=max(1, n), completed=0 if n else 1)
+            state = run_streaming(
+                state,
+                nodes,
+                queue_size=args.queue_size,
+                on_progress=lambda stage, _sub: progress.update(stage_tasks[stage], advance=1),
+                checkpoint_dir=ckpt_dir,
+            )
+        else:
+            # Augment
+            state = run_step_by_step_step(
+                state, steps=pending("augment"), nodes=nodes, checkpoint_dir=ckpt_dir
+            )
+            progress.update(t2, advance=1)
+
+            # RAG
+            state = run_step_by_step_step(
+                state, steps=pending("rag"), nodes=nodes, checkpoint_dir=ckpt_dir
+            )
+            progress.update(t3, advance=1)
+
+            # Scoring
+            state = run_step_by_step_step(
+                state, steps=pending("scoring"), nodes=nodes, checkpoint_dir=ckpt_dir
+            )
+            progress.update(t4, advance=1)
+
+            # Report
+            state = run_step_by_step_step(
+                state, steps=pending("report"), nodes=nodes, checkpoint_dir=ckpt_dir
+            )
+            progress.update(t5, advance=1)
+
+    # ── 공유 HTTP 클라이언트 통계 (커넥션 재사용 확인용)
+    from agents.http_client import http_stats
+
+    if stats := http_stats():
+        logger.info(f"[HTTP] {stats}")
+
+    # ── 단계별 프로파일 저장
+    if profiler is not None:
+        for stage, agg in profiler.stage_summary().items():
+            logger.info(
+                f"[Profile] {stage}: wall={agg['wall_s']:.2f}s cpu={agg['cpu_s']:.2f}s "
+                f"peak_rss={agg['peak_rss_mb']}MB {agg['counters']}"
+            )
+        profile_path = profiler.write(
+            paths["logs"] / f"run_{ts}.profile.json",
+            query=args.query,
+            mode=args.mode,
+            companies=len(state.companies),
+            http=stats,
+        )
+        logger.info(f"[Profile] saved → {profile_path}")
+
+    # ── 스코어링 입력 근거 스냅샷 (what-if 재채점용, --save-evidence)
+    if args.save_evidence and state.companies:
+        from agents.scoring_scenarios import EVIDENCE_DIR, save_scoring_inputs
 
-        # RAG
-        state = run_step_by_step_step(state, steps=("rag",), nodes=nodes)
-        progress.update(t3, advance=1)
+        evidence_path = save_scoring_inputs(state, str(Path(EVIDENCE_DIR) / f"run_{ts}.json"))
+        logger.info(f"[Evidence] saved → {evidence_path}")
 
-        # Scoring
-        state = run_step_by_step_step(state, steps=("scoring",), nodes=nodes)
-        progress.update(t4, advance=1)
+    if exporter is not None:
+        manifest = export.close_export()
+        logger.info(f"[Export] {manifest['datasets']} → {exporter.root}")
 
-        # Report
-        state = run_step_by_step_step(state, steps=("report",), nodes=nodes)
-        progress.update(t5, advance=1)
+    if trace_path:
+        diagnostics.close_trace()
+        logger.info(f"[Trace] saved → {trace_path}")
 
     # ── 출력 요약
     _print_summary(console, state, paths["reports"])
@@ -166,15 +433,24 @@ def main():
 
 
 def run_step_by_step_step(
-    state: PipelineState, steps: tuple[str, ...], nodes=None
+    state: PipelineState,
+    steps: tuple[str, ...],
+    nodes=None,
+    checkpoint_dir: str | None = None,
 ) -> PipelineState:
     """
     Run a subset of nodes in fixed order.
     Pass a preloaded `nodes` dict to avoid re-resolving agents repeatedly.
+    With `checkpoint_dir`, the state after each node is saved as `<dir>/<step>.ckpt`.
     """
+    if not steps:
+        return state
     nodes = nodes or load_nodes()
     for key in steps:
         state = nodes[key](state)
+        if checkpoint_dir:
+            path = save_checkpoint(state, checkpoint_path(checkpoint_dir, key), stage=key)
+            logging.getLogger(__name__).info(f"[Checkpoint] {key} → {path}")
     return state
 
 
@@ -0,0 +1,265 @@
+# Agentic RAG v2 - Long-running local pipeline service
+# Python 3.11+
+#
+# [KO] `python -m graph.run` 은 질의마다 langgraph/openai/chromadb/playwright 임포트,
+#      에이전트 클라이언트 생성, Chroma HNSW 인덱스 로딩을 반복합니다.
+#      이 서버는 프로세스를 띄워 둔 채로 여러 질의를 받아 처리합니다.
+#      - 워커 스레드마다 load_nodes() 결과(에이전트 + OpenAI/Chroma 클라이언트)를 1벌씩 보관
+#        (에이전트는 호출 중 내부 상태를 쓰므로 스레드 간 공유하지 않음, graph.ThreadLocalNodes)
+#      - 기동 시 모든 워커를 미리 warm-up → 질의 지연에서 임포트/클라이언트/인덱스 로딩 제외
+#      - 공유 HTTP 커넥션 풀(agents/http_client.py)은 프로세스 전체에서 재사용
+#      - localhost HTTP API (표준 라이브러리 http.server)
+#          POST /run     {"query": "...", "mode": "batch" | "stream" | "fanout"}
+#                        → 점수/결정/리포트 경로 JSON (본문이 객체가 아니거나 mode 가 다르면 400)
+#          GET  /health  → {"status": "ok", ...}
+#          GET  /stats   → 처리 건수/지연/실행 중 건수 + HTTP/LLM/임베딩 카운터
+#
+# 실행: python -m graph.server --port 8765 --workers 2
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional
+
+from . import metrics
+from .nodes import NODE_SPECS, ThreadLocalNodes, load_nodes, resolve_nodes
+from .state import PipelineState
+from .stream import STREAM_STAGES, run_streaming
+
+logger = logging.getLogger(__name__)
+
+PIPELINE_STAGES: tuple[str, ...] = tuple(NODE_SPECS)
+RUN_MODES = ("batch", "stream", "fanout")
+
+
+# ─────────────────────────────────────────────────────────────
+# [KO] 파이프라인 실행 서비스 (HTTP와 무관하게 재사용 가능)
+# ─────────────────────────────────────────────────────────────
+
+
+class PipelineService:
+    """Worker pool whose threads each keep one warm set of pipeline nodes."""
+
+    def __init__(
+        self,
+        workers: int = 2,
+        node_factory: Callable[[tuple[str, ...]], dict[str, Callable]] = load_nodes,
+    ):
+        self.workers = max(1, int(workers))
+        self.node_factory = node_factory
+        self.nodes = ThreadLocalNodes(PIPELINE_STAGES, node_factory)
+        self._fanout: Any = None  # fan-out 그래프 (첫 fanout 요청 시 langgraph 임포트/컴파일)
+        self._fanout_lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="pipeline")
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Any] = {"queries": 0, "errors": 0, "running": 0, "total_s": 0.0}
+        self._started = time.time()
+        self.warm_s: Optional[float] = None
+
+    def warm(self, timeout: float = 600.0) -> float:
+        """Resolve nodes on every worker thread up front; returns seconds spent."""
+        started = time.perf_counter()
+        barrier = threading.Barrier(self.workers)
+
+        def _warm() -> None:
+            resolve_nodes(self.nodes.get())  # 지연(lazy) 노드도 여기서 임포트/생성
+            barrier.wait(timeout)  # 모든 워커 스레드가 각자 1건씩 맡도록 대기
+
+        for f in [self.executor.submit(_warm) for _ in range(self.workers)]:
+            f.result(timeout)
+        self.warm_s = round(time.perf_counter() - started, 3)
+        logger.info(f"[Server] {self.workers} workers warm in {self.warm_s:.1f}s")
+        return self.warm_s
+
+    def submit(self, query: str, mode: str = "batch") -> Future:
+        if mode not in RUN_MODES:
+            raise ValueError(f"mode must be one of {RUN_MODES}, got {mode!r}")
+        return self.executor.submit(self._run, query, mode)
+
+    def run(self, query: str, mode: str = "batch", timeout: Optional[float] = None) -> dict:
+        return self.submit(query, mode).result(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        from agents.http_client import http_stats
+
+        with self._lock:
+            out = dict(self._stats)
+        done = out["queries"]
+        out["avg_s"] = round(out.pop("total_s") / done, 3) if done else None
+        out.update(
+            workers=self.workers,
+            warm_s=self.warm_s,
+            uptime_s=round(time.time() - self._started, 1),
+            counters=metrics.snapshot(),
+            http=http_stats(),
+        )
+        return out
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+    # -------------------- internals --------------------
+    def _fanout_graph(self) -> Any:
+        with self._fanout_lock:
+            if self._fanout is None:
+                from .graph import build_fanout_graph
+
+                self._fanout = build_fanout_graph(
+                    max_concurrency=self.workers, node_factory=self.node_factory
+                )
+            return self._fanout
+
+    def _run(self, query: str, mode: str) -> dict:
+        nodes = self.nodes.get()
+        with self._lock:
+            self._stats["running"] += 1
+        started = time.perf_counter()
+        ok = False
+        try:
+            state = PipelineState(query=query)
+            with metrics.scope() as counters:
+                if mode == "stream":
+                    for key in ("seraph", "filter"):
+                        state = nodes[key](state)
+                    state = run_streaming(state, nodes, STREAM_STAGES)
+                elif mode == "fanout":
+                    out = self._fanout_graph().invoke(state)
+                    state = PipelineState.model_validate(
+                        {k: out[k] for k in PipelineState.model_fields if k in out}
+                    )
+                else:
+                    for key in PIPELINE_STAGES:
+                        state = nodes[key](state)
+            ok = True
+            return summarize(state, time.perf_counter() - started, dict(counters), mode=mode)
+        finally:
+            with self._lock:
+                self._stats["running"] -= 1
+                self._stats["queries" if ok else "errors"] += 1
+                if ok:
+                    self._stats["total_s"] += time.perf_counter() - started
+
+
+def summarize(state: PipelineState, elapsed_s: float, counters: dict, **meta: Any) -> dict:
+    """JSON-friendly run result: ranked companies, reports and per-query counters."""
+    rows = []
+    for c in state.companies:
+        sc = state.scorecard.get(c.id)
+        rows.append(
+            {
+                "id": c.id,
+                "name": c.name,
+                "total": sc.total if sc else None,
+                "decision": sc.decision if sc else None,
+                "report": state.reports.get(c.id),
+            }
+        )
+    rows.sort(key=lambda r: r["total"] if r["total"] is not None else -1.0, reverse=True)
+    return {
+        "query": state.query,
+        **meta,
+        "elapsed_s": round(elapsed_s, 3),
+        "companies": rows,
+        "reports": dict(state.reports),
+        "counters": counters,
+    }
+
+
+# ─────────────────────────────────────────────────────────────
+# [KO] localhost HTTP API
+# ─────────────────────────────────────────────────────────────
+
+
+def make_server(
+    service: PipelineService, host: str = "127.0.0.1", port: int = 8765
+) -> ThreadingHTTPServer:
+    """HTTP server bound to `service`; call serve_forever() / shutdown() on it."""
+
+    class Handler(BaseHTTPRequestHandler):
+        server_version = "AgenticRAG/2"
+
+        def do_GET(self) -> None:
+            if self.path == "/health":
+                self._send(200, {"status": "ok", "workers": service.workers})
+            elif self.path == "/stats":
+                self._send(200, service.stats())
+            else:
+                self._send(404, {"error": f"unknown path {self.path}"})
+
+        def do_POST(self) -> None:
+            if self.path != "/run":
+                self._send(404, {"error": f"unknown path {self.path}"})
+                return
+            try:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length) or b"{}")
+                if not isinstance(body, dict):
+                    raise ValueError("request body must be a JSON object")
+                query = str(body.get("query") or "").strip()
+                mode = body.get("mode") or "batch"
+                if not query:
+                    raise ValueError("'query' is required")
+                if not isinstance(mode, str) or mode not in RUN_MODES:
+                    raise ValueError(f"mode must be one of {RUN_MODES}, got {mode!r}")
+                future = service.submit(query, mode)
+            except ValueError as e:
+                self._send(400, {"error": str(e)})
+                return
+            try:
+                self._send(200, future.result())
+            except Exception as e:
+                logger.exception(f"[Server] query failed: {query!r}")
+                self._send(500, {"error": f"{type(e).__name__}: {e}"})
+
+        def _send(self, status: int, payload: dict) -> None:
+            data = json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, fmt: str, *args: Any) -> None:
+            logger.info(f"[Server] {self.address_string()} {fmt % args}")
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve the Agentic RAG v2 pipeline on localhost")
+    parser.add_argument("--host", type=str, default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=2, help="Concurrent pipeline runs")
+    parser.add_argument("--log-level", type=str, default="INFO")
+    args = parser.parse_args()
+    logging.basicConfig(
+        level=getattr(logging, args.log_level.upper(), logging.INFO),
+        format="%(asctime)s - %(levelname)s - %(message)s",
+    )
+
+    service = PipelineService(workers=args.workers)
+    service.warm()
+    server = make_server(service, args.host, args.port)
+    logger.info(f"[Server] listening on http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+
+
+__all__ = ["PipelineService", "make_server", "summarize"]
+
+
+if __name__ == "__main__":
+    main()
@@ -9,7 +9,8 @@
 
 from __future__ import annotations
 
-from typing import Literal, List, Dict, Optional
+import operator
+from typing import Annotated, Any, Literal, List, Dict, Optional, get_args
 from pydantic import BaseModel, Field
 
 # ─────────────────────────────────────────────────────────────
@@ -78,6 +79,145 @@ class ScoreCard(BaseModel):
     decision: DecisionType = "hold"
 
 
+# ─────────────────────────────────────────────────────────────
+# [KO] 내부 값으로 Evidence/ScoreItem/ScoreCard 를 대량 생성하는 고속 경로 (trusted_*)
+#     - 크롤링 청크, Chroma 메타데이터, 저장소 행, 채점/캐시 결과처럼 이미 정규화된 값에 사용
+#       (내부 생성 경로는 model_construct 대신 모두 이 함수를 사용)
+#     - 리터럴/타입/범위는 파이썬 수준에서 싸게 확인하고, 통과하면 pydantic 검증 없이 인스턴스 구성
+#     - 하나라도 어긋나면 일반 생성자로 넘겨 기존과 같은 ValidationError 를 냄
+#     - 모든 필드가 지정되므로 fields_set 은 전체 필드 이름 (인스턴스마다 별도 집합)
+#     - 인스턴스 슬롯(__dict__, __pydantic_fields_set__ …)을 직접 채우므로 pydantic 내부 구조에
+#       의존함 → 임포트 시 검증 생성자와 결과를 비교해 다르면(버전 변경 등) 검증 생성자만 사용
+#     ※ model_construct 는 파이썬 루프라 이 버전에서는 검증 생성자보다도 느림
+#       (python -m scripts.bench_evidence_construct)
+# ─────────────────────────────────────────────────────────────
+
+_CATEGORIES = frozenset(get_args(EvidenceCategory))
+_STRENGTHS = frozenset(get_args(EvidenceStrength))
+_DECISIONS = frozenset(get_args(DecisionType))
+_EVIDENCE_FIELDS = frozenset(Evidence.model_fields)
+_SCORE_ITEM_FIELDS = frozenset(ScoreItem.model_fields)
+_SCORE_CARD_FIELDS = frozenset(ScoreCard.model_fields)
+_new = object.__new__
+_set = object.__setattr__
+
+
+def _trusted(cls: type, values: Dict[str, Any], fields: frozenset) -> Any:
+    obj = _new(cls)
+    _set(obj, "__dict__", values)
+    _set(obj, "__pydantic_fields_set__", set(fields))
+    _set(obj, "__pydantic_extra__", None)
+    _set(obj, "__pydantic_private__", None)
+    return obj
+
+
+def _trusted_matches_validated() -> bool:
+    """Whether _trusted builds instances identical to validated ones on this pydantic."""
+    try:
+        ev = dict(source="s", text="t", category="team", strength="weak", published=None)
+        item = dict(key="team", value=1.0, confidence=0.5, notes="", evidence=[Evidence(**ev)])
+        card = dict(items=[ScoreItem(**item)], total=1.0, decision="hold")
+        for cls, values, fields in (
+            (Evidence, ev, _EVIDENCE_FIELDS),
+            (ScoreItem, item, _SCORE_ITEM_FIELDS),
+            (ScoreCard, card, _SCORE_CARD_FIELDS),
+        ):
+            fast, ref = _trusted(cls, dict(values), fields), cls(**values)
+            if (
+                fast != ref
+                or fast.model_dump() != ref.model_dump()
+                or fast.model_dump_json() != ref.model_dump_json()
+                or fast.model_fields_set != ref.model_fields_set
+                or cls.model_validate_json(fast.model_dump_json()) != ref
+            ):
+                return False
+        return True
+    except Exception:  # pragma: no cover - depends on pydantic internals
+        return False
+
+
+_TRUSTED_OK = _trusted_matches_validated()
+
+
+def trusted_evidence(
+    source: str,
+    text: str,
+    category: str,
+    strength: str = "weak",
+    published: Optional[str] = None,
+) -> Evidence:
+    """Evidence from internal values, skipping pydantic validation when they are well-formed."""
+    if (
+        _TRUSTED_OK
+        and type(source) is str
+        and type(text) is str
+        and category in _CATEGORIES
+        and strength in _STRENGTHS
+        and (published is None or type(published) is str)
+    ):
+        return _trusted(
+            Evidence,
+            {
+                "source": source,
+                "text": text,
+                "category": category,
+                "strength": strength,
+                "published": published,
+            },
+            _EVIDENCE_FIELDS,
+        )
+    return Evidence(
+        source=source, text=text, category=category, strength=strength, published=published
+    )
+
+
+def trusted_score_item(
+    key: str, value: float, confidence: float, notes: str, evidence: List[Evidence]
+) -> ScoreItem:
+    """ScoreItem from scoring output, skipping validation when values are in range."""
+    if (
+        _TRUSTED_OK
+        and key in _CATEGORIES
+        and type(value) is float
+        and 0.0 <= value <= 10.0
+        and type(confidence) is float
+        and 0.0 <= confidence <= 1.0
+        and type(notes) is str
+        and type(evidence) is list
+        and all(type(e) is Evidence for e in evidence)
+    ):
+        return _trusted(
+            ScoreItem,
+            {
+                "key": key,
+                "value": value,
+                "confidence": confidence,
+                "notes": notes,
+                "evidence": list(evidence),
+            },
+            _SCORE_ITEM_FIELDS,
+        )
+    return ScoreItem(key=key, value=value, confidence=confidence, notes=notes, evidence=evidence)
+
+
+def trusted_score_card(items: List[ScoreItem], total: float, decision: str) -> ScoreCard:
+    """ScoreCard from scoring output, skipping validation when values are in range."""
+    if (
+        _TRUSTED_OK
+        and type(items) is list
+        and all(type(it) is ScoreItem for it in items)
+        and type(total) is float
+        and 0.0 <= total <= 10.0
+        and decision in _DECISIONS
+    ):
+        return _trusted(
+            ScoreCard,
+            {"items": list(items), "total": total, "decision": decision},
+            _SCORE_CARD_FIELDS,
+        )
+    return ScoreCard(items=items, total=total, decision=decision)
+
+
 # ─────────────────────────────────────────────────────────────
 # [KO] 파이프라인 상태(PipelineState)
 #     - LangGraph 노드 간에 전달되는 공통 상태
@@ -100,7 +240,14 @@ class PipelineState(BaseModel):
     companies: List[CompanyMeta] = Field(default_factory=list)
 
     # [KO] Augment 단계 결과: 크롤링/정제/라벨링 후 적재된 근거(청크) 풀
+    #      (근거 저장소 사용 시 비어 있고, chunk_ids 가 저장소 행을 가리킴 → graph/evidence_store.py)
     chunks: List[Evidence] = Field(default_factory=list)
+    chunk_ids: List[int] = Field(
+        default_factory=list, description="Row ids of chunks kept in the evidence store"
+    )
+    evidence_store: Optional[str] = Field(
+        None, description="Path of the SQLite evidence store holding chunk_ids"
+    )
 
     # [KO] Retriever 단계 결과: 회사별/축별로 검색된 근거 목록 (key: company_id)
     retrieved_evidence: Dict[str, Dict[str, List[Evidence]]] = Field(
@@ -115,6 +262,40 @@ class PipelineState(BaseModel):
     reports: Dict[str, str] = Field(default_factory=dict)
 
 
+# ─────────────────────────────────────────────────────────────
+# [KO] Fan-out 그래프용 상태(FanoutState)
+#     - LangGraph Send로 회사별 하위 그래프를 병렬 실행할 때 사용
+#     - 병렬 노드가 같은 필드를 동시에 갱신하므로 필드별 reducer로 병합
+#     - 회사 메타 갱신은 company_updates에 모았다가 join 노드에서 companies에 반영
+# ─────────────────────────────────────────────────────────────
+
+
+def merge_dicts(left: Dict[str, Any], right: Dict[str, Any]) -> Dict[str, Any]:
+    """Reducer: shallow dict merge (right wins on key collision)."""
+    return {**(left or {}), **(right or {})}
+
+
+def keep_set(left: Any, right: Any) -> Any:
+    """Reducer: latest non-empty value (parallel branches report the same store path)."""
+    return right or left
+
+
+class FanoutState(PipelineState):
+    """PipelineState with reducers for parallel per-company branches."""
+
+    chunks: Annotated[List[Evidence], operator.add] = Field(default_factory=list)
+    chunk_ids: Annotated[List[int], operator.add] = Field(default_factory=list)
+    evidence_store: Annotated[Optional[str], keep_set] = None
+    retrieved_evidence: Annotated[Dict[str, Dict[str, List[Evidence]]], merge_dicts] = Field(
+        default_factory=dict
+    )
+    scorecard: Annotated[Dict[str, ScoreCard], merge_dicts] = Field(default_factory=dict)
+    reports: Annotated[Dict[str, str], merge_dicts] = Field(default_factory=dict)
+
+    # [KO] 회사별 분기에서 갱신된 CompanyMeta (key: company_id)
+    company_updates: Annotated[Dict[str, CompanyMeta], merge_dicts] = Field(default_factory=dict)
+
+
 __all__ = [
     "CompanyMeta",
     "Evidence",
@@ -123,5 +304,11 @@ __all__ = [
     "ScoreItem",
     "ScoreCard",
     "DecisionType",
+    "trusted_evidence",
+    "trusted_score_item",
+    "trusted_score_card",
     "PipelineState",
+    "FanoutState",
+    "merge_dicts",
+    "keep_set",
 ]
@@ -0,0 +1,167 @@
+# Agentic RAG v2 - Per-company streaming execution
+# Python 3.11+
+#
+# [KO] 기본(batch) 실행은 단계마다 모든 회사를 처리한 뒤 다음 단계로 넘어갑니다.
+#      streaming 모드는 seraph → filter 를 1회 실행한 후,
+#      회사별 하위 상태를 augment → rag → scoring → report 로 독립적으로 흘려보냅니다.
+#      - 단계마다 워커 스레드 1개 + 단계 사이 bounded queue(backpressure)
+#      - 에이전트 인스턴스는 자기 단계 스레드에서만 호출 → _state_ref 등 내부 상태 충돌 없음
+#      - 네트워크(augment)/임베딩(rag)/CPU(scoring)/LLM·PDF(report) 단계가 겹쳐 실행됨
+#      ※ scoring의 chunks 폴백은 해당 회사가 크롤링한 chunks만 대상으로 합니다.
+#      - checkpoint_dir 지정 시 단계 워커가 자기 단계를 마친 회사 결과를 단계별 상태에 모았다가
+#        마지막 회사가 지나가면 <dir>/<stage>.ckpt 로 저장 (batch 모드와 같은 파일 → --from-stage 재시작)
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Optional
+
+from .checkpoint import checkpoint_path, save_checkpoint
+from .state import CompanyMeta, PipelineState
+
+logger = logging.getLogger(__name__)
+
+STREAM_STAGES: tuple[str, ...] = ("augment", "rag", "scoring", "report")
+
+_DONE = object()  # 큐 종료 신호
+
+
+def company_state(state: PipelineState, company: CompanyMeta) -> PipelineState:
+    """Build a single-company sub-state for per-company stages."""
+    return PipelineState(
+        query=state.query, companies=[company], evidence_store=state.evidence_store
+    )
+
+
+def merge_company_state(state: PipelineState, sub: PipelineState) -> PipelineState:
+    """Fold a finished per-company sub-state back into the shared state."""
+    updated = {c.id: c for c in sub.companies}
+    state.companies = [updated.get(c.id, c) for c in state.companies]
+    state.chunks.extend(sub.chunks)
+    state.chunk_ids.extend(sub.chunk_ids)
+    state.evidence_store = sub.evidence_store or state.evidence_store
+    state.retrieved_evidence.update(sub.retrieved_evidence)
+    state.scorecard.update(sub.scorecard)
+    state.reports.update(sub.reports)
+    return state
+
+
+def _stage_snapshot(state: PipelineState) -> PipelineState:
+    """Copy of `state` with its own containers, to collect one stage's per-company results."""
+    return state.model_copy(
+        update={
+            "companies": list(state.companies),
+            "chunks": list(state.chunks),
+            "chunk_ids": list(state.chunk_ids),
+            "retrieved_evidence": dict(state.retrieved_evidence),
+            "scorecard": dict(state.scorecard),
+            "reports": dict(state.reports),
+        }
+    )
+
+
+def _stage_worker(
+    name: str,
+    node: Callable[[PipelineState], PipelineState],
+    inbox: queue.Queue,
+    outbox: queue.Queue,
+    on_progress: Optional[Callable[[str, PipelineState], None]],
+    snapshot: Optional[PipelineState] = None,
+    checkpoint_dir: Optional[str] = None,
+) -> None:
+    while True:
+        item = inbox.get()
+        if item is _DONE:
+            if snapshot is not None and checkpoint_dir:
+                path = save_checkpoint(snapshot, checkpoint_path(checkpoint_dir, name), stage=name)
+                logger.info(f"[Checkpoint] {name} → {path}")
+            outbox.put(_DONE)
+            return
+        try:
+            item = node(item)
+        except Exception as e:
+            # [KO] 한 회사의 실패가 전체 스트림을 멈추지 않도록 상태를 그대로 다음 단계로 넘김
+            cid = item.companies[0].id if item.companies else "?"
+            logger.exception(f"[Stream:{name}] {cid} failed: {e}")
+        if snapshot is not None:
+            merge_company_state(snapshot, item)  # 다음 단계가 추가하는 결과는 포함되지 않음
+        if on_progress is not None:
+            on_progress(name, item)
+        outbox.put(item)
+
+
+def run_streaming(
+    state: PipelineState,
+    nodes: dict[str, Callable[[PipelineState], PipelineState]],
+    stages: tuple[str, ...] = STREAM_STAGES,
+    queue_size: int = 2,
+    on_progress: Optional[Callable[[str, PipelineState], None]] = None,
+    checkpoint_dir: Optional[str] = None,
+) -> PipelineState:
+    """
+    Run `stages` per company with one worker thread per stage.
+    Expects `state.companies` to be final (seraph/filter already applied).
+    `on_progress(stage, sub_state)` is called from worker threads after each stage.
+    With `checkpoint_dir`, the state after each stage (all companies) is saved as
+    `<dir>/<stage>.ckpt`, as in batch mode.
+    """
+    if not state.companies:
+        return state
+
+    queues = [queue.Queue(maxsize=max(1, int(queue_size))) for _ in stages]
+    results: queue.Queue = queue.Queue()  # 마지막 큐는 무제한 (메인 스레드가 수거)
+    outboxes = queues[1:] + [results]
+
+    workers = [
+        threading.Thread(
+            target=_stage_worker,
+            args=(
+                name,
+                nodes[name],
+                inbox,
+                outbox,
+                on_progress,
+                _stage_snapshot(state) if checkpoint_dir else None,
+                checkpoint_dir,
+            ),
+            name=f"stream-{name}",
+            daemon=True,
+        )
+        for name, inbox, outbox in zip(stages, queues, outboxes)
+    ]
+    for w in workers:
+        w.start()
+
+    def _feed() -> None:
+        for company in list(state.companies):
+            queues[0].put(company_state(state, company))  # 가득 차면 대기(backpressure)
+        queues[0].put(_DONE)
+
+    feeder = threading.Thread(target=_feed, name="stream-feed", daemon=True)
+    feeder.start()
+
+    started = time.perf_counter()
+    first_report: Optional[float] = None
+    while True:
+        sub = results.get()
+        if sub is _DONE:
+            break
+        merge_company_state(state, sub)
+        if sub.reports and first_report is None:
+            first_report = time.perf_counter() - started
+            logger.info(f"[Stream] first report ready after {first_report:.1f}s")
+
+    feeder.join()
+    for w in workers:
+        w.join()
+    logger.info(
+        f"[Stream] {len(state.companies)} companies through {'→'.join(stages)} "
+        f"in {time.perf_counter() - started:.1f}s"
+    )
+    return state
+
+
+__all__ = ["STREAM_STAGES", "company_state", "merge_company_state", "run_streaming"]
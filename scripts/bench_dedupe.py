@@ -0,0 +1,85 @@
+# scripts/bench_dedupe.py
+# [KO] 불릿/근거 텍스트 근사 중복 제거 벤치마크
+#     - reference: 기존 _dedupe_list (보존 항목 전체와 SequenceMatcher.ratio 비교)
+#     - index    : agents/text_dedupe.NearDuplicateIndex (상한 필터 + matcher 재사용)
+#     두 결과가 동일한지 확인 후 처리량을 출력합니다.
+# Run with: python -m scripts.bench_dedupe [-n 2000] [--dup-rate 0.3] [--thresh 0.88]
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from difflib import SequenceMatcher
+
+from agents.text_dedupe import NearDuplicateIndex
+
+WORDS = (
+    "금융 AI 상담 자동화 규제 리스크 보안 온프렘 PoC ARR 확장 파트너십 레퍼런스 고객 "
+    "데이터 모델 정확도 비용 채널 글로벌 인증 감사추적 KYC 콜센터 생산성 경쟁사"
+).split()
+
+
+def make_bullets(n: int, dup_rate: float, seed: int = 42) -> list[str]:
+    rng = random.Random(seed)
+    out: list[str] = []
+    for _ in range(n):
+        if out and rng.random() < dup_rate:
+            s = list(rng.choice(out))
+            for _ in range(rng.randint(1, 3)):  # 조사/어미 수준의 작은 변형
+                i = rng.randrange(len(s))
+                s[i : i + 1] = rng.choice(["", "을", "의", " ", s[i]])
+            out.append("".join(s))
+        else:
+            out.append(" ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 16))))
+    return out
+
+
+def reference(items: list[str], thresh: float) -> tuple[list[str], int]:
+    out: list[str] = []
+    compares = 0
+    for s in items:
+        s = (s or "").strip()
+        if not s:
+            continue
+        dup = False
+        for t in out:
+            compares += 1
+            if SequenceMatcher(None, s, t).ratio() >= thresh:
+                dup = True
+                break
+        if not dup:
+            out.append(s)
+    return out, compares
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark near-duplicate bullet dedupe")
+    parser.add_argument("-n", type=int, default=2000, help="Number of bullets")
+    parser.add_argument("--dup-rate", type=float, default=0.3, help="Share of near duplicates")
+    parser.add_argument("--thresh", type=float, default=0.88)
+    args = parser.parse_args()
+
+    items = make_bullets(args.n, args.dup_rate)
+
+    t0 = time.perf_counter()
+    ref, ref_compares = reference(items, args.thresh)
+    t_ref = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    index = NearDuplicateIndex(args.thresh)
+    for s in items:
+        s = s.strip()
+        if s:
+            index.add(s)
+    t_idx = time.perf_counter() - t0
+
+    assert index.items == ref, "results differ from the reference implementation"
+    print(f"bullets={len(items)} kept={len(ref)} thresh={args.thresh}")
+    print(f"reference  {t_ref:8.3f}s  ratio() calls={ref_compares}")
+    print(f"index      {t_idx:8.3f}s  ratio() calls={index.full_compares}")
+    print(f"speedup    {t_ref / t_idx if t_idx else float('inf'):8.1f}x  (identical output)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# scripts/bench_diagnostics.py
+# [KO] ScoringAgent(python 엔진) 처리량: 진단 출력 off / INFO 로그 on / JSONL trace on 비교
+#     - off  : 루트 로거 WARNING, trace 없음 → 축별 샘플/도메인 집계와 문자열 작업 생략
+#     - log  : 루트 로거 INFO, 핸들러는 os.devnull 로 (포맷팅 비용 포함, 터미널 I/O 제외)
+#     - trace: off 상태 + DEBUG trace sink (임시 JSONL 파일)
+#     세 경우의 ScoreCard가 동일한지 확인 후 처리량을 출력합니다.
+# Run with: python -m scripts.bench_diagnostics [-n 2000] [--per-axis 8] [--repeat 3]
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+
+from agents.scoring_agent import ScoringAgent
+from agents.scoring_engine import AXES
+from graph import diagnostics
+from scripts.bench_scoring import make_state
+
+
+def _time_scoring(state, repeat: int):
+    best, cards = float("inf"), None
+    for _ in range(repeat):
+        st = state.model_copy()
+        st.scorecard = {}
+        t0 = time.perf_counter()
+        ScoringAgent(engine="python")(st)
+        best = min(best, time.perf_counter() - t0)
+        cards = st.scorecard
+    return best, cards
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark scoring with diagnostics on vs off")
+    parser.add_argument("-n", type=int, default=2000, help="Number of companies")
+    parser.add_argument("--per-axis", type=int, default=8, help="Mean evidences per axis")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per mode (best is reported)")
+    args = parser.parse_args()
+
+    state = make_state(args.n, args.per_axis)
+    root = logging.getLogger()
+    root.handlers.clear()
+    with open(os.devnull, "w", encoding="utf-8") as devnull:
+        root.addHandler(logging.StreamHandler(devnull))
+        results = {}
+
+        root.setLevel(logging.WARNING)
+        results["off"] = _time_scoring(state, args.repeat)
+
+        root.setLevel(logging.INFO)
+        results["log"] = _time_scoring(state, args.repeat)
+
+        root.setLevel(logging.WARNING)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "trace.jsonl")
+            with diagnostics.trace(path):
+                results["trace"] = _time_scoring(state, args.repeat)
+            with open(path, "rb") as f:
+                n_events = sum(1 for _ in f) // args.repeat
+
+    ref = results["off"][1]
+    for mode, (_, cards) in results.items():
+        assert cards == ref, f"scorecards differ with diagnostics mode={mode}"
+
+    t_off = results["off"][0]
+    print(f"companies={args.n} axes={args.n * len(AXES)} trace_events/run={n_events}")
+    for mode, (t, _) in results.items():
+        print(f"{mode:<6} {t:8.3f}s  {args.n / t:10.0f} companies/s  {t / t_off:5.2f}x of off")
+
+
+if __name__ == "__main__":
+    main()
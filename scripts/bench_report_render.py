@@ -0,0 +1,108 @@
+# scripts/bench_report_render.py
+# [KO] report.html.j2 렌더링 벤치마크 (render_sample_report.py 더미 컨텍스트 사용)
+#     - cold: 바이트코드 캐시 없이 Environment 새로 생성 + 컴파일 + 렌더 (이전 방식)
+#     - warm: 공유 Environment + FileSystemBytecodeCache, 미리 컴파일된 템플릿으로 렌더
+#     - pdf : (옵션) 공유 Chromium 페이지 풀로 HTML → PDF 까지 (agents/pdf_renderer.py)
+#     템플릿 수정 후 renders/sec 변화를 바로 확인하는 용도입니다.
+# Run with: python -m scripts.bench_report_render [-n 200] [--pdf 20] [--json out.json]
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+from agents.template_render import TemplateRenderer
+from scripts.render_sample_report import ROOT, sample_context
+
+TEMPLATE_DIR = str(ROOT / "docs" / "templates")
+TEMPLATE_NAME = "report.html.j2"
+
+
+def _rate(n: int, elapsed: float) -> dict:
+    return {
+        "n": n,
+        "seconds": round(elapsed, 4),
+        "per_sec": round(n / elapsed, 1) if elapsed else 0.0,
+    }
+
+
+def bench_cold(n: int, context: dict) -> dict:
+    t0 = time.perf_counter()
+    for _ in range(n):
+        env = Environment(
+            loader=FileSystemLoader(TEMPLATE_DIR), autoescape=select_autoescape(["html", "xml"])
+        )
+        env.get_template(TEMPLATE_NAME).render(**context)
+    return _rate(n, time.perf_counter() - t0)
+
+
+def bench_warm(n: int, context: dict, bytecode_dir: str) -> dict:
+    t0 = time.perf_counter()
+    renderer = TemplateRenderer(TEMPLATE_DIR, TEMPLATE_NAME, bytecode_dir)
+    startup = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for _ in range(n):
+        renderer.render(**context)
+    out = _rate(n, time.perf_counter() - t0)
+    out["startup_s"] = round(startup, 4)
+    return out
+
+
+async def _bench_pdf(n: int, context: dict, pages: int) -> dict:
+    from agents.pdf_renderer import PdfRenderService
+
+    renderer = TemplateRenderer(TEMPLATE_DIR, TEMPLATE_NAME)
+    with tempfile.TemporaryDirectory() as tmp:
+        async with PdfRenderService(pages=pages) as pdf:
+            # 브라우저 기동 시간은 측정에서 제외
+            await pdf.render(*_write_html(renderer, context, Path(tmp), "warmup"))
+            t0 = time.perf_counter()
+            await asyncio.gather(
+                *(pdf.render(*_write_html(renderer, context, Path(tmp), str(i))) for i in range(n))
+            )
+            return _rate(n, time.perf_counter() - t0)
+
+
+def _write_html(renderer: TemplateRenderer, context: dict, out: Path, name: str):
+    html_path = out / f"{name}.html"
+    html_path.write_text(renderer.render(**context), encoding="utf-8")
+    return str(html_path), str(out / f"{name}.pdf")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark report template rendering")
+    parser.add_argument("-n", type=int, default=200, help="HTML renders per scenario")
+    parser.add_argument("--pdf", type=int, default=0, help="Also print N PDFs (needs Chromium)")
+    parser.add_argument("--pages", type=int, default=4, help="Browser page pool size for --pdf")
+    parser.add_argument("--json", type=str, default=None, help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    context = sample_context()
+    results = {"template": TEMPLATE_NAME, "cold_html": bench_cold(args.n, context)}
+    with tempfile.TemporaryDirectory() as bc:
+        results["warm_html_first_process"] = bench_warm(args.n, context, bc)  # 캐시 기록
+        # 새 프로세스 흉내: 메모리 Environment를 비우고 디스크 바이트코드로 재시작
+        from agents import template_render
+
+        template_render._envs.clear()
+        results["warm_html_bytecode_hit"] = bench_warm(args.n, context, bc)
+    if args.pdf:
+        results["pdf"] = asyncio.run(_bench_pdf(args.pdf, context, args.pages))
+
+    for name, r in results.items():
+        if isinstance(r, dict):
+            extra = f"  (startup {r['startup_s']}s)" if "startup_s" in r else ""
+            print(f"{name:<26} {r['per_sec']:>9.1f} renders/s  n={r['n']}{extra}")
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"[OK] results -> {args.json}")
+
+
+if __name__ == "__main__":
+    main()
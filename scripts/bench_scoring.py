@@ -0,0 +1,75 @@
+# scripts/bench_scoring.py
+# [KO] ScoringAgent 엔진 벤치마크 (합성 근거, 회사 수 N)
+#     - python  : 회사·축 단위 루프 (_score_axis/_calc_confidence, 축별 상세 로그 포함)
+#     - columnar: agents/scoring_engine.score_companies (NumPy 일괄 계산)
+#     두 엔진의 ScoreCard가 동일한지 확인 후 처리량을 출력합니다.
+# Run with: python -m scripts.bench_scoring [-n 5000] [--per-axis 8]
+
+from __future__ import annotations
+
+import argparse
+import logging
+import random
+import time
+from datetime import date, timedelta
+
+from agents.scoring_agent import ScoringAgent
+from agents.scoring_engine import AXES
+from graph.state import CompanyMeta, Evidence, PipelineState
+
+DOMAINS = [f"https://news{i}.example.com/a" for i in range(40)] + ["", "data/local.pdf"]
+
+
+def make_state(n: int, per_axis: int, seed: int = 42) -> PipelineState:
+    rng = random.Random(seed)
+    today = date.today()
+    companies, retrieved = [], {}
+    for i in range(n):
+        cid = f"c{i}"
+        companies.append(CompanyMeta(id=cid, name=f"Company {i}"))
+        retrieved[cid] = {
+            axis: [
+                Evidence(
+                    source=rng.choice(DOMAINS),
+                    text=f"{cid} {axis} {k}",
+                    category=axis,
+                    strength=rng.choice(["weak", "medium", "strong"]),
+                    published=(today - timedelta(days=rng.randint(0, 1500))).isoformat(),
+                )
+                for k in range(rng.randint(0, 2 * per_axis))
+            ]
+            for axis in AXES
+        }
+    return PipelineState(query="bench", companies=companies, retrieved_evidence=retrieved)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark ScoringAgent engines")
+    parser.add_argument("-n", type=int, default=5000, help="Number of companies")
+    parser.add_argument("--per-axis", type=int, default=8, help="Mean evidences per axis")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)  # 로그 I/O는 측정에서 제외
+
+    state = make_state(args.n, args.per_axis)
+    n_ev = sum(len(v) for m in state.retrieved_evidence.values() for v in m.values())
+
+    results = {}
+    for engine in ("python", "columnar"):
+        st = state.model_copy()
+        st.scorecard = {}
+        t0 = time.perf_counter()
+        ScoringAgent(engine=engine)(st)
+        results[engine] = (time.perf_counter() - t0, st.scorecard)
+
+    (t_py, ref), (t_col, got) = results["python"], results["columnar"]
+    assert {k: v.model_dump() for k, v in got.items()} == {
+        k: v.model_dump() for k, v in ref.items()
+    }, "columnar scorecards differ from the python engine"
+    print(f"companies={args.n} evidences={n_ev}")
+    print(f"python     {t_py:8.3f}s  {args.n / t_py:10.0f} companies/s")
+    print(f"columnar   {t_col:8.3f}s  {args.n / t_col:10.0f} companies/s")
+    print(f"speedup    {t_py / t_col if t_col else float('inf'):8.1f}x  (identical scorecards)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+# scripts/render_pending_pdfs.py
+# [KO] deferred 리포트 모드에서 큐에 쌓인 HTML → PDF 변환을 일괄 실행
+#     - 큐: outputs/reports/pdf_queue.jsonl (ReportWriterAgent report_mode="deferred")
+#     - 브라우저 1회 기동 + 페이지 풀로 동시 변환, 실패 건은 큐에 남김
+# Run with: python -m scripts.render_pending_pdfs [--pages 4] [--queue PATH]
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+
+from agents.pdf_renderer import PDF_QUEUE_PATH, load_pending, render_pending
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Render queued report PDFs")
+    parser.add_argument("--queue", type=str, default=PDF_QUEUE_PATH, help="Queue file (JSONL)")
+    parser.add_argument("--pages", type=int, default=4, help="Concurrent browser pages")
+    parser.add_argument("--list", action="store_true", help="Only list pending jobs")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    pending = load_pending(args.queue)
+    if args.list or not pending:
+        for job in pending:
+            print(f"- {job.get('company') or '?'}: {job['html_path']} → {job['pdf_path']}")
+        print(f"[OK] {len(pending)} pending")
+        return
+
+    result = asyncio.run(render_pending(args.queue, pages=args.pages))
+    for job in result["done"]:
+        print(f"[OK] {job['pdf_path']}")
+    print(f"[OK] rendered={len(result['done'])} failed={len(result['failed'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# scripts/whatif_scoring.py
+# [KO] 저장된 근거 스냅샷으로 what-if 스코어링 (크롤링/검색/LLM 없이 점수·결정만 재계산)
+#     - 입력: graph/run.py --save-evidence 스냅샷(outputs/evidence/run_*.json) 또는
+#             rag/scoring 체크포인트(outputs/checkpoints/run_*/*.ckpt) (기본: 가장 최근 파일)
+#     - 시나리오: --grid JSON (가중치/최소 근거 수/recency 개월/투자 게이트의 격자), 없으면 기본 격자
+#     - 출력: 회사 × 시나리오 결정 행렬 CSV + 시나리오별 invest 수/기준 대비 뒤집힌 회사 수
+# Run with: python -m scripts.whatif_scoring [--inputs path.json] [--grid grid.json] [--out m.csv]
+#
+# grid.json 예:
+#   {"weights": {"ai_tech": [20, 25, 30], "market": [15, 20]},
+#    "recency_months": [12, 18], "invest_total": [7.0, 7.5], "invest_conf": [0.55]}
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import time
+from datetime import datetime
+
+from agents.scoring_scenarios import (
+    default_grid,
+    evaluate_scenarios,
+    latest_inputs,
+    load_scoring_inputs,
+    scenario_grid,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="What-if scoring over persisted evidence")
+    parser.add_argument(
+        "--inputs", type=str, default=None, help="Evidence snapshot JSON or rag/scoring checkpoint"
+    )
+    parser.add_argument("--grid", type=str, default=None, help="Scenario grid JSON")
+    parser.add_argument("--out", type=str, default=None, help="Decision matrix CSV path")
+    parser.add_argument("--top", type=int, default=10, help="Most sensitive companies to list")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)  # ScoringAgent 입력 로그 생략
+
+    path = args.inputs or latest_inputs()
+    if not path:
+        raise SystemExit(
+            "[ERR] no evidence snapshot or checkpoint found; run graph.run first or pass --inputs"
+        )
+    if args.grid:
+        with open(args.grid, "r", encoding="utf-8") as f:
+            scenarios = scenario_grid(json.load(f))
+    else:
+        scenarios = default_grid()
+
+    t0 = time.perf_counter()
+    ids, axis_maps = load_scoring_inputs(path)
+    t_load = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    result = evaluate_scenarios(axis_maps, scenarios, ids)
+    t_eval = time.perf_counter() - t0
+
+    ts = datetime.now().strftime("%Y%m%d_%H%M")
+    out = result.write_csv(args.out or os.path.join("outputs", "scenarios", f"whatif_{ts}.csv"))
+    print(f"inputs={path} companies={len(ids)} scenarios={len(scenarios)}")
+    print(f"load {t_load:.2f}s  evaluate {t_eval:.3f}s")
+    print(f"{'scenario':<56} {'invest':>7} {'flips':>6}")
+    for s, n_inv, flips in zip(scenarios, result.invest.sum(axis=1), result.flips()):
+        print(f"{s.name[:56]:<56} {int(n_inv):>7} {int(flips):>6}")
+
+    # 기준 결정과 다른 시나리오가 많은 회사 순
+    changed = (result.invest != result.invest[:1]).sum(axis=0)
+    order = sorted(range(len(ids)), key=lambda i: -int(changed[i]))[: args.top]
+    if order and changed[order[0]]:
+        print("\nmost sensitive companies (scenarios flipping the baseline decision):")
+        for i in order:
+            if changed[i]:
+                print(f"  {ids[i]:<30} {int(changed[i])}/{len(scenarios)}")
+    print(f"[OK] decision matrix -> {out}")
+
+
+if __name__ == "__main__":
+    main()
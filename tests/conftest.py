@@ -0,0 +1,60 @@
+# [KO] 테스트 공용 픽스처: 스코어링 입력(회사별/축별 무작위 근거) 생성기
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from agents.scoring_engine import AXES
+from graph.state import CompanyMeta, Evidence, PipelineState
+
+SOURCES = [
+    "",
+    "https://www.alpha.com/news/1",
+    "https://alpha.com/blog",
+    "https://beta.co.kr/a",
+    "http://gamma.io",
+    "data/reports/alpha.pdf",
+    "not a url",
+]
+
+
+def _published(rng):
+    now = datetime.now(timezone.utc)
+    return rng.choice(
+        [
+            None,
+            "",
+            "garbage",
+            (now - timedelta(days=30)).date().isoformat(),
+            (now - timedelta(days=400)).date().isoformat(),
+            (now - timedelta(days=2000)).date().isoformat(),
+        ]
+    )
+
+
+def _make_random_state(rng: random.Random, n_companies: int) -> PipelineState:
+    companies, retrieved = [], {}
+    for i in range(n_companies):
+        cid = f"c{i}"
+        companies.append(CompanyMeta(id=cid, name=f"Company {i}"))
+        axis_map = {}
+        for axis in AXES:
+            n = rng.choice([0, 0, 1, 2, 3, 5, 12])
+            axis_map[axis] = [
+                Evidence(
+                    source=rng.choice(SOURCES),
+                    text=f"{cid} {axis} {k}",
+                    category=axis,
+                    strength=rng.choice(["weak", "medium", "strong", "strong"]),
+                    published=_published(rng),
+                )
+                for k in range(n)
+            ]
+        retrieved[cid] = axis_map
+    return PipelineState(query="q", companies=companies, retrieved_evidence=retrieved)
+
+
+@pytest.fixture
+def random_state():
+    """Factory: random_state(rng, n_companies) → PipelineState with random retrieved evidence."""
+    return _make_random_state
@@ -0,0 +1,103 @@
+# [KO] 단계 체크포인트: 저장/로드 동일성, 단계별 저장, 손상 파일 거부
+import pytest
+
+from graph import checkpoint
+from graph.checkpoint import load_checkpoint, read_meta, save_checkpoint
+from graph.run import run_step_by_step_step
+from graph.state import CompanyMeta, Evidence, PipelineState, ScoreCard, ScoreItem
+
+
+def _state():
+    ev = Evidence(
+        source="https://a.ai/x", text="Alpha ships", category="market", published="2025-01-01"
+    )
+    item = ScoreItem(key="market", value=7.5, confidence=0.6, notes="n", evidence=[ev])
+    return PipelineState(
+        query="ai finance",
+        companies=[CompanyMeta(id="a", name="Alpha", tags=["fintech"])],
+        chunks=[ev],
+        chunk_ids=[3, 1],
+        evidence_store="outputs/cache/evidence.sqlite",
+        retrieved_evidence={"a": {"market": [ev]}},
+        scorecard={"a": ScoreCard(items=[item], total=7.5, decision="hold")},
+        reports={"a": "outputs/reports/a.pdf"},
+    )
+
+
+@pytest.mark.parametrize("codec", ["zlib", "none", "auto"])
+def test_round_trip(tmp_path, codec):
+    state = _state()
+    path = save_checkpoint(
+        state, str(tmp_path / "scoring.ckpt"), "scoring", None if codec == "auto" else codec
+    )
+    loaded, meta = load_checkpoint(path)
+    assert loaded == state
+    assert meta["stage"] == "scoring" and meta["companies"] == 1
+    assert read_meta(path)["codec"] == (checkpoint.default_codec() if codec == "auto" else codec)
+
+
+def test_step_runner_writes_checkpoint_per_stage(tmp_path):
+    def _augment(s):
+        s.chunk_ids.append(7)
+        return s
+
+    def _rag(s):
+        s.retrieved_evidence["a"] = {}
+        return s
+
+    nodes = {"augment": _augment, "rag": _rag}
+    out = run_step_by_step_step(
+        _state(), steps=("augment", "rag"), nodes=nodes, checkpoint_dir=str(tmp_path)
+    )
+    after_augment, meta = load_checkpoint(str(tmp_path / "augment.ckpt"))
+    assert meta["stage"] == "augment" and after_augment.chunk_ids == [3, 1, 7]
+    assert after_augment.retrieved_evidence == _state().retrieved_evidence
+    assert load_checkpoint(str(tmp_path / "rag.ckpt"))[0] == out
+
+
+def test_rejects_foreign_file(tmp_path):
+    bad = tmp_path / "x.ckpt"
+    bad.write_bytes(b'{"query": "q"}')
+    with pytest.raises(ValueError):
+        load_checkpoint(str(bad))
+
+
+@pytest.mark.parametrize("argv", [[], ["--from-stage", "seraph"]])
+def test_cli_requires_query_without_checkpoint(tmp_path, monkeypatch, capsys, argv):
+    from graph import run
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr("sys.argv", ["graph.run", *argv])
+    with pytest.raises(SystemExit) as exc:
+        run.main()
+    assert exc.value.code == 2
+    assert "--query is required" in capsys.readouterr().err
+    assert not (tmp_path / "outputs").exists()
+
+
+def test_cli_flags_become_node_config(monkeypatch):
+    import argparse
+    import os
+
+    from graph.nodes import load_nodes
+    from graph.run import node_config
+
+    for name in ("SCORING_FORCE", "REPORT_FORCE", "REPORT_MODE", "REPORT_PORTFOLIO", "LLM_CACHE"):
+        monkeypatch.delenv(name, raising=False)
+    env = dict(os.environ)
+    args = argparse.Namespace(
+        force_rescore=True,
+        portfolio=True,
+        force_reports=True,
+        report_mode="html",
+        no_llm_cache=True,
+    )
+    nodes = load_nodes(("scoring", "report"), config=node_config(args))
+    assert nodes["scoring"].kwargs == {"incremental": False}
+    assert nodes["report"].kwargs == {
+        "portfolio": True,
+        "incremental": False,
+        "report_mode": "html",
+        "llm_cache": False,
+    }
+    assert dict(os.environ) == env
@@ -0,0 +1,60 @@
+# [KO] 청크 폴백 역색인 매칭: 회사별 _matches_company 전수 비교와 결과 동일성
+import random
+
+from agents.company_matcher import PatternSet, match_companies
+from agents.scoring_agent import _gather_company_axis_evidence
+from graph.state import CompanyMeta, Evidence
+
+CATEGORIES = ["ai_tech", "market", "team", "traction", "risk"]
+
+
+def test_pattern_set_overlapping_and_prefix_words():
+    ps = PatternSet(["fin", "finchat", "chat", "at", "", "a.c"])
+    assert ps.find("xx finchat yy") == {"fin", "finchat", "chat", "at"}
+    assert ps.find("fi nchat") == {"chat", "at"}
+    assert ps.find("abc a.c") == {"a.c"}
+    assert PatternSet([]).find("anything") == set()
+
+
+def test_matches_reference_gather():
+    rng = random.Random(5)
+    companies = [
+        CompanyMeta(id="c1", name="FinChat AI", website="https://www.finchat.ai", tags=["robo"]),
+        CompanyMeta(id="c2", name="Fin", website="fin.com", tags=["wealth", "robo advisor"]),
+        CompanyMeta(id="c3", name="Chat", website="https://chat.io/about"),
+        CompanyMeta(id="c4", name="Q-Bank", tags=["", "Retail Banking"]),
+        CompanyMeta(id="c5", name="", website="https://news.example.com", tags=["AI"]),
+    ]
+    sources = [
+        "https://finchat.ai/blog",
+        "https://blog.finchat.ai/post",
+        "https://news.example.com/fin-chat-ai/story",
+        "https://news.example.com/q_bank",
+        "https://www.chat.io",
+        "data/reports/FinChat_AI.pdf",
+        "https://other.org/x",
+        "",
+    ]
+    texts = [
+        "FinChat AI raised a round",
+        "finchat ai partners with Q-Bank",
+        "Robo advisors grow in retail banking",
+        "Wealth management AI",
+        "nothing relevant",
+        "CHAT based fin tools",
+        "",
+    ]
+    chunks = [
+        Evidence(
+            source=rng.choice(sources),
+            text=rng.choice(texts),
+            category=rng.choice(CATEGORIES),
+        )
+        for _ in range(400)
+    ]
+
+    got = match_companies(chunks, companies)
+    for c in companies:
+        expected = _gather_company_axis_evidence(chunks, c.name, c.website, c.tags)
+        assert list(got[c.id].items()) == list(expected.items()), c.id
+    assert any(got[c.id] for c in companies)
@@ -0,0 +1,37 @@
+# [KO] 진단 출력: 비활성 시 생략, trace sink 에 구조화 이벤트 기록
+import json
+import logging
+import random
+
+from agents.scoring_agent import ScoringAgent
+from graph import diagnostics
+
+
+def test_disabled_skips_axis_details(monkeypatch, caplog, random_state):
+    calls = []
+    monkeypatch.setattr(diagnostics, "emit", lambda *a, **k: calls.append(a))
+    caplog.set_level(logging.WARNING)
+    assert not diagnostics.enabled(logging.INFO)
+    ScoringAgent(engine="python")(random_state(random.Random(1), 3))
+    assert calls == []
+
+
+def test_trace_sink_records_scoring_events(tmp_path, caplog, random_state):
+    caplog.set_level(logging.WARNING)
+    state = random_state(random.Random(2), 3)
+    path = tmp_path / "trace.jsonl"
+    with diagnostics.trace(str(path)):
+        assert diagnostics.enabled(logging.DEBUG)
+        ScoringAgent(engine="python")(state)
+    assert not diagnostics.enabled(logging.INFO)
+
+    events = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    axis = [e for e in events if e["event"] == "scoring.axis"]
+    assert len(axis) == 3 * 7
+    first = axis[0]
+    sc = state.scorecard[first["company_id"]]
+    item = next(it for it in sc.items if it.key == first["axis"])
+    assert (first["score"], first["confidence"]) == (item.value, item.confidence)
+    assert len(first["samples"]) == min(3, first["evidences"])
+    results = {e["company_id"]: e["decision"] for e in events if e["event"] == "scoring.result"}
+    assert results == {cid: c.decision for cid, c in state.scorecard.items()}
@@ -0,0 +1,128 @@
+# [KO] 근거 저장소: ID 참조/출처 interning/중복 제거, 저장소 청크로도 스코어링 결과 동일
+import random
+
+from agents.company_matcher import match_companies
+from agents.scoring_agent import ScoringAgent
+from graph.evidence_store import EvidenceStore, StoredChunks, iter_chunks
+from graph.state import CompanyMeta, Evidence, PipelineState
+
+
+def _chunks(rng, n):
+    names = ["Alpha", "Beta", "Gamma", "fintech"]
+    sources = [f"https://{s}.com/{p}" for s in ("alpha", "beta", "news") for p in ("a", "b-beta")]
+    return [
+        Evidence(
+            source=rng.choice(sources),
+            text=f"{rng.choice(names)} update {rng.randint(0, n // 3)}",
+            category=rng.choice(["market", "ai_tech", "team"]),
+            strength=rng.choice(["weak", "medium", "strong"]),
+            published=rng.choice([None, "2025-01-01"]),
+        )
+        for _ in range(n)
+    ]
+
+
+def test_round_trip_interning_and_dedupe(tmp_path):
+    store = EvidenceStore(str(tmp_path / "ev.sqlite"))
+    evs = _chunks(random.Random(0), 300)
+    ids = store.add(evs)
+    assert store.get(ids) == evs
+    assert len(store) == len(set(ids)) < len(evs)  # 동일 근거는 같은 ID
+    assert store.add(evs[:10]) == ids[:10]
+    n_sources = store._conn.execute("SELECT COUNT(*) FROM sources").fetchone()[0]
+    assert n_sources == len({e.source for e in evs})
+    assert store.meta(ids[:3]) == [
+        (i, e.source, e.category, e.strength, e.published) for i, e in zip(ids, evs[:3])
+    ]
+    store.close()
+
+    reopened = EvidenceStore(str(tmp_path / "ev.sqlite"))
+    assert list(reopened.iter_evidence(ids, batch=7)) == evs
+
+
+def test_stored_chunks_score_like_in_memory(tmp_path):
+    rng = random.Random(1)
+    evs = _chunks(rng, 400)
+    companies = [
+        CompanyMeta(id="a", name="Alpha", website="https://alpha.com"),
+        CompanyMeta(id="b", name="Beta", tags=["fintech"]),
+        CompanyMeta(id="g", name="Gamma"),
+    ]
+    path = str(tmp_path / "ev.sqlite")
+    ids = EvidenceStore(path).add(evs)
+    assert match_companies(StoredChunks(EvidenceStore(path), ids), companies) == match_companies(
+        evs, companies
+    )
+
+    in_memory = PipelineState(query="q", companies=companies, chunks=evs)
+    stored = PipelineState(query="q", companies=companies, chunk_ids=ids, evidence_store=path)
+    assert list(iter_chunks(stored)) == evs
+    expected = ScoringAgent(engine="python")(in_memory).scorecard
+    assert ScoringAgent(engine="python")(stored).scorecard == expected
+
+
+def test_prune_drops_rows_unused_past_retention(tmp_path, monkeypatch):
+    import time
+
+    now = [1_000_000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    store = EvidenceStore(str(tmp_path / "ev.sqlite"))
+    evs = _chunks(random.Random(2), 40)
+    old_ids = store.add(evs[:20])
+    now[0] += 10 * 86400
+    new_ids = store.add(evs[20:])  # 다시 적재된 동일 근거도 사용 시각 갱신
+    store.touch(old_ids[:1])  # 재시작 체크포인트가 참조하는 행
+
+    keep = set(new_ids) | set(old_ids[:1])
+    assert store.prune(5 * 86400) == len(set(old_ids) - keep)
+    assert len(store) == len(keep)
+    assert store.get(new_ids) == evs[20:]
+    assert store.get(old_ids[:1]) == evs[:1]
+    used = {r[0] for r in store._conn.execute("SELECT source_id FROM evidence")}
+    assert {r[0] for r in store._conn.execute("SELECT id FROM sources")} == used
+
+    # 정리 후 재적재: 삭제된 출처도 다시 등록되어 복원 가능
+    assert store.get(store.add(evs[:20])) == evs[:20]
+    assert store.prune(5 * 86400) == 0
+
+
+def test_store_without_last_used_is_migrated(tmp_path):
+    import sqlite3
+
+    path = str(tmp_path / "old.sqlite")
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        "CREATE TABLE sources (id INTEGER PRIMARY KEY, url TEXT NOT NULL UNIQUE);"
+        "CREATE TABLE evidence (id INTEGER PRIMARY KEY, key BLOB NOT NULL UNIQUE,"
+        " source_id INTEGER NOT NULL, category TEXT NOT NULL, strength TEXT NOT NULL,"
+        " published TEXT, text TEXT NOT NULL);"
+        "INSERT INTO sources VALUES (1, 'https://a.com');"
+        "INSERT INTO evidence VALUES (1, x'00', 1, 'team', 'weak', NULL, 'old row');"
+    )
+    conn.commit()
+    conn.close()
+
+    store = EvidenceStore(path)
+    assert store.prune(86400) == 0  # 기존 행은 마이그레이션 시점에 사용된 것으로 간주
+    assert store.get([1])[0].text == "old row"
+
+
+def test_run_prunes_shared_store_but_keeps_resumed_chunks(tmp_path, monkeypatch):
+    import time
+
+    from graph.evidence_store import close_stores, open_store
+    from graph.run import prune_evidence_store
+
+    path = str(tmp_path / "ev.sqlite")
+    monkeypatch.setenv("EVIDENCE_STORE", path)
+    now = [1_000_000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    try:
+        ids = open_store(path).add(_chunks(random.Random(3), 10))
+        now[0] += 40 * 86400
+        resumed = PipelineState(query="q", chunk_ids=ids[:2], evidence_store=path)
+        assert prune_evidence_store(resumed, 0) == 0
+        assert prune_evidence_store(resumed, 30) == len(set(ids) - set(ids[:2]))
+        assert len(open_store(path)) == len(set(ids[:2]))
+    finally:
+        close_stores()
@@ -0,0 +1,86 @@
+# [KO] 실행 결과 export: run_id/company_id 파티션, 단계 직후 회사별 기록, JSONL 폴백
+import json
+
+import pytest
+
+from graph import export
+from graph.state import CompanyMeta, Evidence, PipelineState, ScoreCard, ScoreItem
+
+
+def _ev(i):
+    return Evidence(source=f"https://a.ai/{i}", text=f"t{i}", category="market", published=None)
+
+
+def _read_jsonl(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def _nodes():
+    def _rag(s):
+        for c in s.companies:
+            s.retrieved_evidence[c.id] = {"market": [_ev(0), _ev(1)], "team": [_ev(2)]}
+        return s
+
+    def _scoring(s):
+        for c in s.companies:
+            item = ScoreItem(key="market", value=8.0, confidence=0.7, evidence=[_ev(0)])
+            s.scorecard[c.id] = ScoreCard(items=[item], total=8.0, decision="invest")
+        return s
+
+    return {"rag": _rag, "scoring": _scoring, "report": lambda s: s}
+
+
+def test_stage_outputs_partitioned_per_company(tmp_path):
+    exporter = export.open_export("run_x", root=str(tmp_path), columnar="jsonl")
+    try:
+        export.export_chunks("a/b", [_ev(0), _ev(1)])
+        export.export_chunks("a/b", [_ev(2)])
+        nodes = exporter.instrument(_nodes())
+        state = PipelineState(
+            query="q", companies=[CompanyMeta(id="a/b", name="A"), CompanyMeta(id="c", name="C")]
+        )
+        for key in ("rag", "scoring", "report"):
+            state = nodes[key](state)
+    finally:
+        manifest = export.close_export()
+    assert export.current() is None
+
+    run = tmp_path / "run_id=run_x"
+    chunks = _read_jsonl(run / "chunks" / "company_id=a%2Fb" / "part-00000.jsonl")
+    assert [r["source"] for r in chunks] == ["https://a.ai/0", "https://a.ai/1", "https://a.ai/2"]
+    ev = _read_jsonl(run / "evidence" / "company_id=c" / "part-00000.jsonl")
+    assert [(r["axis"], r["rank"]) for r in ev] == [("market", 0), ("market", 1), ("team", 0)]
+    sc = _read_jsonl(run / "scorecards" / "company_id=c" / "part-00000.jsonl")
+    assert sc == [
+        {
+            "axis": "market",
+            "value": 8.0,
+            "confidence": 0.7,
+            "notes": "",
+            "n_evidence": 1,
+            "total": 8.0,
+            "decision": "invest",
+        }
+    ]
+    assert manifest["datasets"]["evidence"] == {"format": "jsonl", "rows": 6, "files": 2}
+    assert json.loads((run / "manifest.json").read_text())["datasets"]["chunks"]["rows"] == 3
+
+
+def test_buffer_flushes_in_parts(tmp_path):
+    exporter = export.RunExporter("r", root=str(tmp_path), columnar="jsonl", flush_rows=4)
+    exporter.append("evidence", "a", export.evidence_rows({"market": [_ev(i) for i in range(10)]}))
+    exporter.close()
+    parts = sorted((tmp_path / "run_id=r" / "evidence" / "company_id=a").iterdir())
+    assert [len(_read_jsonl(p)) for p in parts] == [4, 4, 2]
+
+
+def test_parquet_column_pruning(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    exporter = export.RunExporter("r", root=str(tmp_path), columnar="parquet")
+    exporter.append("evidence", "a", export.evidence_rows({"market": [_ev(0), _ev(1)]}))
+    exporter.close()
+    table = pq.read_table(
+        tmp_path / "run_id=r" / "evidence" / "company_id=a" / "part-00000.parquet",
+        columns=["axis", "rank"],
+    )
+    assert table.to_pylist() == [{"axis": "market", "rank": 0}, {"axis": "market", "rank": 1}]
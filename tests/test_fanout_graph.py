@@ -0,0 +1,70 @@
+# [KO] Fan-out 그래프: Send 분기 병렬 실행 + reducer 병합 + 동시성 제한 확인
+import threading
+import time
+
+from graph.graph import build_fanout_graph
+from graph.state import CompanyMeta, Evidence, PipelineState, ScoreCard
+
+_active = {"now": 0, "max": 0}
+_lock = threading.Lock()
+
+
+def _seraph(s):
+    s.companies = [CompanyMeta(id=f"c{i}", name=f"C{i}") for i in range(5)]
+    return s
+
+
+def _augment(s):
+    with _lock:
+        _active["now"] += 1
+        _active["max"] = max(_active["max"], _active["now"])
+    time.sleep(0.05)
+    with _lock:
+        _active["now"] -= 1
+    c = s.companies[0]
+    s.companies = [c.model_copy(update={"region": "KR"})]
+    s.chunks.append(Evidence(source=f"https://{c.id}.ai", text=c.name, category="market"))
+    return s
+
+
+def _rag(s):
+    s.retrieved_evidence[s.companies[0].id] = {"market": list(s.chunks)}
+    return s
+
+
+def _scoring(s):
+    s.scorecard[s.companies[0].id] = ScoreCard(total=5.0)
+    return s
+
+
+def _report(s):
+    s.reports[s.companies[0].id] = f"outputs/reports/{s.companies[0].id}.pdf"
+    return s
+
+
+FAKES = {
+    "seraph": _seraph,
+    "filter": lambda s: s,
+    "augment": _augment,
+    "rag": _rag,
+    "scoring": _scoring,
+    "report": _report,
+}
+
+
+def test_fanout_merges_company_branches():
+    g = build_fanout_graph(max_concurrency=2, node_factory=lambda keys: {k: FAKES[k] for k in keys})
+    out = g.invoke(PipelineState(query="ai finance"))
+
+    assert [c.id for c in out["companies"]] == [f"c{i}" for i in range(5)]
+    assert all(c.region == "KR" for c in out["companies"])
+    assert len(out["chunks"]) == 5
+    assert set(out["retrieved_evidence"]) == set(out["scorecard"]) == set(out["reports"])
+    assert len(out["reports"]) == 5
+    assert 1 <= _active["max"] <= 2
+
+
+def test_fanout_without_companies():
+    g = build_fanout_graph(node_factory=lambda keys: {k: (lambda s: s) for k in keys})
+    out = g.invoke(PipelineState(query="ai finance"))
+    assert out["companies"] == [] and out["reports"] == {}
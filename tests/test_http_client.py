@@ -0,0 +1,48 @@
+# [KO] 공유 HTTP 클라이언트: keep-alive 재사용 + 5xx 재시도 스모크 (로컬 서버)
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from agents.http_client import HttpClient
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    fail_first = {"n": 1}
+
+    def do_GET(self):
+        if self.path == "/flaky" and self.fail_first["n"] > 0:
+            self.fail_first["n"] -= 1
+            status, body = 503, b"busy"
+        else:
+            status, body = 200, b"ok"
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _serve():
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    return srv, f"http://127.0.0.1:{srv.server_address[1]}"
+
+
+def test_keepalive_reuse_and_retry():
+    srv, base = _serve()
+    try:
+        client = HttpClient(backoff_base=0.01)
+        for _ in range(3):
+            assert client.get(base + "/ok", timeout=5).text == "ok"
+        assert client.get(base + "/flaky", timeout=5).status_code == 200
+
+        st = client.stats()
+        assert st["requests"] == 4
+        assert st["retries"] == 1
+        assert st["connections_opened"] == 1
+        assert st["connections_reused"] >= 3
+        client.close()
+    finally:
+        srv.shutdown()
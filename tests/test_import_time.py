@@ -0,0 +1,52 @@
+# [KO] 콜드 스타트 임포트 프로파일 (-X importtime)
+#      graph.run / graph.server / agents.scoring_agent 임포트 시 무거운 의존성이 로딩되지 않는지 확인
+#      `pytest -s tests/test_import_time.py` 로 누적 임포트 시간 상위 모듈 요약을 볼 수 있습니다.
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+HEAVY = ("openai", "chromadb", "langgraph", "langchain_openai", "playwright", "bs4", "pdfplumber")
+
+
+def importtime(module: str) -> dict[str, int]:
+    """Top-level package → cumulative import time (µs) reported by `python -X importtime`."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    out: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = (p.strip() for p in line[len("import time:") :].split("|"))
+        if not name.startswith(" ") and name.strip():
+            pkg = name.strip().split(".")[0]
+            out[pkg] = max(out.get(pkg, 0), int(cumulative))
+    return out
+
+
+@pytest.mark.parametrize("module", ["graph.run", "graph.server", "agents.scoring_agent"])
+def test_cold_start_skips_heavy_dependencies(module):
+    times = importtime(module)
+    top = sorted(times.items(), key=lambda kv: kv[1], reverse=True)[:8]
+    print(f"\n[importtime] {module}: " + ", ".join(f"{k}={v / 1000:.0f}ms" for k, v in top))
+    assert not [m for m in HEAVY if m in times], f"eager heavy imports: {top}"
+
+
+def test_lazy_node_resolves_on_first_call():
+    from graph.nodes import LazyNode, load_nodes, resolve_nodes
+    from graph.state import PipelineState
+
+    node = LazyNode("scoring", "agents.scoring_agent.ScoringAgent")
+    assert not node.resolved
+    state = node(PipelineState(query="q"))
+    assert node.resolved and isinstance(state, PipelineState)
+
+    nodes = load_nodes(("scoring",))
+    assert resolve_nodes(nodes)["scoring"].resolved
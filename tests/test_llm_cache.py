@@ -0,0 +1,63 @@
+# [KO] LLM 응답 캐시: hit/miss, TTL 만료, 용량 초과 시 LRU 삭제, 비활성화
+import os
+import time
+
+from agents.llm_cache import LLMResponseCache, cache_key
+
+
+class _Msg:
+    def __init__(self, type_, content):
+        self.type = type_
+        self.content = content
+
+
+def test_key_depends_on_model_temperature_and_prompt():
+    msgs = [_Msg("system", "s"), _Msg("human", "hello")]
+    k = cache_key("gpt-4o-mini", 0.4, msgs)
+    assert k == cache_key("gpt-4o-mini", 0.4, [_Msg("system", "s"), _Msg("human", "hello")])
+    assert k != cache_key("gpt-4o-mini", 0.7, msgs)
+    assert k != cache_key("gpt-4o", 0.4, msgs)
+    assert k != cache_key("gpt-4o-mini", 0.4, [_Msg("system", "s"), _Msg("human", "hello!")])
+
+
+def test_hit_miss_and_ttl(tmp_path):
+    cache = LLMResponseCache(cache_dir=str(tmp_path), ttl_s=60, enabled=True)
+    assert cache.get("ab" * 32) is None
+    cache.put("ab" * 32, '{"x": 1}')
+    assert cache.get("ab" * 32) == '{"x": 1}'
+
+    cache.ttl_s = 0.01
+    time.sleep(0.02)
+    assert cache.get("ab" * 32) is None
+    assert cache.stats() == {"misses": 2, "writes": 1, "hits": 1, "expired": 1}
+
+
+def test_size_bounded_eviction_drops_least_recently_used(tmp_path):
+    cache = LLMResponseCache(cache_dir=str(tmp_path), max_bytes=1200, enabled=True)
+    keys = [f"{i:02d}" * 32 for i in range(3)]
+    for i, k in enumerate(keys):
+        cache.put(k, "x" * 300)
+        os.utime(cache._path(k), (1000 + i, 1000 + i))
+    cache.get(keys[0])  # 최근 사용 → 보존
+    cache.put("ff" * 32, "y" * 300)
+
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None
+    assert cache.stats()["evictions"] >= 1
+
+
+def test_disabled_cache_bypasses(tmp_path, monkeypatch):
+    monkeypatch.setenv("LLM_CACHE", "0")
+    cache = LLMResponseCache(cache_dir=str(tmp_path))
+    cache.put("ab" * 32, "v")
+    assert cache.get("ab" * 32) is None
+    assert not any(tmp_path.iterdir())
+
+
+def test_overwrite_does_not_inflate_size_estimate(tmp_path):
+    cache = LLMResponseCache(str(tmp_path), max_bytes=2_000, enabled=True)
+    cache.put("aa" + "0" * 62, "first")
+    for i in range(50):  # 같은 키 반복 덮어쓰기 → 추정 크기는 실제 파일 크기와 같아야 함
+        cache.put("aa" + "0" * 62, "x" * 100 + str(i))
+    assert cache._size == cache._scan_size()
+    assert cache.stats().get("evictions", 0) == 0
@@ -0,0 +1,38 @@
+# [KO] LLM rate limiter: 동시성 상한 + RPM 버킷 대기 확인
+import asyncio
+import time
+
+from agents.llm_limiter import AsyncRateLimiter, estimate_tokens
+
+
+def test_concurrency_cap():
+    async def main():
+        limiter = AsyncRateLimiter(max_concurrent=2, rpm=10_000, tpm=10_000_000)
+        state = {"now": 0, "max": 0}
+
+        async def call():
+            async with limiter.slot(100):
+                state["now"] += 1
+                state["max"] = max(state["max"], state["now"])
+                await asyncio.sleep(0.02)
+                state["now"] -= 1
+
+        await asyncio.gather(*(call() for _ in range(6)))
+        return state["max"]
+
+    assert asyncio.run(main()) == 2
+
+
+def test_rpm_bucket_waits_for_refill():
+    async def main():
+        limiter = AsyncRateLimiter(max_concurrent=10, rpm=600, tpm=10_000_000)  # 10 req/s
+        limiter._req = 0.0  # 버킷 소진 상태에서 시작
+        t0 = time.monotonic()
+        await asyncio.gather(*(limiter.acquire(1) for _ in range(3)))
+        return time.monotonic() - t0
+
+    assert asyncio.run(main()) >= 0.25
+
+
+def test_estimate_tokens():
+    assert estimate_tokens("a" * 300, completion_budget=0) == 100
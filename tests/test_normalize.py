@@ -0,0 +1,76 @@
+# [KO] 공용 정규화 모듈: 기존 인라인 구현과 결과 동일성
+import random
+from datetime import datetime, timedelta, timezone
+
+from agents.normalize import (
+    DomainClassifier,
+    domain_of,
+    registrable_domain,
+    root_origin,
+    within_recency,
+)
+from agents.rag_retriever_agent import ALLOWED_MEDIA, ALLOWED_REGULATORS, _domain_type
+
+
+def _old_within_recency(iso_date, months):
+    if not iso_date:
+        return False
+    try:
+        s = iso_date.strip()
+        if s.endswith("Z"):
+            s = s[:-1] + "+00:00"
+        dt = datetime.fromisoformat(s)
+        dt = dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt.astimezone(timezone.utc)
+        return (datetime.now(timezone.utc) - dt) <= timedelta(days=30 * months)
+    except Exception:
+        return False
+
+
+def _old_domain_type(d, base):
+    if not d:
+        return "other"
+    if base and (d == base or d.endswith("." + base)):
+        return "first_party"
+    if any(d == x or d.endswith("." + x) for x in ALLOWED_REGULATORS):
+        return "regulator"
+    if any(d == x or d.endswith("." + x) for x in ALLOWED_MEDIA):
+        return "media"
+    return "other"
+
+
+def test_within_recency_matches_timedelta_comparison():
+    now = datetime.now(timezone.utc)
+    samples = [None, "", "  ", "garbage", "2024-13-01", 20240101, "2025-01-01Z"]
+    for days in (0, 10, 539, 541, 2000):
+        d = now - timedelta(days=days)
+        samples += [d.date().isoformat(), d.isoformat(), d.strftime("%Y-%m-%dT%H:%M:%SZ")]
+        samples.append(d.astimezone(timezone(timedelta(hours=9))).isoformat())
+    for s in samples:
+        for months in (1, 18):
+            assert within_recency(s, months) == _old_within_recency(s, months), (s, months)
+
+
+def test_domain_type_matches_linear_scan():
+    rng = random.Random(0)
+    labels = ["www", "news", "sec", "gov", "reuters", "com", "fca", "org", "uk", "x", "finchat"]
+    hosts = [".".join(rng.choice(labels) for _ in range(rng.randint(1, 4))) for _ in range(500)]
+    hosts += ["sec.gov", "www.reuters.com", "notreuters.com", "fca.org.uk", ""]
+    for h in hosts:
+        for base in (None, "https://finchat.ai", "https://www.reuters.com"):
+            url = f"https://{h}/p" if h else ""
+            assert _domain_type(url, base) == _old_domain_type(
+                domain_of(url), domain_of(base) if base else None
+            ), (url, base)
+
+
+def test_classifier_priority_and_helpers():
+    c = DomainClassifier({"a": ["x.com"], "b": ["y.x.com", "z.org"]}, default="other")
+    assert c.classify("y.x.com") == "a"
+    assert c.classify("q.z.org") == "b"
+    assert c.classify("zz.org") == "other"
+    assert domain_of("https://WWW.FinChat.ai/Path") == "www.finchat.ai"
+    assert domain_of("http://[bad") == ""
+    assert root_origin("https://finchat.ai/a?b=1") == "https://finchat.ai"
+    assert root_origin("finchat.ai") == "finchat.ai"
+    assert registrable_domain("https://news.bbc.co.uk/x") == "bbc.co.uk"
+    assert registrable_domain("blog.finchat.ai:8080") == "finchat.ai"
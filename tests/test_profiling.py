@@ -0,0 +1,58 @@
+# [KO] 단계 프로파일러: 노드 래핑 + 스레드 scope 카운터 귀속 + JSON 저장 확인
+import json
+import sys
+
+from graph import metrics
+from graph.profiling import RunProfiler
+from graph.state import CompanyMeta, PipelineState
+from graph.stream import run_streaming
+
+
+def _fetching(stage):
+    def _node(s):
+        metrics.incr("http.requests")
+        metrics.incr("http.bytes", 100)
+        return s
+
+    return _node
+
+
+def test_profiler_records_stage_and_company(tmp_path):
+    prof = RunProfiler()
+    nodes = prof.instrument({k: _fetching(k) for k in ("augment", "rag", "scoring", "report")})
+    state = PipelineState(
+        query="q", companies=[CompanyMeta(id="a", name="A"), CompanyMeta(id="b", name="B")]
+    )
+    run_streaming(state, nodes)
+
+    assert len(prof.records) == 8
+    assert {r.company_id for r in prof.records} == {"a", "b"}
+    summary = prof.stage_summary()
+    assert summary["augment"]["calls"] == 2
+    assert summary["augment"]["counters"] == {"http.requests": 2, "http.bytes": 200}
+
+    path = prof.write(tmp_path / "run.profile.json", mode="stream")
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert data["run"]["mode"] == "stream"
+    assert set(data["stages"]) == {"augment", "rag", "scoring", "report"}
+
+
+def test_scope_isolates_outer_counts():
+    with metrics.scope() as outer:
+        metrics.incr("llm.calls")
+        with metrics.scope() as inner:
+            metrics.incr("llm.tokens", 42)
+    assert inner == {"llm.tokens": 42}
+    assert outer == {"llm.calls": 1, "llm.tokens": 42}
+
+
+def test_missing_resource_module_reports_peak_rss_as_null(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "resource", None)  # Windows: import 실패
+    prof = RunProfiler()
+    nodes = prof.instrument({"scoring": _fetching("scoring")})
+    nodes["scoring"](PipelineState(query="q"))
+
+    assert prof.records[0].peak_rss_mb is None
+    assert prof.stage_summary()["scoring"]["peak_rss_mb"] is None
+    data = json.loads(prof.write(tmp_path / "p.json").read_text(encoding="utf-8"))
+    assert data["run"]["peak_rss_mb"] is None
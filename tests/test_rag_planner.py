@@ -0,0 +1,97 @@
+# [KO] RAG 글로벌 풀 공유 플래너 스모크 (in-memory Chroma, OpenAI 호출 없음)
+import uuid
+
+import chromadb
+
+from agents.rag_retriever_agent import _RetrievalPlanner
+
+
+def _make_collection():
+    client = chromadb.EphemeralClient()
+    col = client.get_or_create_collection(
+        name=f"planner-{uuid.uuid4().hex[:8]}", metadata={"hnsw:space": "cosine"}
+    )
+    col.add(
+        ids=["a", "b", "c"],
+        embeddings=[[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.7, 0.7, 0.0]],
+        documents=["doc-a", "doc-b", "doc-c"],
+        metadatas=[
+            {"source": "https://a.com"},
+            {"source": "https://b.com"},
+            {"source": "https://c.com"},
+        ],
+    )
+    return col
+
+
+def test_query_cached_by_vector_hash():
+    planner = _RetrievalPlanner(_make_collection(), pool_topk=3)
+    r1 = planner.query([1.0, 0.0, 0.0], None, 2)
+    r2 = planner.query([1.0, 0.0, 0.0], None, 2)
+    assert r1 is r2
+    assert planner.issued == 1 and planner.served == 1
+
+
+def test_global_pool_shared_across_companies():
+    planner = _RetrievalPlanner(_make_collection(), pool_topk=3)
+    axis = [0.5, 0.5, 0.0]
+    docs_x, _, sims_x = planner.global_view("market", axis, [1.0, 0.0, 0.0], 2)
+    docs_y, _, _ = planner.global_view("market", axis, [0.0, 1.0, 0.0], 2)
+
+    # 회사별 view는 자기 질의 임베딩 기준으로 재정렬되지만, Chroma 호출은 1회뿐
+    assert docs_x[0] == "doc-a" and docs_y[0] == "doc-b"
+    assert abs(sims_x[0] - 1.0) < 1e-6
+    assert planner.issued == 1
+
+
+def test_pool_kept_across_invocations_until_collection_changes():
+    col = _make_collection()
+    planner = _RetrievalPlanner(col, pool_topk=3)
+    axis = [0.5, 0.5, 0.0]
+
+    # stream/fan-out: 회사마다 invoke → 같은 질의·컬렉션이면 풀 재사용
+    assert not planner.begin(("q", col.count()))
+    planner.global_view("market", axis, [1.0, 0.0, 0.0], 2)
+    assert planner.begin(("q", col.count()))
+    planner.global_view("market", axis, [0.0, 1.0, 0.0], 2)
+    assert planner.issued == 0
+
+    # 새 청크 적재 → 풀 재구성 (새 문서가 보임)
+    col.add(
+        ids=["d"],
+        embeddings=[[0.6, 0.8, 0.0]],
+        documents=["doc-d"],
+        metadatas=[{"source": "https://d.com"}],
+    )
+    assert not planner.begin(("q", col.count()))
+    docs, _, _ = planner.global_view("market", axis, [0.6, 0.8, 0.0], 1)
+    assert docs == ["doc-d"] and planner.issued == 1
+    assert not planner.begin(("other query", col.count()))
+
+
+def test_shared_pool_is_approximate_outside_pool():
+    col = _make_collection()
+    axis, company_q = [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]
+    exact = _RetrievalPlanner(col, pool_topk=3).query(company_q, None, 1)["documents"][0]
+    assert exact == ["doc-b"]  # share_global_pool=False: 회사별 개별 질의
+
+    # 풀(축 질의 상위 1개)에 실제 최근접 문서가 없으면 다른 근거가 선택됨
+    docs, _, _ = _RetrievalPlanner(col, pool_topk=1).global_view("market", axis, company_q, 1)
+    assert docs == ["doc-a"]
+    # 풀이 최근접 문서를 포함하면 개별 질의와 같은 결과
+    docs, _, _ = _RetrievalPlanner(col, pool_topk=3).global_view("market", axis, company_q, 1)
+    assert docs == exact
+
+
+def test_query_cache_is_bounded_lru():
+    planner = _RetrievalPlanner(_make_collection(), pool_topk=3, max_cached=2)
+    a, b, c = [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.7, 0.7, 0.0]
+    planner.query(a, None, 1)
+    planner.query(b, None, 1)
+    planner.query(a, None, 1)  # a 최근 사용 → b 가 가장 오래됨
+    planner.query(c, None, 1)
+    assert len(planner._cache) == 2
+    planner.query(a, None, 1)
+    assert planner.issued == 3 and planner.served == 2
+    planner.query(b, None, 1)  # 밀려난 항목은 다시 질의
+    assert planner.issued == 4
@@ -0,0 +1,273 @@
+# [KO] 리포트 모드(html/deferred)와 PDF 변환 큐
+import asyncio
+
+import pytest
+
+from agents.pdf_renderer import enqueue_pdf, load_pending, render_pending
+
+
+def _agent(tmp_path, monkeypatch, mode):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    from agents.report_writer_agent import ReportWriterAgent
+
+    tpl = tmp_path / "tpl"
+    tpl.mkdir()
+    (tpl / "r.html.j2").write_text("<h1>{{ name }}</h1>", encoding="utf-8")
+    return ReportWriterAgent(
+        template_dir=str(tpl),
+        template_name="r.html.j2",
+        output_dir=str(tmp_path / "out"),
+        report_mode=mode,
+        llm_cache=False,
+        pdf_queue_path=str(tmp_path / "out" / "q.jsonl"),
+        template_cache_dir=str(tmp_path / "jinja"),
+    )
+
+
+def test_html_mode_writes_html_only(tmp_path, monkeypatch):
+    agent = _agent(tmp_path, monkeypatch, "html")
+    html_path, pdf_path = asyncio.run(agent._render_pdf("Acme", {"name": "Acme"}))
+    assert pdf_path is None
+    assert open(html_path, encoding="utf-8").read() == "<h1>Acme</h1>"
+    assert not (tmp_path / "out" / "q.jsonl").exists()
+
+
+def test_deferred_mode_queues_pdf(tmp_path, monkeypatch):
+    agent = _agent(tmp_path, monkeypatch, "deferred")
+    html_path, pdf_path = asyncio.run(agent._render_pdf("Acme", {"name": "Acme"}))
+    assert pdf_path is None
+    jobs = load_pending(agent.pdf_queue_path)
+    assert jobs == [
+        {"company": "Acme", "html_path": html_path, "pdf_path": html_path[:-5] + ".pdf"}
+    ]
+
+
+def test_invalid_mode_rejected(tmp_path, monkeypatch):
+    with pytest.raises(ValueError):
+        _agent(tmp_path, monkeypatch, "docx")
+
+
+def test_queue_dedupes_and_drops_missing_html(tmp_path):
+    q = str(tmp_path / "q.jsonl")
+    enqueue_pdf("a_old.html", "a.pdf", "A", queue_path=q)
+    enqueue_pdf(str(tmp_path / "missing.html"), "a.pdf", "A", queue_path=q)
+    with open(q, "a", encoding="utf-8") as f:
+        f.write("not json\n")
+    jobs = load_pending(q)
+    assert [j["html_path"] for j in jobs] == [str(tmp_path / "missing.html")]
+
+    # HTML이 없는 작업은 브라우저 기동 없이 버려지고 큐가 비워짐
+    result = asyncio.run(render_pending(q))
+    assert result == {"done": [], "failed": []}
+    assert load_pending(q) == []
+
+
+def test_jobs_enqueued_during_render_survive(tmp_path, monkeypatch):
+    import agents.pdf_renderer as pdf_renderer
+
+    q = str(tmp_path / "q.jsonl")
+    html = tmp_path / "a.html"
+    html.write_text("<h1>A</h1>", encoding="utf-8")
+    enqueue_pdf(str(html), str(tmp_path / "a.pdf"), "A", queue_path=q)
+
+    class FakeRenderer:
+        def __init__(self, pages):
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return None
+
+        async def render(self, html_path, pdf_path):
+            # 렌더 도중 다른 실행(프로세스)이 새 작업을 적재
+            enqueue_pdf(str(html), str(tmp_path / "b.pdf"), "B", queue_path=q)
+            if pdf_path.endswith("c.pdf"):
+                raise RuntimeError("boom")
+            return pdf_path
+
+    monkeypatch.setattr(pdf_renderer, "PdfRenderService", FakeRenderer)
+    enqueue_pdf(str(html), str(tmp_path / "c.pdf"), "C", queue_path=q)
+    result = asyncio.run(render_pending(q))
+
+    assert [j["company"] for j in result["done"]] == ["A"]
+    assert [j["company"] for j in result["failed"]] == ["C"]
+    assert sorted(j["company"] for j in load_pending(q)) == ["B", "C"]
+    assert not list(tmp_path.glob("*.claimed"))
+
+
+def test_unchanged_fingerprint_skips_regeneration(tmp_path, monkeypatch):
+    agent = _agent(tmp_path, monkeypatch, "html")
+    calls = []
+
+    async def fake_context(company, state, total, mean_conf):
+        calls.append(company)
+        return {"name": company, "scorecard": {"decision": "invest"}}
+
+    agent._build_context = fake_context
+    payload = {
+        "company_id": "acme",
+        "company_name": "Acme",
+        "fae_score": {"total": 8.0},
+        "confidence": {"mean": 0.7},
+    }
+
+    first = asyncio.run(agent.run(dict(payload)))
+    second = asyncio.run(agent.run(dict(payload)))
+    assert len(calls) == 1
+    assert second["unchanged"] and second["report_path"] == first["report_path"]
+
+    # 점수 변경 → 재생성
+    asyncio.run(agent.run({**payload, "fae_score": {"total": 8.1}}))
+    assert len(calls) == 2
+
+    # 템플릿 변경 → 재생성
+    (tmp_path / "tpl" / "r.html.j2").write_text("<h2>{{ name }}</h2>", encoding="utf-8")
+    asyncio.run(agent.run({**payload, "fae_score": {"total": 8.1}}))
+    assert len(calls) == 3
+
+    agent.incremental = False
+    asyncio.run(agent.run({**payload, "fae_score": {"total": 8.1}}))
+    assert len(calls) == 4
+
+
+def test_portfolio_renders_one_ranked_document(tmp_path, monkeypatch):
+    import shutil
+
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    from agents.report_writer_agent import ReportWriterAgent
+
+    tpl = tmp_path / "tpl"
+    shutil.copytree("docs/templates", tpl)
+    agent = ReportWriterAgent(
+        template_dir=str(tpl),
+        output_dir=str(tmp_path / "out"),
+        report_mode="html",
+        llm_cache=False,
+        template_cache_dir=str(tmp_path / "jinja"),
+        portfolio=True,
+    )
+
+    async def fake_context(company, state, total, mean_conf):
+        return {
+            "company": {"name": company, "tags": []},
+            "query": "q",
+            "scorecard": {"total": total, "decision": "invest", "items": []},
+            "position_points": [],
+            "risks": [],
+            "strength_bullets": [],
+            "weakness_bullets": [],
+        }
+
+    agent._build_context = fake_context
+    payloads = [
+        {
+            "company_id": cid,
+            "company_name": name,
+            "fae_score": {"total": total},
+            "confidence": {"mean": 0.7},
+        }
+        for cid, name, total in [("a", "Alpha", 7.8), ("b", "Beta", 9.1), ("c", "Gamma", 5.0)]
+    ]
+    results = asyncio.run(agent._run_all(payloads))
+
+    assert results[0]["report_path"] == results[1]["report_path"]
+    assert results[2]["skipped"]  # 게이트 미달은 문서에서 제외
+    html = open(results[0]["report_path"], encoding="utf-8").read()
+    assert html.count('<div class="pagebreak"></div>\n  <article') == 2
+    assert html.index('href="#company-1">Beta') < html.index('href="#company-2">Alpha')
+    assert html.count("<html") == 1
+    assert results[0]["report_path"] == str(tmp_path / "out" / "portfolio" / "portfolio.html")
+
+
+def test_portfolio_does_not_collide_with_company_report(tmp_path, monkeypatch):
+    agent = _agent(tmp_path, monkeypatch, "html")
+    company_path, _ = asyncio.run(agent._render_pdf("portfolio", {"name": "portfolio"}))
+    portfolio_dir = tmp_path / "out" / "portfolio"
+    portfolio_dir.mkdir()
+    shared_path, _ = asyncio.run(
+        agent._render_pdf("portfolio", {"name": "All"}, output_dir=str(portfolio_dir))
+    )
+    assert company_path != shared_path
+    assert open(company_path, encoding="utf-8").read() == "<h1>portfolio</h1>"
+    assert open(shared_path, encoding="utf-8").read() == "<h1>All</h1>"
+
+
+def test_one_failing_company_keeps_other_reports(tmp_path, monkeypatch, caplog):
+    agent = _agent(tmp_path, monkeypatch, "html")
+
+    async def fake_context(company, state, total, mean_conf):
+        if company == "Bad":
+            raise RuntimeError("llm down")
+        return {"name": company, "scorecard": {"decision": "invest"}}
+
+    agent._build_context = fake_context
+    payloads = [
+        {
+            "company_id": name.lower(),
+            "company_name": name,
+            "fae_score": {"total": 8.0},
+            "confidence": {"mean": 0.7},
+        }
+        for name in ("Good", "Bad", "Fine")
+    ]
+    results = asyncio.run(agent._run_all(payloads))
+
+    assert [bool(r.get("report_path")) for r in results] == [True, False, True]
+    assert "llm down" in results[1]["error"]
+    assert "failed for Bad" in caplog.text
+
+
+def test_report_gate_follows_scoring_invest_gate(tmp_path, monkeypatch):
+    from agents import report_writer_agent, scoring_agent
+
+    assert (report_writer_agent.INVEST_TOTAL, report_writer_agent.INVEST_CONF) == (
+        scoring_agent.INVEST_TOTAL,
+        scoring_agent.INVEST_CONF,
+    )
+    agent = _agent(tmp_path, monkeypatch, "html")
+
+    async def fake_context(company, state, total, mean_conf):
+        return {"name": company, "scorecard": {"decision": "invest"}}
+
+    agent._build_context = fake_context
+    payload = {
+        "company_id": "a",
+        "company_name": "Acme",
+        "fae_score": {"total": 6.0},
+        "confidence": {"mean": 0.5},
+    }
+    assert asyncio.run(agent._prepare(payload))["skipped"]
+
+    monkeypatch.setattr(report_writer_agent, "INVEST_TOTAL", 6.0)
+    monkeypatch.setattr(report_writer_agent, "INVEST_CONF", 0.5)
+    assert "context" in asyncio.run(agent._prepare(payload))
+
+
+def test_template_tree_hashed_once_per_stage(tmp_path, monkeypatch):
+    agent = _agent(tmp_path, monkeypatch, "html")
+    calls = []
+    template_hash = agent._template_hash
+    monkeypatch.setattr(agent, "_template_hash", lambda: calls.append(1) or template_hash())
+
+    async def fake_context(company, state, total, mean_conf):
+        return {"name": company, "scorecard": {"decision": "invest"}}
+
+    agent._build_context = fake_context
+    payloads = [
+        {
+            "company_id": name.lower(),
+            "company_name": name,
+            "fae_score": {"total": 8.0},
+            "confidence": {"mean": 0.7},
+        }
+        for name in ("A", "B", "C")
+    ]
+    asyncio.run(agent._run_all(payloads))
+    assert len(calls) == 1
+
+    (tmp_path / "tpl" / "r.html.j2").write_text("<h2>{{ name }}</h2>", encoding="utf-8")
+    results = asyncio.run(agent._run_all(payloads))
+    assert all(r["report_path"] and not r["skipped"] for r in results)
+    assert len(calls) == 2  # 다음 실행은 바뀐 템플릿으로 다시 계산
@@ -0,0 +1,90 @@
+# [KO] 증분 재채점: 근거가 바뀐 축만 다시 계산하고 결과는 전체 재채점과 동일
+import json
+import random
+
+import pytest
+
+from agents.scoring_agent import ScoringAgent
+from agents.scoring_engine import AXES
+from graph import metrics
+from graph.state import Evidence
+
+
+def _agent(tmp_path, engine):
+    return ScoringAgent(
+        engine=engine,
+        incremental=True,
+        cache_dir=str(tmp_path / "cache"),
+        change_log=str(tmp_path / "changes.jsonl"),
+    )
+
+
+def _full(state, engine):
+    return ScoringAgent(engine=engine)(state.model_copy(deep=True)).scorecard
+
+
+def _run(tmp_path, engine, state):
+    with metrics.scope() as counts:
+        scorecard = _agent(tmp_path, engine)(state.model_copy(deep=True)).scorecard
+    return scorecard, (counts["scoring.axes_cached"], counts["scoring.axes_scored"])
+
+
+@pytest.mark.parametrize("engine", ["python", "columnar"])
+def test_rerun_reuses_unchanged_axes(tmp_path, engine, random_state):
+    state = random_state(random.Random(3), 6)
+    n_axes = len(state.companies) * len(AXES)
+
+    first, counts = _run(tmp_path, engine, state)
+    assert counts == (0, n_axes)
+    assert first == _full(state, engine)
+
+    second, counts = _run(tmp_path, engine, state)
+    assert counts == (n_axes, 0)
+    assert second == first
+
+    # 한 회사의 한 축 근거만 변경 → 그 축만 재채점, 결과는 전체 재채점과 동일
+    changed = state.model_copy(deep=True)
+    changed.retrieved_evidence["c1"]["market"] = [
+        Evidence(
+            text=f"new market proof {i}",
+            source=f"https://m{i}.com/x",
+            category="market",
+            strength="strong",
+        )
+        for i in range(3)
+    ]
+    third, counts = _run(tmp_path, engine, changed)
+    assert counts == (n_axes - 1, 1)
+    assert third == _full(changed, engine)
+
+    lines = (tmp_path / "changes.jsonl").read_text(encoding="utf-8").splitlines()
+    entry = json.loads(lines[-1])
+    assert entry["company_id"] == "c1" and entry["dirty_axes"] == ["market"]
+    assert set(entry["axes"]) <= {"market"}
+    assert entry["total"][1] == third["c1"].total
+
+
+def test_incremental_only_for_pipeline_nodes(tmp_path, monkeypatch, random_state):
+    from graph.nodes import load_nodes
+
+    agent = ScoringAgent(cache_dir=str(tmp_path / "cache"), change_log="")
+    assert agent.cache is None  # 단독 사용은 캐시 파일을 건드리지 않음
+    agent(random_state(random.Random(4), 2))
+    assert not (tmp_path / "cache").exists()
+
+    monkeypatch.delenv("SCORING_FORCE", raising=False)
+    assert load_nodes(("scoring",), lazy=False)["scoring"].cache is not None
+    monkeypatch.setenv("SCORING_FORCE", "1")
+    assert load_nodes(("scoring",), lazy=False)["scoring"].cache is None
+
+
+def test_scoring_version_invalidates_cache(tmp_path, monkeypatch, random_state):
+    import agents.scoring_agent as scoring_agent
+
+    state = random_state(random.Random(5), 3)
+    n_axes = len(state.companies) * len(AXES)
+    _run(tmp_path, "python", state)
+    assert _run(tmp_path, "python", state)[1] == (n_axes, 0)
+
+    monkeypatch.setattr(scoring_agent, "SCORING_VERSION", scoring_agent.SCORING_VERSION + 1)
+    assert _run(tmp_path, "python", state)[1] == (0, n_axes)
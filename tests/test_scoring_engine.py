@@ -0,0 +1,27 @@
+# [KO] 열(column) 기반 일괄 스코어링: 기존 회사별 루프와 ScoreCard 동일성
+import random
+
+from agents.scoring_agent import ScoringAgent
+from agents.scoring_engine import score_companies
+
+
+def test_columnar_matches_per_company_loop(random_state):
+    rng = random.Random(11)
+    state = random_state(rng, 120)
+    expected = ScoringAgent(engine="python")(state.model_copy(deep=True)).scorecard
+    got = ScoringAgent(engine="columnar")(state.model_copy(deep=True)).scorecard
+
+    assert list(got) == list(expected)
+    for cid, sc in expected.items():
+        assert got[cid].model_dump() == sc.model_dump()
+    assert {sc.decision for sc in expected.values()} == {"invest", "hold"}
+
+
+def test_auto_engine_and_empty_input(random_state):
+    assert score_companies([]) == []
+    state = random_state(random.Random(3), 2)
+    python = ScoringAgent(engine="python")(state.model_copy(deep=True)).scorecard
+    auto = ScoringAgent()(state.model_copy(deep=True)).scorecard
+    assert {k: v.model_dump() for k, v in auto.items()} == {
+        k: v.model_dump() for k, v in python.items()
+    }
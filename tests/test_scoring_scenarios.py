@@ -0,0 +1,122 @@
+# [KO] what-if 시나리오 엔진: 기준/변경 시나리오가 ScoringAgent 재실행 결과와 동일한지 확인
+import random
+from datetime import datetime, timedelta, timezone
+
+import agents.scoring_agent as sa
+from agents.scoring_agent import ScoringAgent
+from agents.scoring_engine import AXES
+from agents.scoring_scenarios import (
+    Scenario,
+    baseline,
+    evaluate_scenarios,
+    load_scoring_inputs,
+    save_scoring_inputs,
+    scenario_grid,
+)
+from graph.state import CompanyMeta, Evidence, PipelineState
+
+
+def _state(n=60, seed=2):
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    companies, retrieved = [], {}
+    for i in range(n):
+        cid = f"c{i}"
+        companies.append(CompanyMeta(id=cid, name=f"Co {i}"))
+        retrieved[cid] = {
+            axis: [
+                Evidence(
+                    source=rng.choice(
+                        ["", "https://a.com/x", "https://b.io", "https://c.org/y", "https://d.ai"]
+                    ),
+                    text=f"{cid} {axis} {k}",
+                    category=axis,
+                    strength=rng.choice(["weak", "medium", "strong", "strong"]),
+                    published=rng.choice(
+                        [None, "bad"]
+                        + [(now - timedelta(days=rng.randint(0, 900))).isoformat()] * 4
+                    ),
+                )
+                for k in range(rng.choice([0, 2, 4, 9, 12]))
+            ]
+            for axis in AXES
+        }
+    return PipelineState(query="q", companies=companies, retrieved_evidence=retrieved)
+
+
+def _agent_cards(state):
+    return ScoringAgent(engine="python")(state.model_copy(deep=True)).scorecard
+
+
+def test_baseline_matches_scoring_agent():
+    state = _state()
+    cards = _agent_cards(state)
+    ids = [c.id for c in state.companies]
+    res = evaluate_scenarios(ScoringAgent()._axis_maps(state), [baseline()], ids)
+    assert res.totals[0].tolist() == [cards[c].total for c in ids]
+    assert ["invest" if x else "hold" for x in res.invest[0]] == [cards[c].decision for c in ids]
+    assert "invest" in {cards[c].decision for c in ids}
+
+
+def test_changed_weights_min_items_and_recency_match_rescoring(monkeypatch):
+    state = _state(seed=9)
+    ids = [c.id for c in state.companies]
+    weights = dict(sa.AXIS_WEIGHTS, ai_tech=35, risk=0)
+    min_items = dict(sa.MIN_ITEMS_FOR_AXIS, traction=4)
+    scen = Scenario("x", weights=weights, min_items=min_items, recency_months=6)
+    res = evaluate_scenarios(ScoringAgent()._axis_maps(state), [baseline(), scen], ids)
+
+    monkeypatch.setattr(sa, "AXIS_WEIGHTS", weights)
+    monkeypatch.setattr(sa, "MIN_ITEMS_FOR_AXIS", min_items)
+    monkeypatch.setattr(sa, "CONF_RECENCY_MONTHS", 6)
+    cards = _agent_cards(state)
+    assert res.totals[1].tolist() == [cards[c].total for c in ids]
+    for ci, cid in enumerate(ids):
+        mean_conf = sum(it.confidence for it in cards[cid].items) / len(cards[cid].items)
+        assert res.mean_conf[1, ci] == mean_conf
+    assert res.flips()[0] == 0
+
+
+def test_grid_and_snapshot_roundtrip(tmp_path):
+    grid = scenario_grid(
+        {"weights": {"ai_tech": [25, 30]}, "invest_total": [7.0, 7.5], "recency_months": [18]}
+    )
+    assert [s.name for s in grid] == [
+        "baseline",
+        "total>=7.0",
+        "ai_tech=30,total>=7.0",
+        "ai_tech=30",
+    ]
+
+    state = _state(n=5)
+    state.companies.append(CompanyMeta(id="fallback", name="Co 1"))  # 청크 폴백 회사
+    state.chunks = [Evidence(source="https://a.com/co-1", text="Co 1 grows", category="market")]
+    path = save_scoring_inputs(state, str(tmp_path / "ev.json"))
+    ids, axis_maps = load_scoring_inputs(path)
+    assert ids == [c.id for c in state.companies]
+    assert axis_maps == ScoringAgent()._axis_maps(state)
+    res = evaluate_scenarios(axis_maps, grid, ids)
+    assert res.invest.shape == (len(grid), len(ids))
+    res.write_csv(str(tmp_path / "m.csv"))
+    assert (tmp_path / "m.csv").read_text().splitlines()[0].startswith("company_id,invest_share")
+
+
+def test_inputs_from_stage_checkpoint(tmp_path):
+    import os
+
+    from agents.scoring_scenarios import latest_inputs
+    from graph.checkpoint import checkpoint_path, save_checkpoint
+
+    state = _state(n=4)
+    snapshot = save_scoring_inputs(state, str(tmp_path / "evidence" / "old.json"))
+    os.utime(snapshot, (1, 1))
+    ckpt = save_checkpoint(state, checkpoint_path(str(tmp_path / "ckpt" / "run_x"), "rag"), "rag")
+
+    assert latest_inputs(str(tmp_path / "evidence"), str(tmp_path / "ckpt")) == ckpt
+    assert load_scoring_inputs(ckpt) == load_scoring_inputs(snapshot)
+    assert latest_inputs(str(tmp_path / "none"), str(tmp_path / "none")) is None
+
+
+def test_baseline_gate_is_scoring_agent_gate():
+    b = baseline()
+    assert (b.invest_total, b.invest_conf) == (sa.INVEST_TOTAL, sa.INVEST_CONF)
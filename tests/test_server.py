@@ -0,0 +1,75 @@
+# [KO] 상주 서버: 워커별 warm 노드 재사용, /run /health /stats
+import json
+import threading
+import urllib.error
+import urllib.request
+
+from graph.server import PipelineService, make_server
+from graph.state import CompanyMeta, ScoreCard
+
+
+def _fake_factory(built):
+    def factory(keys):
+        built.append(threading.current_thread().name)
+
+        def seraph(state):
+            state.companies = [CompanyMeta(id="a", name="Alpha"), CompanyMeta(id="b", name="Beta")]
+            return state
+
+        def scoring(state):
+            for c in state.companies:  # stream 모드에서는 회사 1개짜리 하위 상태
+                state.scorecard[c.id] = ScoreCard(total=6.0 if c.id == "b" else 5.0)
+            return state
+
+        nodes = {k: (lambda s: s) for k in keys}
+        nodes.update(seraph=seraph, scoring=scoring)
+        return nodes
+
+    return factory
+
+
+def _call(base, path, body=None):
+    data = json.dumps(body).encode() if body is not None else None
+    req = urllib.request.Request(base + path, data=data, method="POST" if data else "GET")
+    try:
+        with urllib.request.urlopen(req, timeout=10) as r:
+            return r.status, json.loads(r.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_server_runs_queries_on_warm_workers():
+    built = []
+    service = PipelineService(workers=2, node_factory=_fake_factory(built))
+    service.warm(timeout=10)
+    assert len(built) == 2 and len(set(built)) == 2
+
+    server = make_server(service, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        assert _call(base, "/health")[0] == 200
+        for mode in ("batch", "stream", "batch"):
+            status, out = _call(base, "/run", {"query": "ai fintech", "mode": mode})
+            assert status == 200
+            assert [c["id"] for c in out["companies"]] == ["b", "a"]
+        assert _call(base, "/run", {"query": ""})[0] == 400
+        assert _call(base, "/run", {"query": "x", "mode": "nope"})[0] == 400
+        assert _call(base, "/run", {"query": "x", "mode": ["batch"]})[0] == 400
+        for body in ([], "x", 3):  # JSON 이지만 객체가 아님 → 400 (핸들러 스레드 유지)
+            assert _call(base, "/run", body)[0] == 400
+
+        stats = _call(base, "/stats")[1]
+        assert stats["queries"] == 3 and stats["running"] == 0
+        assert len(built) == 2  # 질의마다 노드(클라이언트)를 다시 만들지 않음
+
+        # fanout: 그래프는 첫 요청 때 1회 구성, 분기용 노드 세트는 이후 질의에서 재사용
+        status, out = _call(base, "/run", {"query": "ai fintech", "mode": "fanout"})
+        assert status == 200 and [c["id"] for c in out["companies"]] == ["b", "a"]
+        n_built = len(built)
+        assert _call(base, "/run", {"query": "ai fintech", "mode": "fanout"})[0] == 200
+        assert len(built) == n_built
+    finally:
+        server.shutdown()
+        server.server_close()
+        service.close()
@@ -0,0 +1,67 @@
+# [KO] streaming 모드: 회사별 하위 상태가 단계를 거쳐 공유 상태로 병합되는지 확인
+from graph.state import CompanyMeta, Evidence, PipelineState, ScoreCard
+from graph.stream import run_streaming
+
+
+def _augment(s):
+    c = s.companies[0]
+    s.companies = [c.model_copy(update={"region": "KR"})]
+    s.chunks.append(Evidence(source=f"https://{c.id}.ai", text=c.name, category="market"))
+    return s
+
+
+def _rag(s):
+    s.retrieved_evidence[s.companies[0].id] = {"market": list(s.chunks)}
+    return s
+
+
+def _scoring(s):
+    cid = s.companies[0].id
+    s.scorecard[cid] = ScoreCard(total=8.0 if cid == "a" else 1.0, decision="hold")
+    return s
+
+
+def _report(s):
+    cid = s.companies[0].id
+    if cid == "b":
+        raise RuntimeError("render failed")  # 실패해도 스트림은 계속
+    s.reports[cid] = f"outputs/reports/{cid}.pdf"
+    return s
+
+
+def test_streaming_merges_per_company_results():
+    nodes = {"augment": _augment, "rag": _rag, "scoring": _scoring, "report": _report}
+    state = PipelineState(
+        query="q",
+        companies=[CompanyMeta(id=x, name=x.upper()) for x in ("a", "b", "c")],
+    )
+    seen = []
+    out = run_streaming(state, nodes, queue_size=1, on_progress=lambda st, _s: seen.append(st))
+
+    assert [c.id for c in out.companies] == ["a", "b", "c"]
+    assert all(c.region == "KR" for c in out.companies)
+    assert len(out.chunks) == 3
+    assert set(out.retrieved_evidence) == {"a", "b", "c"}
+    assert out.scorecard["a"].total == 8.0
+    assert set(out.reports) == {"a", "c"}
+    assert len(seen) == 12
+
+
+def test_streaming_writes_per_stage_checkpoints(tmp_path):
+    from graph.checkpoint import load_checkpoint
+
+    nodes = {"augment": _augment, "rag": _rag, "scoring": _scoring, "report": _report}
+    state = PipelineState(
+        query="q",
+        companies=[CompanyMeta(id=x, name=x.upper()) for x in ("a", "b", "c")],
+    )
+    out = run_streaming(state, nodes, queue_size=1, checkpoint_dir=str(tmp_path))
+
+    saved = {k: load_checkpoint(str(tmp_path / f"{k}.ckpt")) for k in nodes}
+    assert {k: meta["stage"] for k, (_, meta) in saved.items()} == {k: k for k in nodes}
+    augment, rag, scoring, report = (saved[k][0] for k in nodes)
+    assert len(augment.chunks) == 3 and not augment.retrieved_evidence
+    assert all(c.region == "KR" for c in augment.companies)
+    assert set(rag.retrieved_evidence) == {"a", "b", "c"} and not rag.scorecard
+    assert set(scoring.scorecard) == {"a", "b", "c"} and not scoring.reports
+    assert report.model_dump() == out.model_dump()
@@ -0,0 +1,35 @@
+# [KO] 공유 Jinja Environment + 바이트코드 캐시
+import os
+
+from agents import template_render
+from agents.template_render import TemplateRenderer, get_environment
+
+
+def test_bytecode_cache_written_and_env_shared(tmp_path):
+    tpl = tmp_path / "tpl"
+    tpl.mkdir()
+    (tpl / "r.html.j2").write_text("{{ a }}-{{ b|default('x') }}", encoding="utf-8")
+    bc = tmp_path / "bc"
+
+    r1 = TemplateRenderer(str(tpl), "r.html.j2", str(bc))
+    assert r1.render(a=1) == "1-x"
+    assert any(bc.iterdir())  # 생성 시점에 컴파일 → 캐시 기록
+    assert TemplateRenderer(str(tpl), "r.html.j2", str(bc)).env is r1.env
+
+    # 새 프로세스처럼 메모리 Environment를 비워도 디스크 캐시로 동일하게 렌더
+    template_render._envs.clear()
+    assert get_environment(str(tpl), str(bc)) is not r1.env
+    assert TemplateRenderer(str(tpl), "r.html.j2", str(bc)).render(a=2, b=3) == "2-3"
+
+
+def test_template_edit_is_picked_up(tmp_path):
+    tpl = tmp_path / "tpl"
+    tpl.mkdir()
+    path = tpl / "r.html.j2"
+    path.write_text("v1 {{ a }}", encoding="utf-8")
+    r = TemplateRenderer(str(tpl), "r.html.j2", str(tmp_path / "bc"))
+    assert r.render(a=1) == "v1 1"
+
+    path.write_text("v2 {{ a }}", encoding="utf-8")
+    os.utime(path, (path.stat().st_mtime + 5,) * 2)
+    assert r.render(a=1) == "v2 1"
@@ -0,0 +1,66 @@
+# [KO] 근사 중복 제거: 기존 SequenceMatcher 전수 비교와 결과 동일성
+import random
+from difflib import SequenceMatcher
+
+from agents.report_writer_agent import _dedupe_list
+from agents.text_dedupe import NearDuplicateIndex, dedupe_texts
+
+
+def _reference(items, thresh=0.88):
+    out = []
+    for s in items or []:
+        s = (s or "").strip()
+        if s and all(SequenceMatcher(None, s, t).ratio() < thresh for t in out):
+            out.append(s)
+    return out
+
+
+def _mutate(rng, s):
+    chars = list(s)
+    for _ in range(rng.randint(0, 4)):
+        op = rng.random()
+        i = rng.randrange(len(chars) + 1)
+        if op < 0.4:
+            chars.insert(i, rng.choice("가나다라마 abcxyz"))
+        elif op < 0.8 and chars:
+            chars.pop(min(i, len(chars) - 1))
+        elif chars:
+            chars[min(i, len(chars) - 1)] = rng.choice("바사아자 klm")
+    return "".join(chars)
+
+
+def test_matches_reference_on_random_near_duplicates():
+    rng = random.Random(7)
+    words = [
+        "금융",
+        "AI",
+        "상담",
+        "자동화",
+        "규제",
+        "리스크",
+        "보안",
+        "온프렘",
+        "PoC",
+        "ARR",
+        "확장",
+    ]
+    for thresh in (0.5, 0.88, 0.95):
+        for _ in range(30):
+            base = [
+                " ".join(rng.choice(words) for _ in range(rng.randint(1, 12)))
+                for _ in range(rng.randint(1, 15))
+            ]
+            items = base + [_mutate(rng, rng.choice(base)) for _ in range(20)] + ["", "  ", None]
+            rng.shuffle(items)
+            assert dedupe_texts(items, thresh) == _reference(items, thresh)
+
+
+def test_report_helper_and_index_stats():
+    items = ["도메인 특화 AI 역량 보유", "도메인 특화 AI 역량을 보유", "규제 리스크 존재"]
+    assert _dedupe_list(items) == _reference(items)
+
+    index = NearDuplicateIndex(0.88)
+    for s in ["a" * 10, "b" * 40, "a" * 10 + "c"]:
+        index.add(s)
+    assert index.items == ["a" * 10, "b" * 40]
+    assert index.full_compares == 1  # 길이가 먼 "b"*40 은 ratio 계산 없이 제외
@@ -0,0 +1,133 @@
+# [KO] trusted_evidence/trusted_score_item: 검증 생성자와 동일한 결과, 잘못된 값은 기존처럼 거부
+import pytest
+from pydantic import ValidationError
+
+from agents.augment_agent import AugmentAgent
+from graph.state import (
+    CompanyMeta,
+    Evidence,
+    PipelineState,
+    ScoreCard,
+    ScoreItem,
+    trusted_evidence,
+    trusted_score_card,
+    trusted_score_item,
+)
+
+
+def test_trusted_evidence_matches_validated():
+    for pub in (None, "2025-07-14"):
+        fast = trusted_evidence("https://a.com/x", "text", "moat", "strong", pub)
+        ref = Evidence(
+            source="https://a.com/x", text="text", category="moat", strength="strong", published=pub
+        )
+        assert fast == ref
+        assert fast.model_dump_json() == ref.model_dump_json()
+        assert fast.model_fields_set == ref.model_fields_set
+    state = PipelineState(query="q", chunks=[fast])
+    assert PipelineState.model_validate_json(state.model_dump_json()).chunks == [fast]
+
+
+def test_trusted_evidence_mutation_does_not_leak():
+    a = trusted_evidence("s", "t", "team")
+    b = trusted_evidence("s", "t", "team")
+    a.text = "changed"
+    c = b.model_copy(update={"strength": "medium"})
+    assert (a.text, b.text, b.strength, c.strength) == ("changed", "t", "weak", "medium")
+    assert b.model_fields_set == set(Evidence.model_fields)
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ("s", "t", "bogus", "weak", None),
+        ("s", "t", "team", "huge", None),
+        (None, "t", "team", "weak", None),
+        ("s", "t", "team", "weak", 20250101),
+    ],
+)
+def test_trusted_evidence_rejects_invalid(args):
+    with pytest.raises(ValidationError):
+        trusted_evidence(*args)
+
+
+def test_trusted_score_item():
+    evs = [trusted_evidence("s", "t", "risk")]
+    item = trusted_score_item("risk", 4.25, 0.5, "1 evidences", evs)
+    assert item == ScoreItem(
+        key="risk", value=4.25, confidence=0.5, notes="1 evidences", evidence=evs
+    )
+    assert item.evidence is not evs  # 검증 생성자처럼 리스트는 복사
+    with pytest.raises(ValidationError):
+        trusted_score_item("risk", 10.5, 0.5, "", evs)
+    assert trusted_score_item("risk", 3, 1, "", evs).value == 3.0  # 비 float 은 검증 경로로 변환
+
+
+def _trusted_and_validated():
+    evs = [trusted_evidence("s", "t", "risk", "strong", "2025-01-01")]
+    ref_evs = [
+        Evidence(source="s", text="t", category="risk", strength="strong", published="2025-01-01")
+    ]
+    item = trusted_score_item("risk", 4.25, 0.5, "n", evs)
+    ref_item = ScoreItem(key="risk", value=4.25, confidence=0.5, notes="n", evidence=ref_evs)
+    card = trusted_score_card([item], 4.25, "hold")
+    ref_card = ScoreCard(items=[ref_item], total=4.25, decision="hold")
+    return [(evs[0], ref_evs[0]), (item, ref_item), (card, ref_card)]
+
+
+def test_trusted_instances_round_trip_like_validated():
+    for fast, ref in _trusted_and_validated():
+        cls = type(ref)
+        assert type(fast) is cls
+        assert fast.model_dump() == ref.model_dump()
+        assert fast.model_dump(mode="json") == ref.model_dump(mode="json")
+        assert fast.model_dump(exclude_unset=True) == ref.model_dump(exclude_unset=True)
+        assert fast.model_fields_set == ref.model_fields_set == set(cls.model_fields)
+        assert cls.model_validate(fast.model_dump()) == ref
+        assert cls.model_validate_json(fast.model_dump_json()) == ref
+        assert fast.model_copy(deep=True) == ref
+
+
+def test_trusted_fields_set_is_per_instance():
+    a = trusted_evidence("s", "t", "team")
+    b = trusted_evidence("s", "t", "team")
+    assert a.model_fields_set is not b.model_fields_set
+    a.model_fields_set.discard("published")
+    assert "published" in b.model_fields_set
+    assert trusted_evidence("s", "t", "team").model_fields_set == set(Evidence.model_fields)
+
+
+def test_trusted_card_rejects_invalid():
+    item = trusted_score_item("risk", 1.0, 0.5, "", [])
+    with pytest.raises(ValidationError):
+        trusted_score_card([item], 11.0, "hold")
+    with pytest.raises(ValidationError):
+        trusted_score_card([item], 1.0, "maybe")
+
+
+def test_falls_back_to_validation_when_internals_differ(monkeypatch):
+    from graph import state
+
+    assert state._TRUSTED_OK  # 현재 pydantic 에서는 고속 경로 사용
+    monkeypatch.setattr(state, "_TRUSTED_OK", False)
+    for fast, ref in _trusted_and_validated():
+        assert fast == ref
+        assert fast.model_fields_set == ref.model_fields_set
+
+
+def test_fill_company_meta_only_replaces_on_change():
+    agent = AugmentAgent.__new__(AugmentAgent)
+    company = CompanyMeta(id="c1", name="C1", founded_year=2019)
+    agent._state_ref = PipelineState(query="q", companies=[company])
+
+    agent._maybe_fill_company_meta("c1", "<html><body>no metadata</body></html>")
+    assert agent._state_ref.companies[0] is company
+
+    html = (
+        '<script type="application/ld+json">'
+        '{"@type": "Organization", "foundingDate": "2001", "numberOfEmployees": 42}</script>'
+    )
+    agent._maybe_fill_company_meta("c1", html)
+    updated = agent._state_ref.companies[0]
+    assert updated.founded_year == 2019  # 기존 값은 유지
+    assert updated.headcount == 42